@@ -0,0 +1,116 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at http://oss.oracle.com/licenses/upl.
+
+Benchmark for SQL result encoding (execute_sql_tool_by_connection_id output_format)
+- Builds a synthetic result set (default 100,000 rows) with the cell types MySQL returns most often:
+  int, str, Decimal, datetime, date, float and NULL
+- Times the legacy row encoding (json.dumps with CustomJSONEncoder) against the "columnar" and
+  "column_major" formats encoded by dumps_compact, with orjson and with the json module fallback,
+  and reports the encoded size of each
+Usage (from the mysql-mcp-server directory):
+  python bench_result_encoding.py [--rows N] [--iterations N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+from oracle.mysql_mcp_server import utils
+
+COLUMNS = ["id", "name", "amount", "created_at", "day", "ratio", "note"]
+TYPES = ["LONGLONG", "VAR_STRING", "NEWDECIMAL", "DATETIME", "DATE", "DOUBLE", "VAR_STRING"]
+
+
+def synthetic_rows(n: int, seed: int = 7) -> list[tuple]:
+    """Row tuples shaped like a cursor.fetchall() result for COLUMNS."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    rows = []
+    for i in range(n):
+        created = start + timedelta(seconds=rng.randrange(0, 365 * 86400))
+        rows.append(
+            (
+                i + 1,
+                f"customer-{rng.randrange(100000):05d}",
+                Decimal(rng.randrange(0, 10_000_000)) / 100,
+                created,
+                date(created.year, created.month, created.day),
+                rng.random(),
+                None if rng.random() < 0.7 else f"note {rng.randrange(1000)}",
+            )
+        )
+    return rows
+
+
+def _time(fn: Callable[[], str], iterations: int) -> dict[str, Any]:
+    timings = []
+    out = ""
+    for _ in range(iterations):
+        start = time.perf_counter()
+        out = fn()
+        timings.append(time.perf_counter() - start)
+    return {
+        "p50_ms": round(statistics.median(timings) * 1000, 1),
+        "min_ms": round(min(timings) * 1000, 1),
+        "bytes": len(out.encode("utf-8")),
+    }
+
+
+def _without_orjson(fn: Callable[[], str]) -> Callable[[], str]:
+    def run() -> str:
+        saved, utils.orjson = utils.orjson, None
+        try:
+            return fn()
+        finally:
+            utils.orjson = saved
+
+    return run
+
+
+def bench_encoding(n_rows: int = 100000, iterations: int = 5) -> dict[str, Any]:
+    """Encode the same result set in every output format and report time and size."""
+    rows = synthetic_rows(n_rows)
+
+    cases: dict[str, Callable[[], str]] = {
+        "rows (json, CustomJSONEncoder)": lambda: json.dumps(rows, cls=utils.CustomJSONEncoder),
+    }
+    for output_format in ("columnar", "column_major"):
+        def encode(output_format: str = output_format) -> str:
+            return utils.dumps_compact(utils.format_result(COLUMNS, TYPES, rows, output_format))
+
+        cases[f"{output_format} (json compact)"] = _without_orjson(encode)
+        if utils.orjson is not None:
+            cases[f"{output_format} (orjson)"] = encode
+
+    results = {name: _time(fn, iterations) for name, fn in cases.items()}
+    baseline = results["rows (json, CustomJSONEncoder)"]
+    for result in results.values():
+        result["speedup"] = round(baseline["p50_ms"] / max(result["p50_ms"], 0.001), 2)
+        result["size_ratio"] = round(result["bytes"] / baseline["bytes"], 3)
+
+    return {
+        "rows": n_rows,
+        "iterations": iterations,
+        "orjson": getattr(utils.orjson, "__version__", None),
+        "results": results,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark SQL result encoding")
+    ap.add_argument("--rows", type=int, default=100000, help="synthetic result set size")
+    ap.add_argument("--iterations", type=int, default=5, help="runs per encoding")
+    args = ap.parse_args()
+    print(json.dumps(bench_encoding(args.rows, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,4 +6,32 @@ https://oss.oracle.com/licenses/upl.
 
 MIN_CONTEXT_SIZE = 10
 DEFAULT_CONTEXT_SIZE = 20
-MAX_CONTEXT_SIZE = 100
\ No newline at end of file
+MAX_CONTEXT_SIZE = 100
+# list_all_connections: seconds before a connection check is reported as timed out,
+# seconds a check result is reused, and how many checks run at once
+CONNECTION_PROBE_TIMEOUT = 10
+CONNECTION_PROBE_TTL = 30
+CONNECTION_PROBE_MAX_WORKERS = 16
+
+# execute_sql_tool_by_connection_id: rows per page when paging with keyset_column and no
+# max_rows, and rows fetched per round trip when streaming a limited result
+DEFAULT_PAGE_ROWS = 1000
+FETCH_BATCH_SIZE = 500
+
+# Seconds the Object Storage namespace and compartment tree are cached for
+OCI_CACHE_TTL = 300
+
+# list_all_compartments: Object Storage access checks run at once, and seconds the report is reused
+COMPARTMENT_VERIFY_MAX_WORKERS = 8
+COMPARTMENT_REPORT_TTL = 120
+
+# ragify_column chunked mode: progress table (created in the target schema) and the most
+# chunks embedded at once, each on its own connection
+RAGIFY_CHECKPOINT_TABLE = "mcp_ragify_checkpoint"
+RAGIFY_MAX_PARALLELISM = 8
+
+# retrieve_relevant_schema_local: seconds a schema catalog is used before its DDL fingerprint is rechecked
+SCHEMA_CATALOG_CHECK_INTERVAL = 10
+
+# bulk_load: rows inserted (and committed) per executemany batch by default
+BULK_LOAD_BATCH_SIZE = 1000
@@ -3,9 +3,15 @@ Copyright (c) 2025, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at http://oss.oracle.com/licenses/upl.
 """
 
+import base64
+import concurrent.futures
 import contextlib
+import hashlib
 import json
+import os
 import re
+import threading
+import time
 from typing import Optional, Union
 
 import oci
@@ -13,14 +19,44 @@ from fastmcp import FastMCP
 from mysql import connector
 from mysql.connector.abstracts import MySQLConnectionAbstract
 from oracle.mysql_mcp_server.utils import (
+    BULK_LOAD_FORMATS,
+    OUTPUT_FORMATS,
+    ConnectionPool,
+    CustomJSONEncoder,
     DatabaseConnectionError,
     Mode,
+    OciCache,
     OciInfo,
+    PooledConnection,
+    ResultCache,
+    SchemaCatalog,
+    SshTunnel,
+    column_types,
+    dumps_compact,
+    format_result,
     get_ssh_command,
+    is_read_only_sql,
     load_mysql_config,
+    open_bulk_file,
 )
 
-from oracle.mysql_mcp_server.consts import MIN_CONTEXT_SIZE, DEFAULT_CONTEXT_SIZE, MAX_CONTEXT_SIZE
+from oracle.mysql_mcp_server.consts import (
+    BULK_LOAD_BATCH_SIZE,
+    COMPARTMENT_REPORT_TTL,
+    COMPARTMENT_VERIFY_MAX_WORKERS,
+    CONNECTION_PROBE_MAX_WORKERS,
+    CONNECTION_PROBE_TIMEOUT,
+    CONNECTION_PROBE_TTL,
+    DEFAULT_CONTEXT_SIZE,
+    DEFAULT_PAGE_ROWS,
+    FETCH_BATCH_SIZE,
+    MAX_CONTEXT_SIZE,
+    MIN_CONTEXT_SIZE,
+    OCI_CACHE_TTL,
+    RAGIFY_CHECKPOINT_TABLE,
+    RAGIFY_MAX_PARALLELISM,
+    SCHEMA_CATALOG_CHECK_INTERVAL,
+)
 
 ###############################################################
 # Start setup
@@ -53,6 +89,33 @@ except Exception as e:
         }
     )
 
+# Connection pools keyed by connection_id; only used when the config has a "pool" block
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+# Provider Mode per connection_id, filled lazily by _get_mode
+_modes: dict[str, Mode] = {}
+_modes_lock = threading.Lock()
+
+# Recent list_all_connections results per connection_id: (time.monotonic() of the check, entry)
+_probe_cache: dict[str, tuple[float, dict]] = {}
+_probe_cache_lock = threading.Lock()
+
+# Read-only query results of execute_sql_tool_by_connection_id; only kept when the config has a "result_cache" block
+_result_cache: Optional[ResultCache] = (
+    ResultCache(**config["result_cache"]) if config is not None and config.get("result_cache") else None
+)
+
+# Schema catalog of each connection's default schema: (time.monotonic() of the last DDL check, catalog)
+_schema_catalogs: dict[str, tuple[float, SchemaCatalog]] = {}
+_schema_catalogs_lock = threading.Lock()
+
+# SSH tunnel run by the server when the bastion block sets "managed": true; started by main()
+_ssh_tunnel: Optional[SshTunnel] = None
+
+# Namespace and compartment tree for oci_info, shared by the Object Storage tools
+oci_cache = OciCache(ttl=OCI_CACHE_TTL)
+
 # Create mcp server
 mcp = FastMCP("MySQL")
 
@@ -81,17 +144,33 @@ def _validate_name(name: str) -> str:
     return name
 
 
-def _get_mode(connection_id: str) -> Mode:
+def _get_mode(connection_id: str, connection: Optional[MySQLConnectionAbstract] = None) -> Mode:
     """
     Resolve the current provider Mode for a given connection.
 
+    The provider does not change while the server is running, so the result is cached per
+    connection_id until _invalidate_mode is called (done automatically on connection errors).
+
+    Args:
+        connection_id (str): MySQL connection key.
+        connection (MySQLConnectionAbstract, optional): An already-open connection for connection_id
+            to run the lookup on instead of opening another one.
+
     Raises:
         Exception: If the provider cannot be fetched or the value is unrecognized.
 
     Returns:
         Mode: The resolved provider mode.
     """
-    provider_result = _execute_sql_tool(connection_id, "SELECT @@rapid_cloud_provider;")
+    with _modes_lock:
+        mode = _modes.get(connection_id)
+    if mode is not None:
+        return mode
+
+    provider_result = _execute_sql_tool(
+        connection if connection is not None else connection_id,
+        "SELECT @@rapid_cloud_provider;",
+    )
     if check_error(provider_result):
         raise Exception(
             f"Exception occurred while fetching cloud provider {str(provider_result)}"
@@ -99,7 +178,16 @@ def _get_mode(connection_id: str) -> Mode:
 
     provider = fetch_one(provider_result)
 
-    return Mode.from_string(provider)
+    mode = Mode.from_string(provider)
+    with _modes_lock:
+        _modes[connection_id] = mode
+    return mode
+
+
+def _invalidate_mode(connection_id: str) -> None:
+    """Forget the cached provider Mode for a connection, e.g. after it failed or was re-pointed."""
+    with _modes_lock:
+        _modes.pop(connection_id, None)
 
 
 def get_error(json_str: Optional[str]) -> Optional[str]:
@@ -158,24 +246,29 @@ def fetch_one(json_str: str) -> str:
 
 
 @contextlib.contextmanager
-def _get_database_connection_cm(connection_id: str):
+def _get_database_connection_cm(connection_id: str, **connect_args):
     """
     Context manager for a MySQLConnection using configuration from load_mysql_config().
 
+    Args:
+        connection_id (str): MySQL connection key.
+        **connect_args: Extra connector.connect arguments (e.g. allow_local_infile_in_path). A connection
+            opened with them is never taken from or returned to a pool.
+
     Yields:
-        mysql.connector.MySQLConnection: An active connection, automatically closed after the block.
+        mysql.connector.MySQLConnection: An active connection, automatically closed (or returned to its pool) after the block.
 
     Raises:
         DatabaseConnectionError: If the connection could not be established or connection_id is invalid.
     """
-    conn = _get_db_connection(connection_id)
+    conn = _get_db_connection(connection_id, **connect_args)
     try:
         yield conn
     finally:
         conn.close()
 
 
-def _get_db_connection(connection_id: str) -> MySQLConnectionAbstract:
+def _get_db_connection(connection_id: str, **connect_args) -> MySQLConnectionAbstract:
     if config_error_msg is not None:
         raise DatabaseConnectionError("Configuration file is not loaded")
 
@@ -190,8 +283,18 @@ def _get_db_connection(connection_id: str) -> MySQLConnectionAbstract:
         raise DatabaseConnectionError("Database must be specified in config.")
 
     try:
-        conn = connector.connect(**connection_info)
+        if _ssh_tunnel is not None:
+            # Wait for (or join) a reconnect of the tunnel instead of connecting into a dead port
+            _ssh_tunnel.ensure_connected()
+        pool_config = config.get("pool")
+        if pool_config is None or connect_args:
+            conn = connector.connect(**{**connection_info, **connect_args})
+        else:
+            conn = _get_pool(connection_id, connection_info, pool_config).acquire()
+    except DatabaseConnectionError:
+        raise
     except Exception as e:
+        _invalidate_mode(connection_id)
         raise DatabaseConnectionError(
             f"Connection failed with error: {e}. "
             "Request assistance from a database administrator, or use list_all_connections() to find a different database connection."
@@ -200,24 +303,109 @@ def _get_db_connection(connection_id: str) -> MySQLConnectionAbstract:
     return conn
 
 
+def _get_pool(connection_id: str, connection_info: dict, pool_config: dict) -> ConnectionPool:
+    """
+    Return the connection pool for a connection_id, creating it on first use.
+
+    Connections are opened lazily, so an unreachable server does not fail until it is used.
+    """
+    with _pools_lock:
+        pool = _pools.get(connection_id)
+        if pool is None:
+            pool = ConnectionPool(
+                lambda: connector.connect(**connection_info),
+                pool_size=pool_config["pool_size"],
+                pool_timeout=pool_config["pool_timeout"],
+                reset_session=pool_config["reset_session"],
+            )
+            _pools[connection_id] = pool
+        return pool
+
+
+def _connection_hint() -> str:
+    """What to check when a connection fails: the managed SSH tunnel, or the ssh command to start one."""
+    if _ssh_tunnel is not None:
+        status = _ssh_tunnel.status()
+        if status["active"]:
+            return f"The SSH tunnel to {status['bastion']} is up; check the database at {status['remote']}."
+        return f"The SSH tunnel to {status['bastion']} is down and being retried: {status['last_error']}"
+    return f"Bastion/jump host may be down. Try starting it with {get_ssh_command(config)}"
+
+
+def _on_ssh_tunnel_reconnect() -> None:
+    """Drop idle pooled connections and connection checks that went through the previous SSH transport."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
+    with _probe_cache_lock:
+        _probe_cache.clear()
+
+
+def _start_ssh_tunnel() -> None:
+    """Start the in-process SSH tunnel if the bastion block asks for a managed one."""
+    global _ssh_tunnel
+    if config is None or not config.get("bastion", {}).get("managed", False):
+        return
+    tunnel = SshTunnel(config["bastion"], on_reconnect=_on_ssh_tunnel_reconnect)
+    tunnel.start()
+    _ssh_tunnel = tunnel
+
+
+def _probe_connection(connection_id: str, started: Optional[dict] = None) -> dict:
+    """
+    Open a connection for connection_id and resolve its Mode, timing the whole check.
+
+    The connection bypasses the pool so that connector.connect gives up after CONNECTION_PROBE_TIMEOUT.
+
+    Args:
+        connection_id (str): MySQL connection key.
+        started (dict, optional): Receives the time.perf_counter() start of the check under connection_id.
+
+    Returns:
+        dict: {"key", "mode", "latency_ms"} on success, or {"key", "error", "hint", "latency_ms"}.
+    """
+    start = time.perf_counter()
+    if started is not None:
+        started[connection_id] = start
+    try:
+        with _get_database_connection_cm(
+            connection_id, connection_timeout=CONNECTION_PROBE_TIMEOUT
+        ) as db_connection:
+            entry = {"key": connection_id, "mode": _get_mode(connection_id, db_connection).value}
+    except Exception as e:
+        entry = {
+            "key": connection_id,
+            "error": str(e),
+            "hint": _connection_hint(),
+        }
+    entry["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return entry
+
+
 @mcp.tool()
-def list_all_connections() -> str:
+def list_all_connections(refresh: bool = False) -> str:
     """
     [MCP Tool] List configured connection keys, validate connectivity, and report mode.
 
     Args:
-        None
+        refresh (bool, optional): Re-check every connection even if a recent result is cached. Default False.
 
     Returns:
         str: JSON-encoded object:
             {
-              "valid keys": [{"key": string, "mode": "MYSQL_AI" | "OCI"}],
-              "invalid keys": [{"key": string, "error": string, "hint": string}]
+              "valid keys": [{"key": string, "mode": "MYSQL_AI" | "OCI", "latency_ms": number}],
+              "invalid keys": [{"key": string, "error": string, "hint": string, "latency_ms": number | null}]
             }
 
     Notes:
         - Attempts to open a connection for each configured key and records success/failure.
         - For valid connections, also resolves the provider Mode via _get_mode.
+        - Connections are checked concurrently; a check still running CONNECTION_PROBE_TIMEOUT
+          seconds after it started is reported as invalid with its elapsed latency.
+        - A check that never started, because every worker was held by a timed-out check, is reported
+          as invalid with a null latency and is not cached.
+        - Results are reused for CONNECTION_PROBE_TTL seconds unless refresh is True.
 
     MCP usage example:
         - name: list_all_connections
@@ -226,27 +414,106 @@ def list_all_connections() -> str:
     if config_error_msg is not None:
         return config_error_msg
 
-    valid_keys, invalid_keys = [], []
-    for connection_id in config["server_infos"].keys():
-        try:
-            with _get_database_connection_cm(connection_id):
-                valid_keys.append(
-                    {"key": connection_id, "mode": _get_mode(connection_id).value}
-                )
-        except Exception as e:
-            invalid_keys.append(
-                {
+    connection_ids = list(config["server_infos"].keys())
+    entries, stale = {}, []
+    now = time.monotonic()
+    with _probe_cache_lock:
+        for connection_id in connection_ids:
+            cached = _probe_cache.get(connection_id)
+            if not refresh and cached is not None and now - cached[0] < CONNECTION_PROBE_TTL:
+                entries[connection_id] = cached[1]
+            else:
+                stale.append(connection_id)
+
+    if stale:
+        workers = min(len(stale), CONNECTION_PROBE_MAX_WORKERS)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        started = {}
+        futures = {
+            executor.submit(_probe_connection, connection_id, started): connection_id
+            for connection_id in stale
+        }
+        pending = set(futures)
+        while pending:
+            now = time.perf_counter()
+            running = [future for future in pending if futures[future] in started]
+            deadlines = [
+                started[futures[future]] + CONNECTION_PROBE_TIMEOUT
+                for future in running
+                if started[futures[future]] + CONNECTION_PROBE_TIMEOUT > now
+            ]
+            # Stop once no check is within its timeout and no worker is free to start a queued one
+            if not deadlines and len(running) in (len(pending), workers):
+                break
+            # Without a running deadline, a freed worker is about to start a queued check
+            timeout = min(deadlines) - now if deadlines else 0.01
+            _, pending = concurrent.futures.wait(
+                pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+        # Do not wait for hung checks; their threads finish on their own
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        now = time.perf_counter()
+        for future, connection_id in futures.items():
+            if future.done() and not future.cancelled():
+                entry = future.result()
+            elif connection_id in started:
+                entry = {
                     "key": connection_id,
-                    "error": str(e),
-                    "hint": f"Bastion/jump host may be down. Try starting it with {get_ssh_command(config)}",
+                    "error": f"Connection check timed out after {CONNECTION_PROBE_TIMEOUT}s",
+                    "hint": _connection_hint(),
+                    "latency_ms": round((now - started[connection_id]) * 1000, 1),
                 }
-            )
+            else:
+                entries[connection_id] = {
+                    "key": connection_id,
+                    "error": "Connection check not started; every check worker was held by a timed-out check",
+                    "hint": _connection_hint(),
+                    "latency_ms": None,
+                }
+                continue
+            entries[connection_id] = entry
+            with _probe_cache_lock:
+                _probe_cache[connection_id] = (time.monotonic(), entry)
+
+    valid_keys, invalid_keys = [], []
+    for connection_id in connection_ids:
+        entry = entries[connection_id]
+        (invalid_keys if "error" in entry else valid_keys).append(entry)
     return json.dumps({"valid keys": valid_keys, "invalid keys": invalid_keys})
 
 
+@mcp.tool()
+def ssh_tunnel_status() -> str:
+    """
+    [MCP Tool] Report the state of the SSH tunnel the server runs to the bastion host.
+
+    Returns:
+        str: JSON object {"active": bool, "bastion": "user@host:port", "local_bind": "host:port",
+             "remote": "db_host:db_port", "open_channels": int, "reconnects": int, "last_error": string | null},
+             or {"error": ...} when the bastion block does not set "managed": true.
+    """
+    if _ssh_tunnel is None:
+        return json.dumps(
+            {
+                "error": "The server does not manage an SSH tunnel. Set \"managed\": true in the bastion config "
+                f"block, or start one yourself with {get_ssh_command(config) if config else None}"
+            }
+        )
+    return json.dumps(_ssh_tunnel.status())
+
+
 @mcp.tool()
 def execute_sql_tool_by_connection_id(
-    connection_id: str, sql_script: str, params: list = None
+    connection_id: str,
+    sql_script: str,
+    params: list = None,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    keyset_column: Optional[str] = None,
+    continuation: Optional[str] = None,
+    output_format: str = "rows",
+    use_cache: bool = True,
 ) -> str:
     """
     Execute a SQL script on the specified database connection.
@@ -255,34 +522,280 @@ def execute_sql_tool_by_connection_id(
         connection_id (str): The key identifying the database connection to use.
         sql_script (str): The SQL statement to execute. Can be a query or a DML/DDL statement.
         params (list, optional): List of parameters to use for parameterized SQL scripts. If None, executes with no bind variables.
+        max_rows (int, optional): Stop after this many rows instead of reading the whole result.
+        max_bytes (int, optional): Stop before the JSON-encoded rows would exceed this many bytes.
+        keyset_column (str, optional): Unique column in the select list to page on. The query is wrapped as
+            SELECT * FROM (<sql_script>) ORDER BY keyset_column LIMIT ..., so only one page is read from the server.
+        continuation (str, optional): Token from a previous truncated page to fetch the next page.
+            Pass it with the same sql_script, params, and keyset_column.
+        output_format (str, optional): "rows" (default) for a list of row arrays; "columnar" for
+            {"columns": [...], "types": [...], "rows": [[...]]}; "column_major" for
+            {"columns": [...], "types": [...], "data": [[values of each column]]}. The last two are encoded as
+            compact JSON and need a script with a single result set.
+        use_cache (bool, optional): When the server has a result_cache configured, reuse a recent identical
+            result of a read-only statement (SELECT/SHOW/DESCRIBE without NOW(), RAND(), @variables, ...).
+            Pass False to always read fresh data. Any other statement clears the connection's cached results.
 
     Returns:
-        str: JSON-encoded result of the query—if rows are returned, their content as a list; otherwise, null.
+        str: Without any of max_rows, max_bytes, keyset_column or continuation: JSON-encoded result of the
+            query in output_format—for "rows", their content as a list if rows are returned; otherwise, null.
+            With them: JSON object
+            {"rows": [...], "row_count": int, "truncated": bool, "truncated_by": "max_rows" | "max_bytes" | null,
+             "continuation": string | null}, plus "columns" and "types" for the columnar formats ("data" replaces
+            "rows" for column_major); continuation is only set when paging with keyset_column.
             In case of error, returns a JSON object with fields: "error", "sql_script", and "params".
 
     Example:
         result = execute_sql_tool_by_connection_id("my_conn", "SELECT * FROM users WHERE id = %s", [42])
+        page = execute_sql_tool_by_connection_id("my_conn", "SELECT id, name FROM users", max_rows=500, keyset_column="id")
     """
-    return _execute_sql_tool(connection_id, sql_script, params=params)
+    cache_key = None
+    read_only = _result_cache is not None and is_read_only_sql(sql_script)
+    if read_only and use_cache:
+        cache_key = (
+            connection_id,
+            sql_script,
+            json.dumps(params, cls=CustomJSONEncoder),
+            max_rows,
+            max_bytes,
+            keyset_column,
+            continuation,
+            output_format,
+        )
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
+    if max_rows is None and max_bytes is None and keyset_column is None and continuation is None:
+        if output_format == "rows":
+            result = _execute_sql_tool(connection_id, sql_script, params=params)
+        else:
+            result = _execute_sql_tool(connection_id, sql_script, params=params, output_format=output_format)
+    else:
+        result = _execute_sql_limited(
+            connection_id,
+            sql_script,
+            params=params,
+            max_rows=max_rows,
+            max_bytes=max_bytes,
+            keyset_column=keyset_column,
+            continuation=continuation,
+            output_format=output_format,
+        )
 
-from datetime import date, datetime
-from decimal import Decimal
+    if cache_key is not None and not (result.startswith("{") and check_error(result)):
+        _result_cache.put(cache_key, result)
+    elif not read_only:
+        # The statement may have changed data that cached results were read from
+        _invalidate_result_cache(connection_id)
+    return result
 
 
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return str(o)
-        if isinstance(o, (date, datetime)):
-            return o.isoformat()
-        return super().default(o)
+def _invalidate_result_cache(connection_id: str) -> None:
+    """Drop the cached query results of a connection after a tool wrote to its tables."""
+    if _result_cache is not None:
+        _result_cache.invalidate(connection_id)
+
+
+@mcp.tool()
+def result_cache_stats(clear: bool = False) -> str:
+    """
+    [MCP Tool] Report hit statistics and size of the read-only query result cache.
+
+    Args:
+        clear (bool): Drop all cached results after reading the statistics. Default False.
+
+    Returns:
+        JSON object {"hits", "misses", "hit_rate", "evictions", "entries", "bytes", "max_bytes", "ttl"}, or
+        {"error": ...} when the config has no "result_cache" block.
+    """
+    if _result_cache is None:
+        return json.dumps({"error": "Result cache is disabled. Add a \"result_cache\" block to the config to enable it."})
+    stats = _result_cache.stats()
+    if clear:
+        _result_cache.clear()
+    return json.dumps(stats)
+
+
+def _query_fingerprint(sql_script: str, params: Optional[list]) -> str:
+    payload = json.dumps([sql_script, params or []], cls=CustomJSONEncoder)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_continuation(keyset_column: str, after, fingerprint: str) -> str:
+    payload = json.dumps({"column": keyset_column, "after": after, "query": fingerprint}, cls=CustomJSONEncoder)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_continuation(continuation: str) -> dict:
+    try:
+        token = json.loads(base64.urlsafe_b64decode(continuation.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid continuation token: {e}") from e
+    if not isinstance(token, dict) or not {"column", "after", "query"} <= set(token.keys()):
+        raise ValueError("Invalid continuation token")
+    return token
+
+
+def _execute_sql_limited(
+    connection_id: str,
+    sql_script: str,
+    params: list = None,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    keyset_column: Optional[str] = None,
+    continuation: Optional[str] = None,
+    output_format: str = "rows",
+) -> str:
+    """
+    Execute a SQL script, streaming rows from an unbuffered cursor until max_rows/max_bytes is reached.
+
+    Rows beyond the limits are never fetched into memory. When a plain query is truncated, the connection
+    is shut down and dropped instead of being reused. With the pure-Python connector this closes the socket
+    without reading the rest of the result, and the server stops once its send buffer fills; the C extension
+    still reads the remaining rows while closing, so the server's work is only bounded with keyset_column.
+    With keyset_column the query is wrapped in ORDER BY/LIMIT so the server only produces one page, and a
+    continuation token records the last key returned.
+
+    Returns:
+        str: JSON object {"rows", "row_count", "truncated", "truncated_by", "continuation"} (with "columns" and
+            "types" for the columnar formats), or a JSON error object with fields "error", "sql_script", and "params".
+    """
+
+    def error(message: str) -> str:
+        return json.dumps({"error": message, "sql_script": sql_script, "params": params})
+
+    if max_rows is not None and max_rows < 1:
+        return error("max_rows must be a positive integer")
+    if max_bytes is not None and max_bytes < 1:
+        return error("max_bytes must be a positive integer")
+    if output_format not in OUTPUT_FORMATS:
+        return error(f"Unsupported output_format '{output_format}'. Valid formats are: {', '.join(OUTPUT_FORMATS)}.")
+
+    if output_format == "rows":
+        def encode(obj) -> str:
+            return json.dumps(obj, cls=CustomJSONEncoder)
+    else:
+        encode = dumps_compact
+
+    query, query_params = sql_script, list(params or [])
+    fingerprint = _query_fingerprint(sql_script, params)
+    try:
+        after = None
+        if continuation is not None:
+            token = _decode_continuation(continuation)
+            if token["query"] != fingerprint:
+                raise ValueError("continuation token does not belong to this sql_script and params")
+            if keyset_column is not None and keyset_column != token["column"]:
+                raise ValueError("continuation token was issued for a different keyset_column")
+            keyset_column, after = token["column"], token["after"]
+
+        if keyset_column is not None:
+            column = _validate_name(keyset_column)
+            if max_rows is None:
+                max_rows = DEFAULT_PAGE_ROWS
+            query = f"SELECT * FROM ({sql_script.strip().rstrip(';')}) AS _keyset_page"
+            if after is not None:
+                query += f" WHERE `{column}` > %s"
+                query_params.append(after)
+            # One extra row tells us whether another page exists
+            query += f" ORDER BY `{column}` LIMIT {max_rows + 1}"
+    except ValueError as e:
+        return error(str(e))
+
+    try:
+        db_connection = _get_db_connection(connection_id)
+    except Exception as e:
+        return json.dumps({"error": f"unable to establish a database connection {str(e)}"})
+
+    rows, size, truncated_by, abandon = [], 2, None, False
+    key_index, columns, types = None, None, None
+    try:
+        cursor = db_connection.cursor()
+        cursor.execute(query, query_params)
+
+        while truncated_by is None:
+            if cursor.with_rows:
+                if output_format != "rows":
+                    if columns is not None:
+                        raise ValueError(f"output_format '{output_format}' supports a single result set")
+                    columns, types = list(cursor.column_names), column_types(cursor.description)
+                if keyset_column is not None and key_index is None:
+                    if keyset_column not in cursor.column_names:
+                        raise ValueError(f"keyset_column '{keyset_column}' is not in the select list")
+                    key_index = cursor.column_names.index(keyset_column)
+
+                while truncated_by is None:
+                    batch_size = FETCH_BATCH_SIZE
+                    if max_rows is not None:
+                        batch_size = min(batch_size, max_rows - len(rows) + 1)
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    for row in batch:
+                        if max_rows is not None and len(rows) >= max_rows:
+                            truncated_by = "max_rows"
+                            break
+                        row_size = len(encode(row)) + 1
+                        if max_bytes is not None and size + row_size > max_bytes:
+                            truncated_by = "max_bytes"
+                            break
+                        rows.append(row)
+                        size += row_size
+
+            if truncated_by is not None or not cursor.nextset():
+                break
+
+        if truncated_by is not None and keyset_column is None:
+            # Draining an unbounded result would read it all; shut the connection down instead
+            abandon = True
+        else:
+            # At most one page is left unread
+            if truncated_by is not None and cursor.with_rows:
+                cursor.fetchall()
+            cursor.close()
+            db_connection.commit()
+
+        next_token = None
+        if truncated_by is not None and keyset_column is not None and rows:
+            next_token = _encode_continuation(keyset_column, rows[-1][key_index], fingerprint)
+
+        payload = {"rows": rows}
+        if output_format != "rows":
+            payload = format_result(columns or [], types or [], rows, output_format)
+        payload.update(
+            {
+                "row_count": len(rows),
+                "truncated": truncated_by is not None,
+                "truncated_by": truncated_by,
+                "continuation": next_token,
+            }
+        )
+        return encode(payload)
+    except Exception as e:
+        abandon = True
+        if isinstance(e, (connector.errors.InterfaceError, connector.errors.OperationalError)):
+            _invalidate_mode(connection_id)
+        return error(f"Error executing SQL: {str(e)}")
+    finally:
+        if abandon:
+            # Close the socket first; close() alone would try to read the unread rows
+            try:
+                db_connection.shutdown()
+            except Exception:
+                pass
+        if abandon and isinstance(db_connection, PooledConnection):
+            db_connection.discard()
+        else:
+            # A plain connection closes even with unread results
+            db_connection.close()
 
 
 def _execute_sql_tool(
     connection: Union[str, MySQLConnectionAbstract],
     sql_script: str,
     params: list = None,
+    output_format: str = "rows",
 ) -> str:
     """
     Execute a SQL script on the specified database connection.
@@ -291,14 +804,25 @@ def _execute_sql_tool(
         connection: Union[str, MySQLConnectionAbstract]: Information defining the database connection to use. Allows for reusing a db connection.
         sql_script (str): The SQL statement to execute. Can be a query or a DML/DDL statement.
         params (list, optional): List of parameters to use for parameterized SQL scripts. If None, executes with no bind variables.
+        output_format (str, optional): "rows" (default), "columnar" or "column_major"; see execute_sql_tool_by_connection_id.
 
     Returns:
-        str: JSON-encoded result of the query—if rows are returned, their content as a list; otherwise, null.
+        str: JSON-encoded result of the query—for "rows", their content as a list if rows are returned; otherwise, null.
+            The columnar formats return a compact JSON object with "columns" and "types" (null when there is no result set).
             In case of error, returns a JSON object with fields: "error", "sql_script", and "params".
 
     Example:
         result = _execute_sql_tool("my_conn", "SELECT * FROM users WHERE id = %s", [42])
     """
+    if output_format not in OUTPUT_FORMATS:
+        return json.dumps(
+            {
+                "error": f"Unsupported output_format '{output_format}'. Valid formats are: {', '.join(OUTPUT_FORMATS)}.",
+                "sql_script": sql_script,
+                "params": params,
+            }
+        )
+
     should_close = False
     if isinstance(connection, str):
         should_close = True
@@ -314,25 +838,40 @@ def _execute_sql_tool(
     try:
         with db_connection.cursor() as cursor:
             results = []
+            columns, types = None, None
             cursor.execute(sql_script, params or [])
 
             # Read results from possibly multiple statements
             while True:
                 if cursor.with_rows:
+                    if output_format != "rows":
+                        if columns is not None:
+                            raise ValueError(f"output_format '{output_format}' supports a single result set")
+                        columns, types = list(cursor.column_names), column_types(cursor.description)
                     results.extend(cursor.fetchall())
 
                 # Move to the next result set
                 if not cursor.nextset():
                     break
 
+            db_connection.commit()
+
+            if output_format != "rows":
+                if columns is None:
+                    return json.dumps(None)
+                return dumps_compact(format_result(columns, types, results, output_format))
+
             if len(results) == 0:
                 results = None
 
-            db_connection.commit()
-
             return json.dumps(results, cls=CustomJSONEncoder)
 
     except Exception as e:
+        if should_close and isinstance(
+            e, (connector.errors.InterfaceError, connector.errors.OperationalError)
+        ):
+            # The server may have gone away or the tunnel been re-pointed
+            _invalidate_mode(connection)
         return json.dumps(
             {
                 "error": f"Error executing SQL: {str(e)}",
@@ -345,6 +884,129 @@ def _execute_sql_tool(
             db_connection.close()
 
 
+@mcp.tool()
+def bulk_load(
+    connection_id: str,
+    table: str,
+    file_path: str,
+    format: str = "csv",
+    batch_size: int = BULK_LOAD_BATCH_SIZE,
+    method: str = "insert",
+    columns: Optional[list] = None,
+    delimiter: str = ",",
+    header: bool = True,
+) -> str:
+    """
+    [MCP Tool] Load rows from a local CSV or Parquet file into an existing table.
+
+    Summary:
+        The file is streamed from the MCP server host, so large files are never held in memory.
+        method "insert" sends executemany INSERT batches of batch_size rows, committing each batch in its own
+        transaction. method "load_data" sends a CSV file with a single LOAD DATA LOCAL INFILE statement, which is
+        fastest but needs local_infile enabled on the server.
+
+    Danger:
+        Issues DML. Ensure you have authorization and backups.
+
+    Args:
+        connection_id (str): MySQL connection key for the target database.
+        table (str): Unqualified target table name in the current schema.
+        file_path (str): Path of the file on the MCP server host.
+        format (str, optional): "csv" (default) or "parquet". Parquet files need pyarrow installed.
+        batch_size (int, optional): Rows per INSERT batch and transaction. Default BULK_LOAD_BATCH_SIZE.
+        method (str, optional): "insert" (default) or "load_data" (CSV only).
+        columns (list, optional): Target column names, in file order. Default: the CSV header or Parquet
+            column names.
+        delimiter (str, optional): CSV field delimiter. Default ",".
+        header (bool, optional): Whether the first CSV line holds column names (it is never loaded). Default True.
+
+    Returns:
+        str: JSON report {"table", "format", "method", "columns", "rows_loaded", "batches", "elapsed_s",
+             "rows_per_sec"} ("warnings" is added for load_data), or a JSON error object
+             {"error": "<details>", "rows_loaded": int, "batches": int}. Batches committed before an error stay
+             loaded; the failed batch is rolled back.
+
+    Notes:
+        CSV values are sent as strings and converted by MySQL; \\N is loaded as NULL.
+
+    MCP usage example:
+        - name: bulk_load
+          arguments: {"connection_id": "example_local_server", "table": "orders", "file_path": "/data/orders.csv"}
+    """
+    rows_loaded, batches = 0, 0
+    start_time = time.perf_counter()
+    try:
+        table = _validate_name(table)
+        if format not in BULK_LOAD_FORMATS:
+            raise ValueError(f"Unsupported format '{format}'. Valid formats are: {', '.join(BULK_LOAD_FORMATS)}.")
+        if method not in ("insert", "load_data"):
+            raise ValueError("method must be 'insert' or 'load_data'")
+        if method == "load_data" and format != "csv":
+            raise ValueError("method 'load_data' only reads CSV files")
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if not isinstance(delimiter, str) or len(delimiter) != 1:
+            raise ValueError("delimiter must be a single character")
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File {file_path} not found on the MCP server host")
+
+        with open_bulk_file(file_path, format, batch_size, delimiter=delimiter, header=header) as (file_columns, row_batches):
+            target_columns = columns or file_columns
+            if not target_columns:
+                raise ValueError("columns must be given for a CSV file without a header")
+            target_columns = [_validate_name(column) for column in target_columns]
+            column_list = ", ".join(f"`{column}`" for column in target_columns)
+
+            if method == "load_data":
+                file_path = os.path.abspath(file_path)
+                with _get_database_connection_cm(
+                    connection_id, allow_local_infile_in_path=os.path.dirname(file_path)
+                ) as db_connection, db_connection.cursor() as cursor:
+                    cursor.execute(
+                        f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table}` CHARACTER SET utf8mb4 "
+                        "FIELDS TERMINATED BY %s OPTIONALLY ENCLOSED BY '\"' LINES TERMINATED BY '\\n' "
+                        f"{'IGNORE 1 LINES ' if header else ''}({column_list})",
+                        [file_path, delimiter],
+                    )
+                    db_connection.commit()
+                    rows_loaded, batches, warnings = cursor.rowcount, 1, cursor.warning_count
+            else:
+                insert_sql = (
+                    f"INSERT INTO `{table}` ({column_list}) VALUES ({', '.join(['%s'] * len(target_columns))})"
+                )
+                with _get_database_connection_cm(connection_id) as db_connection, db_connection.cursor() as cursor:
+                    for rows in row_batches:
+                        try:
+                            cursor.executemany(insert_sql, rows)
+                            db_connection.commit()
+                        except Exception:
+                            db_connection.rollback()
+                            raise
+                        rows_loaded += len(rows)
+                        batches += 1
+    except Exception as e:
+        if batches:
+            _invalidate_result_cache(connection_id)
+        return json.dumps({"error": f"Error with bulk_load: {str(e)}", "rows_loaded": rows_loaded, "batches": batches})
+
+    _invalidate_result_cache(connection_id)
+
+    elapsed = time.perf_counter() - start_time
+    report = {
+        "table": table,
+        "format": format,
+        "method": method,
+        "columns": target_columns,
+        "rows_loaded": rows_loaded,
+        "batches": batches,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_sec": round(rows_loaded / elapsed, 1) if elapsed > 0 else None,
+    }
+    if method == "load_data":
+        report["warnings"] = warnings
+    return json.dumps(report)
+
+
 @mcp.tool()
 def ml_generate(connection_id: str, question: str) -> str:
     """
@@ -391,12 +1053,15 @@ def ragify_column(
     table_name: str,
     input_column_name: str,
     embedding_column_name: str,
+    batch_size: Optional[int] = None,
+    parallelism: int = 1,
 ) -> str:
     """
     [MCP Tool] Create or populate a VECTOR column with embeddings from a source text column.
 
     Summary:
         Uses HeatWave ML_EMBED_TABLE to embed <table>.<input_column_name> into <table>.<embedding_column_name>.
+        With batch_size, embeds in resumable primary-key chunks instead (see Chunked mode).
 
     Danger:
         Issues DDL/DML. Ensure you have authorization and backups.
@@ -406,9 +1071,16 @@ def ragify_column(
         table_name (str): Unqualified target table name in the current schema.
         input_column_name (str): Unqualified source text column to embed.
         embedding_column_name (str): Unqualified VECTOR column name to store embeddings (created or populated).
+        batch_size (int, optional): Rows per chunk. When set, runs in chunked mode.
+        parallelism (int, optional): Chunks embedded at once in chunked mode, each on its own connection
+            (1 to RAGIFY_MAX_PARALLELISM). Default 1. When the config has a "pool" block, each chunk holds a
+            pooled connection for its whole UPDATE, so parallelism is lowered to the pool's pool_size.
 
     Returns:
         str: Plain success string (e.g., "Successfully embedded '<input>' into '<embedding>' on table <table>").
+             In chunked mode, a JSON report:
+             {"table", "primary_key", "batch_size", "parallelism", "chunks_total", "chunks_skipped", "chunks_done",
+              "chunks_failed", "rows_embedded", "elapsed_s", "rows_per_sec", "errors": [...]}
              On failure, a JSON error object: {"error": "<details>"}.
 
     Implementation details:
@@ -416,6 +1088,14 @@ def ragify_column(
         - Invokes: CALL sys.ML_EMBED_TABLE(<schema>.<table>.<input_column_name>, <schema>.<table>.<embedding_column_name>, NULL)
         - Behavior depends on server configuration and HeatWave ML privileges.
 
+    Chunked mode:
+        - Requires a single-column primary key. The table is split into ranges of batch_size keys and each range
+          is embedded with UPDATE ... SET <embedding> = sys.ML_EMBED_ROW(<input>, NULL) WHERE <pk> in range.
+        - The embedding column is added (VECTOR sized for the default embedding model) if it does not exist.
+        - Each finished range is recorded in the RAGIFY_CHECKPOINT_TABLE table in the same transaction as its
+          UPDATE. Query that table to follow progress; re-running the same call skips finished ranges, so an
+          interrupted run resumes where it stopped. Delete its rows for the table to embed from scratch.
+
     MCP usage example:
         - name: ragify_column
           arguments: {
@@ -424,7 +1104,21 @@ def ragify_column(
             "input_column_name": "body",
             "embedding_column_name": "embedding"
           }
+        - name: ragify_column
+          arguments: {
+            "connection_id": "example_local_server",
+            "table_name": "docs",
+            "input_column_name": "body",
+            "embedding_column_name": "embedding",
+            "batch_size": 5000,
+            "parallelism": 4
+          }
     """
+    if batch_size is not None:
+        return _ragify_column_chunked(
+            connection_id, table_name, input_column_name, embedding_column_name, batch_size, parallelism
+        )
+
     with _get_database_connection_cm(connection_id) as db_connection:
         schema = db_connection.database
         qualified_table_name = f"{schema}.{table_name}"
@@ -438,6 +1132,7 @@ def ragify_column(
             embed_query,
             params=[qualified_text_column_name, vector_store_column_name],
         )
+        _invalidate_result_cache(connection_id)
         if check_error(response):
             return json.dumps(
                 {
@@ -448,6 +1143,191 @@ def ragify_column(
         return f"Successfully added embedding column {input_column_name} to table {table_name}"
 
 
+def _query_rows(db_connection, sql_script: str, params: list = None) -> list:
+    """Run a query through _execute_sql_tool and return its rows, raising on error."""
+    response = _execute_sql_tool(db_connection, sql_script, params=params)
+    if check_error(response):
+        raise Exception(get_error(response))
+    return json.loads(response) or []
+
+
+def _plan_key_ranges(db_connection, table: str, key: str, batch_size: int) -> list:
+    """
+    Split a table into [start, end) primary-key ranges of batch_size rows; the last range has end None.
+
+    Each boundary is found with an index seek (ORDER BY key LIMIT 1 OFFSET batch_size), so the table is never
+    read in full and any orderable key type works.
+    """
+    rows = _query_rows(db_connection, f"SELECT MIN(`{key}`) FROM `{table}`")
+    start = rows[0][0] if rows else None
+    ranges = []
+    while start is not None:
+        rows = _query_rows(
+            db_connection,
+            f"SELECT `{key}` FROM `{table}` WHERE `{key}` >= %s ORDER BY `{key}` LIMIT 1 OFFSET {batch_size}",
+            [start],
+        )
+        end = rows[0][0] if rows else None
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _ragify_column_chunked(
+    connection_id: str,
+    table_name: str,
+    input_column_name: str,
+    embedding_column_name: str,
+    batch_size: int,
+    parallelism: int = 1,
+) -> str:
+    """
+    Chunked, resumable ragify_column: embeds primary-key ranges with ML_EMBED_ROW and checkpoints each one.
+
+    Returns:
+        str: JSON report (see ragify_column), or a JSON error object {"error": "<details>"}.
+    """
+    try:
+        table = _validate_name(table_name)
+        input_column = _validate_name(input_column_name)
+        embedding_column = _validate_name(embedding_column_name)
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if not isinstance(parallelism, int) or not 1 <= parallelism <= RAGIFY_MAX_PARALLELISM:
+            raise ValueError(f"parallelism must be between 1 and {RAGIFY_MAX_PARALLELISM}")
+    except ValueError as e:
+        return json.dumps({"error": f"Error with chunked ragify_column: {str(e)}"})
+
+    pool_config = config.get("pool") if config is not None else None
+    if pool_config is not None:
+        # Workers beyond the pool size would wait pool_timeout for a connection and fail their chunk
+        parallelism = min(parallelism, pool_config["pool_size"])
+
+    start_time = time.perf_counter()
+    try:
+        with _get_database_connection_cm(connection_id) as db_connection:
+            key_columns = _query_rows(
+                db_connection,
+                "SELECT COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND CONSTRAINT_NAME = 'PRIMARY' "
+                "ORDER BY ORDINAL_POSITION",
+                [table],
+            )
+            if len(key_columns) != 1:
+                raise Exception(
+                    f"Chunked mode needs a single-column primary key on {table}, found {len(key_columns)} columns"
+                )
+            key = key_columns[0][0]
+
+            has_embedding_column = _query_rows(
+                db_connection,
+                "SELECT COUNT(*) FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s",
+                [table, embedding_column],
+            )[0][0]
+            if not has_embedding_column:
+                dimension = _query_rows(
+                    db_connection, "SELECT VECTOR_DIM(sys.ML_EMBED_ROW(%s, NULL))", ["dimension probe"]
+                )[0][0]
+                _query_rows(
+                    db_connection, f"ALTER TABLE `{table}` ADD COLUMN `{embedding_column}` VECTOR({int(dimension)})"
+                )
+
+            _query_rows(
+                db_connection,
+                f"CREATE TABLE IF NOT EXISTS `{RAGIFY_CHECKPOINT_TABLE}` ("
+                "table_name VARCHAR(64) NOT NULL, "
+                "input_column VARCHAR(64) NOT NULL, "
+                "embedding_column VARCHAR(64) NOT NULL, "
+                "chunk_start VARCHAR(255) NOT NULL, "
+                "chunk_end VARCHAR(255) NOT NULL DEFAULT '', "
+                "rows_embedded BIGINT NOT NULL, "
+                "completed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+                "PRIMARY KEY (table_name, input_column, embedding_column, chunk_start))",
+            )
+            finished = {
+                (row[0], row[1])
+                for row in _query_rows(
+                    db_connection,
+                    f"SELECT chunk_start, chunk_end FROM `{RAGIFY_CHECKPOINT_TABLE}` "
+                    "WHERE table_name = %s AND input_column = %s AND embedding_column = %s",
+                    [table, input_column, embedding_column],
+                )
+            }
+
+            ranges = _plan_key_ranges(db_connection, table, key, batch_size)
+    except Exception as e:
+        # The embedding column may already have been added
+        _invalidate_result_cache(connection_id)
+        return json.dumps({"error": f"Error with chunked ragify_column: {str(e)}"})
+
+    def checkpoint_key(start, end) -> tuple:
+        return str(start), "" if end is None else str(end)
+
+    pending = [r for r in ranges if checkpoint_key(*r) not in finished]
+
+    update_sql = (
+        f"UPDATE `{table}` SET `{embedding_column}` = sys.ML_EMBED_ROW(`{input_column}`, NULL) "
+        f"WHERE `{key}` >= %s"
+    )
+    checkpoint_sql = (
+        f"INSERT INTO `{RAGIFY_CHECKPOINT_TABLE}` "
+        "(table_name, input_column, embedding_column, chunk_start, chunk_end, rows_embedded) "
+        "VALUES (%s, %s, %s, %s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE chunk_end = VALUES(chunk_end), rows_embedded = VALUES(rows_embedded), "
+        "completed_at = CURRENT_TIMESTAMP"
+    )
+
+    def embed_range(key_range) -> int:
+        start, end = key_range
+        sql, params = update_sql, [start]
+        if end is not None:
+            sql += f" AND `{key}` < %s"
+            params.append(end)
+        with _get_database_connection_cm(connection_id) as db_connection:
+            with db_connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                rows = cursor.rowcount
+                cursor.execute(
+                    checkpoint_sql,
+                    [table, input_column, embedding_column, *checkpoint_key(start, end), rows],
+                )
+            # The rows and their checkpoint commit together, so a dropped connection loses at most this chunk
+            db_connection.commit()
+        return rows
+
+    rows_embedded, done, errors = 0, 0, []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=parallelism) as executor:
+        futures = {executor.submit(embed_range, r): r for r in pending}
+        for future in concurrent.futures.as_completed(futures):
+            start, end = futures[future]
+            try:
+                rows_embedded += future.result()
+                done += 1
+            except Exception as e:
+                errors.append({"chunk_start": start, "chunk_end": end, "error": str(e)})
+    _invalidate_result_cache(connection_id)
+
+    elapsed = time.perf_counter() - start_time
+    return json.dumps(
+        {
+            "table": table,
+            "primary_key": key,
+            "batch_size": batch_size,
+            "parallelism": parallelism,
+            "chunks_total": len(ranges),
+            "chunks_skipped": len(ranges) - len(pending),
+            "chunks_done": done,
+            "chunks_failed": len(errors),
+            "rows_embedded": rows_embedded,
+            "elapsed_s": round(elapsed, 3),
+            "rows_per_sec": round(rows_embedded / elapsed, 1) if elapsed > 0 else None,
+            "errors": errors,
+        },
+        cls=CustomJSONEncoder,
+    )
+
+
 @mcp.tool()
 def list_vector_store_files_local(connection_id: str) -> str:
     """
@@ -467,17 +1347,18 @@ def list_vector_store_files_local(connection_id: str) -> str:
           arguments: {"connection_id": "example_local_server"}
     """
     try:
-        mode = _get_mode(connection_id)
+        with _get_database_connection_cm(connection_id) as db_connection:
+            mode = _get_mode(connection_id, db_connection)
 
-        if mode != Mode.MYSQL_AI:
-            raise Exception(
-                f"Connection is {mode} not MySQL AI use list_vector_store_files_object_store"
-            )
+            if mode != Mode.MYSQL_AI:
+                raise Exception(
+                    f"Connection is {mode} not MySQL AI use list_vector_store_files_object_store"
+                )
 
-        result_str = _execute_sql_tool(
-            connection_id,
-            "SELECT LIST_FILES(CONCAT('file://', @@secure_file_priv), NULL);",
-        )
+            result_str = _execute_sql_tool(
+                db_connection,
+                "SELECT LIST_FILES(CONCAT('file://', @@secure_file_priv), NULL);",
+            )
         result = fetch_one(result_str)
         result = json.loads(result)
 
@@ -506,14 +1387,14 @@ def load_vector_store_local(connection_id: str, file_path: str) -> str:
           arguments: {"connection_id": "example_local_server", "file_path": "/path/in/secure_file_priv/doc.pdf"}
     """
     try:
-        mode = _get_mode(connection_id)
+        with _get_database_connection_cm(connection_id) as db_connection:
+            mode = _get_mode(connection_id, db_connection)
 
-        if mode != Mode.MYSQL_AI:
-            raise Exception(
-                f"Connection is {mode} not MySQL AI try load_vector_store_oci"
-            )
+            if mode != Mode.MYSQL_AI:
+                raise Exception(
+                    f"Connection is {mode} not MySQL AI try load_vector_store_oci"
+                )
 
-        with _get_database_connection_cm(connection_id) as db_connection:
             file_path = f"file://{file_path}"
             db_connection.autocommit = True
             return _execute_sql_tool(
@@ -569,18 +1450,19 @@ def load_vector_store_oci(
         - Ensure the MySQL DB has IAM/network permissions to access the specified objects in OCI Object Storage.
     """
     try:
-        mode = _get_mode(connection_id)
+        with _get_database_connection_cm(connection_id) as db_connection:
+            mode = _get_mode(connection_id, db_connection)
 
-        if mode != Mode.OCI:
-            raise Exception(f"Connection is {mode} not OCI try load_vector_store_local")
+            if mode != Mode.OCI:
+                raise Exception(f"Connection is {mode} not OCI try load_vector_store_local")
 
-        file_path = f"oci://{bucket_name}@{namespace}/{document_prefix}"
+            file_path = f"oci://{bucket_name}@{namespace}/{document_prefix}"
 
-        return _execute_sql_tool(
-            connection_id,
-            "CALL sys.vector_store_load(%s, NULL);",
-            params=[file_path],
-        )
+            return _execute_sql_tool(
+                db_connection,
+                "CALL sys.vector_store_load(%s, NULL);",
+                params=[file_path],
+            )
     except Exception as e:
         return json.dumps({"error": f"Error with VECTOR_STORE_LOAD: {str(e)}"})
 
@@ -749,18 +1631,19 @@ def heatwave_ask_help(connection_id: str, question: str) -> str:
         A: CALL sys.ML_TRAIN('mlcorpus.emails', 'spam_label', JSON_OBJECT('task','classification'), @email_spam_model);
     """
     try:
-        mode = _get_mode(connection_id)
+        with _get_database_connection_cm(connection_id) as db_connection:
+            mode = _get_mode(connection_id, db_connection)
 
-        if mode != Mode.OCI:
-            raise Exception(f"Connection is {mode} which does not support NL2ML")
+            if mode != Mode.OCI:
+                raise Exception(f"Connection is {mode} which does not support NL2ML")
 
-        nl2ml_call = "call sys.NL2ML(%s, @nl2ml_response); select @nl2ml_response"
+            nl2ml_call = "call sys.NL2ML(%s, @nl2ml_response); select @nl2ml_response"
 
-        response = _execute_sql_tool(
-            connection_id,
-            nl2ml_call,
-            params=[question],
-        )
+            response = _execute_sql_tool(
+                db_connection,
+                nl2ml_call,
+                params=[question],
+            )
         if check_error(response):
             raise Exception(f"Exception occured while executing NL2ML call {response}")
 
@@ -904,43 +1787,192 @@ def retrieve_relevant_schema_information(connection_id: str, question: str) -> s
             return json.dumps({"error": f"Unexpected response format from ML_RETRIEVE_SCHEMA: {str(e)}"})
 
 
+# One row that changes whenever a table, column, comment or foreign key of the schema changes
+_SCHEMA_FINGERPRINT_SQL = """
+SELECT
+  (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|', TABLE_NAME, TABLE_TYPE, TABLE_COMMENT))), 0))
+     FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s),
+  (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|', TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION,
+                                                             COLUMN_TYPE, COLUMN_COMMENT))), 0))
+     FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = %s),
+  (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|', TABLE_NAME, COLUMN_NAME, CONSTRAINT_NAME,
+                                                             REFERENCED_TABLE_SCHEMA, REFERENCED_TABLE_NAME,
+                                                             REFERENCED_COLUMN_NAME))), 0))
+     FROM information_schema.KEY_COLUMN_USAGE WHERE TABLE_SCHEMA = %s AND REFERENCED_TABLE_NAME IS NOT NULL)
+"""
+
+
+def _load_schema_catalog(db_connection, schema: str, fingerprint) -> SchemaCatalog:
+    """Read tables, columns and foreign keys of a schema from information_schema."""
+    tables = _query_rows(
+        db_connection,
+        "SELECT TABLE_NAME, TABLE_COMMENT FROM information_schema.TABLES "
+        "WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE' ORDER BY TABLE_NAME",
+        [schema],
+    )
+    columns = _query_rows(
+        db_connection,
+        "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, COLUMN_COMMENT FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = %s ORDER BY TABLE_NAME, ORDINAL_POSITION",
+        [schema],
+    )
+    foreign_keys = _query_rows(
+        db_connection,
+        "SELECT TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_SCHEMA, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME "
+        "FROM information_schema.KEY_COLUMN_USAGE "
+        "WHERE TABLE_SCHEMA = %s AND REFERENCED_TABLE_NAME IS NOT NULL "
+        "ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION",
+        [schema],
+    )
+    return SchemaCatalog(schema, tables, columns, foreign_keys, fingerprint=fingerprint)
+
+
+def _get_schema_catalog(connection_id: str, refresh: bool = False) -> SchemaCatalog:
+    """
+    Catalog of the connection's default schema, built once and rebuilt when its DDL fingerprint changes.
+
+    The fingerprint is rechecked at most every SCHEMA_CATALOG_CHECK_INTERVAL seconds; refresh rebuilds now.
+    """
+    with _schema_catalogs_lock:
+        cached = _schema_catalogs.get(connection_id)
+    if cached is not None and not refresh and time.monotonic() - cached[0] < SCHEMA_CATALOG_CHECK_INTERVAL:
+        return cached[1]
+
+    with _get_database_connection_cm(connection_id) as db_connection:
+        schema = db_connection.database
+        if not schema:
+            raise Exception(f"Connection {connection_id} has no default database to build a schema catalog for")
+        fingerprint = _query_rows(db_connection, _SCHEMA_FINGERPRINT_SQL, [schema] * 3)
+        catalog = cached[1] if cached is not None else None
+        if refresh or catalog is None or catalog.schema != schema or catalog.fingerprint != fingerprint:
+            catalog = _load_schema_catalog(db_connection, schema, fingerprint)
+
+    with _schema_catalogs_lock:
+        _schema_catalogs[connection_id] = (time.monotonic(), catalog)
+    return catalog
+
+
+@mcp.tool()
+def retrieve_relevant_schema_local(connection_id: str, question: str, top_k: int = 5, refresh: bool = False) -> str:
+    """
+    [MCP Tool] Retrieve the CREATE statements of the tables most relevant to a question, without HeatWave ML.
+
+    Tables of the connection's default schema are ranked by keyword overlap between the question and table
+    names, column names and comments, so it works where ML_RETRIEVE_SCHEMA_METADATA is unavailable and answers
+    in milliseconds once the catalog is built. Tables referenced by a foreign key of a ranked table are
+    included so joins can be written.
+
+    Args:
+        connection_id (str): MySQL connection key.
+        question (str): Natural language question.
+        top_k (int): Number of best matching tables to return, before foreign key neighbours. Default 5.
+        refresh (bool): Rebuild the schema catalog from information_schema first. Default False; the catalog
+            is otherwise rebuilt automatically when the schema's DDL changes.
+
+    Returns:
+        A single JSON of the form:
+        {
+            "create_statements": "CREATE TABLE `db2`.`singer`(...) COMMENT 'table about singers';\n\nCREATE TABLE ...",
+            "tables": [{"table": "singer", "score": 8.294}, {"table": "album", "score": 1.833}],
+            "schema": "db2",
+            "elapsed_ms": 0.4
+        }
+        Tables that match no word of the question are not returned.
+
+    MCP usage example:
+        - name: retrieve_relevant_schema_local
+          arguments: {"connection_id": "example_local_server", "question": "Which singers have the highest net worth?"}
+    """
+    if top_k < 1:
+        return json.dumps({"error": "top_k must be at least 1"})
+    try:
+        catalog = _get_schema_catalog(connection_id, refresh=refresh)
+    except Exception as e:
+        return json.dumps({"error": f"Error building schema catalog: {str(e)}"})
+
+    start = time.perf_counter()
+    ranked = catalog.rank(question, top_k=top_k)
+    create_statements = "\n\n".join(catalog.create_statement(table) for table, _ in ranked)
+    return json.dumps(
+        {
+            "create_statements": create_statements,
+            "tables": [{"table": table, "score": score} for table, score in ranked],
+            "schema": catalog.schema,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+    )
+
+
 """
 Object store
 """
 
 def verify_compartment_access(compartments):
-    access_report = {}
+    """
+    Check Object Storage access (list_buckets) for each compartment, COMPARTMENT_VERIFY_MAX_WORKERS at a time.
 
+    Returns:
+        dict: {"<compartment_name>": {"compartment_id", "object_storage", "databases", "errors", "elapsed_ms"}},
+            in the order the compartments were given.
+    """
+    access_report = {}
     for compartment in compartments:
         access_report[compartment.name] = {
             "compartment_id": compartment.id,
             "object_storage": False,
             "databases": False,
             "errors": [],
+            "elapsed_ms": 0.0,
         }
 
-        # Test Object Storage
+    try:
+        namespace = oci_cache.namespace(oci_info)
+    except Exception as e:
+        for entry in access_report.values():
+            entry["errors"].append(f"Object Storage: {str(e)}")
+        return access_report
+
+    def check(compartment):
+        start = time.perf_counter()
         try:
-            namespace = oci_info.object_storage_client.get_namespace().data
-            list_buckets_response = oci_info.object_storage_client.list_buckets(
+            oci_info.object_storage_client.list_buckets(
                 namespace_name=namespace, compartment_id=compartment.id
             )
-            access_report[compartment.name]["object_storage"] = True
+            error = None
         except Exception as e:
-            access_report[compartment.name]["errors"].append(
-                f"Object Storage: {str(e)}"
-            )
+            error = f"Object Storage: {str(e)}"
+        return compartment, error, round((time.perf_counter() - start) * 1000, 1)
+
+    if not compartments:
+        return access_report
+
+    workers = min(len(compartments), COMPARTMENT_VERIFY_MAX_WORKERS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for compartment, error, elapsed_ms in executor.map(check, compartments):
+            entry = access_report[compartment.name]
+            entry["elapsed_ms"] = elapsed_ms
+            if error is None:
+                entry["object_storage"] = True
+            else:
+                entry["errors"].append(error)
 
     return access_report
 
 
+def _list_tenancy_compartments() -> list:
+    """All compartments directly under the tenancy, following every page of list_compartments."""
+    return oci.pagination.list_call_get_all_results(
+        oci_info.identity_client.list_compartments, oci_info.tenancy_id
+    ).data
+
+
 @mcp.tool()
-def list_all_compartments() -> str:
+def list_all_compartments(refresh: bool = False) -> str:
     """
     [MCP Tool] List all compartments in the tenancy.
 
     Args:
-        None
+        refresh (bool, optional): Rebuild the report even if a recent one is cached. Default False.
 
     Returns:
         str: Stringified per-compartment access report:
@@ -949,7 +1981,8 @@ def list_all_compartments() -> str:
                  "compartment_id": "<ocid>",
                  "object_storage": true|false,
                  "databases": true|false,
-                 "errors": [ "<error strings>" ]
+                 "errors": [ "<error strings>" ],
+                 "elapsed_ms": <time spent checking access>
                },
                ...
              }
@@ -959,21 +1992,27 @@ def list_all_compartments() -> str:
     Notes:
         - Uses PROFILE_NAME env var (default "DEFAULT") to select OCI CLI profile for authentication.
         - If OCI is not available (oci_info is None), an error JSON is returned.
-        - Enumerates compartments via IdentityClient.list_compartments() and verifies Object Storage access to populate object_storage and errors fields.
+        - Enumerates compartments via IdentityClient.list_compartments() (all pages) and verifies Object Storage access
+          concurrently to populate object_storage and errors fields.
+        - The report is reused for COMPARTMENT_REPORT_TTL seconds unless refresh is True.
     """
     if oci_error_msg is not None:
         return oci_error_msg
 
-    compartments = []
+    if refresh:
+        oci_cache.invalidate("compartment_access_report")
+
     try:
-        compartments = oci_info.identity_client.list_compartments(
-            oci_info.tenancy_id
-        ).data
+        # verify_compartment_access records its own errors, so anything raised here is from listing
+        access_report = oci_cache.get(
+            oci_info,
+            "compartment_access_report",
+            lambda: verify_compartment_access(_list_tenancy_compartments()),
+            ttl=COMPARTMENT_REPORT_TTL,
+        )
     except Exception as e:
         return json.dumps({"error": f"Error with list_compartments: {str(e)}"})
 
-    access_report = verify_compartment_access(compartments)
-
     return str(access_report)
 
 
@@ -993,30 +2032,14 @@ def _get_compartment_by_name(
 
     Notes:
         - Searches accessible compartments in subtree and includes the root tenancy.
+        - The compartment tree is cached for OCI_CACHE_TTL seconds (see OciCache).
         - Intended for internal use by Object Storage helpers.
         - May raise exception
     """
     if oci_error_msg is not None:
         return None
 
-    compartments = oci_info.identity_client.list_compartments(
-        compartment_id=oci_info.tenancy_id,
-        compartment_id_in_subtree=True,
-        access_level="ACCESSIBLE",
-        lifecycle_state="ACTIVE",
-    )
-    compartments.data.append(
-        oci_info.identity_client.get_compartment(
-            compartment_id=oci_info.tenancy_id
-        ).data
-    )
-
-    # Search for the compartment by name
-    for compartment in compartments.data:
-        if compartment.name.lower() == compartment_name.lower():
-            return compartment
-
-    return None
+    return oci_cache.compartment_by_name(oci_info, compartment_name)
 
 
 @mcp.tool()
@@ -1037,6 +2060,7 @@ def object_storage_list_buckets(
     Notes:
         - Resolves the compartment by name when provided, otherwise uses compartment_id directly.
         - Uses the account's Object Storage namespace and lists all buckets within the compartment.
+        - The namespace and compartment names are cached for OCI_CACHE_TTL seconds (see OciCache).
         - Pair with list_all_compartments to discover compartment names/OCIDs.
     """
     if oci_error_msg is not None:
@@ -1047,7 +2071,7 @@ def object_storage_list_buckets(
             comp = _get_compartment_by_name(compartment_name)
             if comp and not isinstance(comp, str):
                 compartment_id = comp.id
-        namespace = oci_info.object_storage_client.get_namespace().data
+        namespace = oci_cache.namespace(oci_info)
         list_buckets_response = oci_info.object_storage_client.list_buckets(
             namespace_name=namespace, compartment_id=compartment_id
         )
@@ -1090,7 +2114,12 @@ def object_storage_list_objects(namespace: str, bucket_name: str) -> str:
 
 def main():
     """Run the MCP server with CLI argument support."""
-    mcp.run(transport="stdio")
+    _start_ssh_tunnel()
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        if _ssh_tunnel is not None:
+            _ssh_tunnel.stop()
 
 if __name__ == '__main__':
     main()
@@ -7,13 +7,21 @@ import contextlib
 import importlib.util
 import json
 import os
+import socket
 import sys
+import tempfile
+import threading
+import time
 import types
 import unittest
 import uuid
+from datetime import date, datetime
+from decimal import Decimal
 from unittest import mock
 
-from oracle.mysql_mcp_server.utils import get_ssh_command, fill_config_defaults, Mode
+import oci
+
+from oracle.mysql_mcp_server.utils import get_ssh_command, fill_config_defaults, search_terms, Mode
 import oracle.mysql_mcp_server.server as m
 SKIP_ESTABLISHED = False
 
@@ -111,6 +119,12 @@ OCI_SKIP_MSG = "Skip OCI Dependent Test"
 
 
 class TestMysqlMcpUtilities(unittest.TestCase):
+    def setUp(self):
+        # _get_mode caches per connection_id; start every test from a cold cache
+        patcher = mock.patch.object(m, "_modes", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     # ---- Mode ----
     def test_mode_from_string_valid(self):
         self.assertEqual(m.Mode.from_string("LCL"), m.Mode.MYSQL_AI)
@@ -218,6 +232,52 @@ class TestMysqlMcpUtilities(unittest.TestCase):
             with self.assertRaises(ValueError):
                 m._get_mode("any_conn")
 
+    def test_get_mode_cached_per_connection(self):
+        provider_result = json.dumps([["OCI"]])
+        with mock.patch.object(
+            m, "_execute_sql_tool", return_value=provider_result
+        ) as exec_mock:
+            self.assertEqual(m._get_mode("any_conn"), m.Mode.OCI)
+            self.assertEqual(m._get_mode("any_conn"), m.Mode.OCI)
+            self.assertEqual(m._get_mode("other_conn"), m.Mode.OCI)
+        self.assertEqual(exec_mock.call_count, 2)
+
+    def test_get_mode_errors_not_cached(self):
+        results = [json.dumps({"error": "driver failure"}), json.dumps([["LCL"]])]
+        with mock.patch.object(m, "_execute_sql_tool", side_effect=results):
+            with self.assertRaises(Exception):
+                m._get_mode("any_conn")
+            self.assertEqual(m._get_mode("any_conn"), m.Mode.MYSQL_AI)
+
+    def test_get_mode_reuses_given_connection(self):
+        conn = mock.Mock(name="MySQLConnection")
+        with mock.patch.object(
+            m, "_execute_sql_tool", return_value=json.dumps([["LCL"]])
+        ) as exec_mock:
+            m._get_mode("any_conn", conn)
+        self.assertIs(exec_mock.call_args[0][0], conn)
+
+    def test_get_mode_invalidated_on_connection_failure(self):
+        cfg = {"server_infos": {"good": {"database": "testdb", "user": "u"}}}
+        m._modes["good"] = m.Mode.OCI
+        with mock.patch.object(m, "config", cfg), mock.patch.object(m, "config_error_msg", None), mock.patch.object(
+            m.connector, "connect", side_effect=RuntimeError("driver down")
+        ):
+            with self.assertRaises(m.DatabaseConnectionError):
+                m._get_db_connection("good")
+        self.assertNotIn("good", m._modes)
+
+    def test_get_mode_invalidated_on_lost_connection(self):
+        conn = mock.MagicMock(name="MySQLConnection")
+        conn.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            m.connector.errors.OperationalError("Lost connection to MySQL server")
+        )
+        m._modes["good"] = m.Mode.OCI
+        with mock.patch.object(m, "_get_db_connection", return_value=conn):
+            out = m._execute_sql_tool("good", "SELECT 1")
+        self.assertTrue(m.check_error(out))
+        self.assertNotIn("good", m._modes)
+
 
 class TestLoadMySQLConfig(unittest.TestCase):
     def _valid_config(self):
@@ -346,7 +406,87 @@ class TestDbConnectionUtilities(unittest.TestCase):
             mock_conn.close.assert_called_once()
 
 
+class TestConnectionPool(unittest.TestCase):
+    def _cfg(self, **pool):
+        return {
+            "server_infos": {
+                "good": {"database": "testdb", "user": "u", "password": "p", "host": "h", "port": 3306}
+            },
+            "pool": {"pool_size": 2, "pool_timeout": 0.1, "reset_session": True, **pool},
+        }
+
+    def _patched(self, cfg, connect_mock):
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(m, "config", cfg))
+        stack.enter_context(mock.patch.object(m, "config_error_msg", None))
+        stack.enter_context(mock.patch.object(m, "_pools", {}))
+        stack.enter_context(mock.patch.object(m.connector, "connect", connect_mock))
+        return stack
+
+    def test_connection_reused_across_checkouts(self):
+        raw = mock.Mock(name="MySQLConnection")
+        raw.is_connected.return_value = True
+        connect_mock = mock.Mock(return_value=raw)
+        with self._patched(self._cfg(), connect_mock):
+            with m._get_database_connection_cm("good") as conn:
+                conn.autocommit = True
+            with m._get_database_connection_cm("good"):
+                pass
+        connect_mock.assert_called_once_with(**self._cfg()["server_infos"]["good"])
+        self.assertEqual(raw.reset_session.call_count, 2)
+        raw.close.assert_not_called()
+        # Writes go to the real connection; the reset then restores the default
+        self.assertFalse(raw.autocommit)
+
+    def test_stale_connection_replaced_on_checkout(self):
+        stale, fresh = mock.Mock(name="stale"), mock.Mock(name="fresh")
+        stale.is_connected.return_value = False
+        fresh.is_connected.return_value = True
+        connect_mock = mock.Mock(side_effect=[stale, fresh])
+        with self._patched(self._cfg(), connect_mock):
+            m._get_db_connection("good").close()
+            conn = m._get_db_connection("good")
+            self.assertIs(conn._cnx, fresh)
+            conn.close()
+        stale.close.assert_called_once()
+
+    def test_exhausted_pool_times_out(self):
+        connect_mock = mock.Mock(side_effect=lambda **_: mock.Mock())
+        with self._patched(self._cfg(pool_size=1), connect_mock):
+            held = m._get_db_connection("good")
+            with self.assertRaises(m.DatabaseConnectionError) as ctx:
+                m._get_db_connection("good")
+            held.close()
+            m._get_db_connection("good").close()
+        self.assertIn("pool exhausted", str(ctx.exception))
+
+    def test_failed_reset_drops_connection(self):
+        raw = mock.Mock(name="MySQLConnection")
+        raw.reset_session.side_effect = RuntimeError("lost connection")
+        connect_mock = mock.Mock(side_effect=lambda **_: raw)
+        with self._patched(self._cfg(pool_size=1), connect_mock):
+            m._get_db_connection("good").close()
+            m._get_db_connection("good").close()
+        self.assertEqual(connect_mock.call_count, 2)
+        self.assertEqual(raw.close.call_count, 2)
+
+    def test_connect_failure_frees_slot(self):
+        connect_mock = mock.Mock(side_effect=[RuntimeError("driver down"), mock.Mock()])
+        with self._patched(self._cfg(pool_size=1), connect_mock):
+            with self.assertRaises(m.DatabaseConnectionError) as ctx:
+                m._get_db_connection("good")
+            m._get_db_connection("good").close()
+        self.assertIn("Connection failed with error: driver down", str(ctx.exception))
+
+
 class TestListAllConnections(unittest.TestCase):
+    def setUp(self):
+        # list_all_connections reuses recent results; start every test from a cold cache
+        for name, value in (("_probe_cache", {}), ("config_error_msg", None)):
+            patcher = mock.patch.object(src_module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
     def test_list_all_connections_config_error_msg_not_none(self):
         error_msg = json.dumps({"error": "Config failed"})
         with mock.patch.object(src_module, "config_error_msg", error_msg):
@@ -357,7 +497,7 @@ class TestListAllConnections(unittest.TestCase):
         cfg = {"server_infos": {"conn1": {"database": "db1"}, "conn2": {"database": "db2"}}}
 
         @contextlib.contextmanager
-        def ok_cm(_cid):
+        def ok_cm(_cid, **_connect_args):
             yield None
 
         with mock.patch.object(
@@ -384,7 +524,7 @@ class TestListAllConnections(unittest.TestCase):
         cfg = {"server_infos": {"good": {"database": "db"}, "bad": {"database": "db"}}}
 
         @contextlib.contextmanager
-        def mixed_cm(cid):
+        def mixed_cm(cid, **_connect_args):
             if cid == "bad":
                 raise RuntimeError("boom")
             yield None
@@ -417,7 +557,7 @@ class TestListAllConnections(unittest.TestCase):
     def test_list_all_connections_all_invalid_mocked(self):
         cfg = {"server_infos": {"k1": {"database": "db"}, "k2": {"database": "db"}}}
 
-        def failing_cm(_cid):
+        def failing_cm(_cid, **_connect_args):
             raise m.DatabaseConnectionError("cannot connect")
 
         with mock.patch.object(
@@ -435,6 +575,163 @@ class TestListAllConnections(unittest.TestCase):
         for e in payload["invalid keys"]:
             self.assertIn("cannot connect", e["error"])
 
+    def test_list_all_connections_checks_concurrently_and_reports_latency(self):
+        cfg = {"server_infos": {f"c{i}": {"database": "db"} for i in range(4)}}
+
+        @contextlib.contextmanager
+        def slow_cm(_cid, **_connect_args):
+            time.sleep(0.3)
+            yield None
+
+        with mock.patch.object(
+            src_module, "config", cfg, create=True
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=slow_cm
+        ), mock.patch.object(
+            src_module, "_get_mode", return_value=src_module.Mode.OCI
+        ):
+            start = time.perf_counter()
+            payload = json.loads(src_module.list_all_connections())
+            elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual([v["key"] for v in payload["valid keys"]], ["c0", "c1", "c2", "c3"])
+        for entry in payload["valid keys"]:
+            self.assertGreaterEqual(entry["latency_ms"], 300)
+
+    def test_list_all_connections_hung_check_times_out(self):
+        cfg = {"server_infos": {"hung": {"database": "db"}, "ok": {"database": "db"}}}
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        @contextlib.contextmanager
+        def cm(cid, **_connect_args):
+            if cid == "hung":
+                release.wait(5)
+            yield None
+
+        with mock.patch.object(
+            src_module, "config", cfg, create=True
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=cm
+        ), mock.patch.object(
+            src_module, "_get_mode", return_value=src_module.Mode.OCI
+        ), mock.patch.object(
+            src_module, "CONNECTION_PROBE_TIMEOUT", 0.2
+        ):
+            start = time.perf_counter()
+            payload = json.loads(src_module.list_all_connections())
+            elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 2.0)
+        self.assertEqual([v["key"] for v in payload["valid keys"]], ["ok"])
+        self.assertEqual(payload["invalid keys"][0]["key"], "hung")
+        self.assertIn("timed out", payload["invalid keys"][0]["error"])
+        self.assertGreaterEqual(payload["invalid keys"][0]["latency_ms"], 200)
+
+    def test_list_all_connections_times_out_queued_check_from_its_own_start(self):
+        # One worker: "hung" only starts after "slow" used most of its own timeout
+        cfg = {"server_infos": {"slow": {"database": "db"}, "hung": {"database": "db"}}}
+        release = threading.Event()
+        self.addCleanup(release.set)
+        connect_args = []
+
+        @contextlib.contextmanager
+        def cm(cid, **kwargs):
+            connect_args.append(kwargs)
+            if cid == "slow":
+                time.sleep(0.3)
+            else:
+                release.wait(5)
+            yield None
+
+        with mock.patch.object(
+            src_module, "config", cfg, create=True
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=cm
+        ), mock.patch.object(
+            src_module, "_get_mode", return_value=src_module.Mode.OCI
+        ), mock.patch.object(
+            src_module, "CONNECTION_PROBE_TIMEOUT", 0.4
+        ), mock.patch.object(
+            src_module, "CONNECTION_PROBE_MAX_WORKERS", 1
+        ):
+            start = time.perf_counter()
+            payload = json.loads(src_module.list_all_connections())
+            elapsed = time.perf_counter() - start
+
+        self.assertGreaterEqual(elapsed, 0.7)
+        self.assertEqual([v["key"] for v in payload["valid keys"]], ["slow"])
+        hung = payload["invalid keys"][0]
+        self.assertEqual(hung["key"], "hung")
+        self.assertIn("timed out", hung["error"])
+        self.assertGreaterEqual(hung["latency_ms"], 400)
+        self.assertLess(hung["latency_ms"], 650)
+        self.assertEqual(connect_args, [{"connection_timeout": 0.4}] * 2)
+
+    def test_list_all_connections_reports_check_blocked_by_hung_worker_as_not_started(self):
+        cfg = {"server_infos": {"hung": {"database": "db"}, "queued": {"database": "db"}}}
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        @contextlib.contextmanager
+        def cm(cid, **_connect_args):
+            calls.append(cid)
+            release.wait(5)
+            yield None
+
+        with mock.patch.object(
+            src_module, "config", cfg, create=True
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=cm
+        ), mock.patch.object(
+            src_module, "_get_mode", return_value=src_module.Mode.OCI
+        ), mock.patch.object(
+            src_module, "CONNECTION_PROBE_TIMEOUT", 0.2
+        ), mock.patch.object(
+            src_module, "CONNECTION_PROBE_MAX_WORKERS", 1
+        ):
+            payload = json.loads(src_module.list_all_connections())
+
+        self.assertEqual(payload["valid keys"], [])
+        hung, queued = payload["invalid keys"]
+        self.assertIn("timed out", hung["error"])
+        self.assertEqual(queued["key"], "queued")
+        self.assertIn("not started", queued["error"])
+        self.assertIsNone(queued["latency_ms"])
+        self.assertEqual(calls, ["hung"])
+        # The check that never ran is not cached, so the next call retries it
+        self.assertNotIn("queued", src_module._probe_cache)
+
+    def test_list_all_connections_reuses_recent_results(self):
+        cfg = {"server_infos": {"conn1": {"database": "db1"}}}
+        calls = []
+
+        @contextlib.contextmanager
+        def counting_cm(cid, **_connect_args):
+            calls.append(cid)
+            yield None
+
+        with mock.patch.object(
+            src_module, "config", cfg, create=True
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=counting_cm
+        ), mock.patch.object(
+            src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI
+        ):
+            first = src_module.list_all_connections()
+            second = src_module.list_all_connections()
+            self.assertEqual(calls, ["conn1"])
+            self.assertEqual(first, second)
+
+            src_module.list_all_connections(refresh=True)
+            self.assertEqual(calls, ["conn1", "conn1"])
+
+            with mock.patch.object(src_module, "CONNECTION_PROBE_TTL", 0):
+                src_module.list_all_connections()
+            self.assertEqual(calls, ["conn1", "conn1", "conn1"])
+
     def test_list_all_connections_empty_config_mocked(self):
         with mock.patch.object(src_module, "config", {"server_infos": {}}, create=True):
             out = src_module.list_all_connections()
@@ -577,6 +874,315 @@ class TestExecuteSqlTool(unittest.TestCase):
         self.assertEqual(data, [[1], [2]])
 
 
+class _StreamingCursor:
+    """Unbuffered-cursor stand-in that counts how many rows were actually fetched."""
+
+    def __init__(self, rows, column_names=("id", "name")):
+        self.rows = list(rows)
+        self.column_names = column_names
+        self.with_rows = True
+        self.fetched = 0
+        self.executed = None
+
+    def execute(self, sql, params):
+        self.executed = (sql, list(params))
+
+    def fetchmany(self, size):
+        batch = self.rows[self.fetched:self.fetched + size]
+        self.fetched += len(batch)
+        return batch
+
+    def fetchall(self):
+        return self.fetchmany(len(self.rows))
+
+    def nextset(self):
+        return None
+
+    def close(self):
+        pass
+
+
+class TestExecuteSqlLimited(unittest.TestCase):
+    def _run(self, rows, **kwargs):
+        cursor = _StreamingCursor(rows)
+        conn = mock.MagicMock()
+        conn.cursor.return_value = cursor
+        with mock.patch.object(src_module, "_get_db_connection", return_value=conn):
+            out = src_module.execute_sql_tool_by_connection_id("cid", kwargs.pop("sql", "SELECT id, name FROM t"), **kwargs)
+        return json.loads(out), cursor, conn
+
+    def test_max_rows_stops_early(self):
+        rows = [(i, f"n{i}") for i in range(10_000)]
+        payload, cursor, conn = self._run(rows, max_rows=3)
+        self.assertEqual(payload["rows"], [[0, "n0"], [1, "n1"], [2, "n2"]])
+        self.assertEqual(payload["row_count"], 3)
+        self.assertTrue(payload["truncated"])
+        self.assertEqual(payload["truncated_by"], "max_rows")
+        self.assertIsNone(payload["continuation"])
+        self.assertLessEqual(cursor.fetched, 4)
+        conn.close.assert_called_once()
+
+    def test_exact_row_count_not_truncated(self):
+        payload, _, conn = self._run([(1, "a"), (2, "b")], max_rows=2)
+        self.assertEqual(payload["row_count"], 2)
+        self.assertFalse(payload["truncated"])
+        self.assertIsNone(payload["truncated_by"])
+        conn.commit.assert_called_once()
+
+    def test_max_bytes_limits_encoded_size(self):
+        rows = [(i, "x" * 50) for i in range(100)]
+        payload, _, _ = self._run(rows, max_bytes=200)
+        self.assertTrue(payload["truncated"])
+        self.assertEqual(payload["truncated_by"], "max_bytes")
+        self.assertLessEqual(len(json.dumps(payload["rows"])), 200)
+        self.assertGreater(payload["row_count"], 0)
+
+    def test_keyset_pages_with_continuation(self):
+        sql = "SELECT id, name FROM t WHERE name LIKE %s;"
+        payload, cursor, _ = self._run(
+            [(1, "a"), (2, "b"), (3, "c")], sql=sql, params=["%"], max_rows=2, keyset_column="id"
+        )
+        self.assertEqual(
+            cursor.executed,
+            (
+                "SELECT * FROM (SELECT id, name FROM t WHERE name LIKE %s) AS _keyset_page ORDER BY `id` LIMIT 3",
+                ["%"],
+            ),
+        )
+        self.assertEqual(payload["row_count"], 2)
+        self.assertTrue(payload["truncated"])
+        self.assertIsNotNone(payload["continuation"])
+
+        payload, cursor, _ = self._run(
+            [(3, "c")], sql=sql, params=["%"], max_rows=2, continuation=payload["continuation"]
+        )
+        self.assertIn("WHERE `id` > %s ORDER BY `id` LIMIT 3", cursor.executed[0])
+        self.assertEqual(cursor.executed[1], ["%", 2])
+        self.assertEqual(payload["rows"], [[3, "c"]])
+        self.assertFalse(payload["truncated"])
+        self.assertIsNone(payload["continuation"])
+
+    def test_continuation_for_other_query_rejected(self):
+        payload, _, _ = self._run([(1, "a"), (2, "b")], max_rows=1, keyset_column="id")
+        with mock.patch.object(src_module, "_get_db_connection") as get_conn:
+            out = src_module.execute_sql_tool_by_connection_id(
+                "cid", "SELECT id FROM other", continuation=payload["continuation"]
+            )
+        get_conn.assert_not_called()
+        self.assertIn("does not belong", json.loads(out)["error"])
+
+    def test_keyset_column_must_be_selected(self):
+        payload, _, _ = self._run([(1, "a")], keyset_column="created_at")
+        self.assertIn("not in the select list", payload["error"])
+
+    def test_truncated_pooled_connection_is_discarded(self):
+        raw = mock.MagicMock()
+        raw.cursor.return_value = _StreamingCursor([(i, "n") for i in range(10)])
+        pool = m.ConnectionPool(lambda: raw, pool_size=1, pool_timeout=0.1)
+        with mock.patch.object(src_module, "_get_db_connection", side_effect=lambda _cid: pool.acquire()):
+            src_module.execute_sql_tool_by_connection_id("cid", "SELECT id, name FROM t", max_rows=2)
+        raw.shutdown.assert_called_once()
+        raw.close.assert_called_once()
+        raw.reset_session.assert_not_called()
+        pool.acquire().close()  # the slot was freed
+
+
+class TestOutputFormats(unittest.TestCase):
+    ROWS = [
+        (1, Decimal("9.50"), datetime(2024, 5, 1, 12, 30), date(2024, 5, 1)),
+        (2, Decimal("0.01"), datetime(2024, 5, 2, 8, 0, 0, 250000), date(2024, 5, 2)),
+    ]
+
+    def _conn(self, result_sets):
+        cursor = mock.MagicMock()
+        sets = iter(result_sets)
+        current = {}
+
+        def advance():
+            current["set"] = next(sets, None)
+            return current["set"]
+
+        advance()
+        type(cursor).with_rows = mock.PropertyMock(side_effect=lambda: current["set"] is not None)
+        type(cursor).column_names = mock.PropertyMock(side_effect=lambda: current["set"][0])
+        type(cursor).description = mock.PropertyMock(
+            side_effect=lambda: [(name, type_code) for name, type_code in zip(current["set"][0], current["set"][1])]
+        )
+        cursor.fetchall.side_effect = lambda: list(current["set"][2])
+        cursor.nextset.side_effect = lambda: advance()
+        conn = mock.MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        return conn
+
+    def _single(self):
+        field = m.connector.FieldType
+        return [(("id", "price", "at", "day"), (field.LONGLONG, field.NEWDECIMAL, field.DATETIME, field.DATE), self.ROWS)]
+
+    def test_columnar_includes_names_and_types(self):
+        out = src_module._execute_sql_tool(self._conn(self._single()), "SELECT ...", output_format="columnar")
+        self.assertNotIn(" ", out)  # compact encoding
+        payload = json.loads(out)
+        self.assertEqual(payload["columns"], ["id", "price", "at", "day"])
+        self.assertEqual(payload["types"], ["LONGLONG", "NEWDECIMAL", "DATETIME", "DATE"])
+        self.assertEqual(
+            payload["rows"],
+            [
+                [1, "9.50", "2024-05-01T12:30:00", "2024-05-01"],
+                [2, "0.01", "2024-05-02T08:00:00.250000", "2024-05-02"],
+            ],
+        )
+
+    def test_column_major_transposes_rows(self):
+        out = src_module._execute_sql_tool(self._conn(self._single()), "SELECT ...", output_format="column_major")
+        payload = json.loads(out)
+        self.assertEqual(payload["data"][0], [1, 2])
+        self.assertEqual(payload["data"][1], ["9.50", "0.01"])
+        self.assertNotIn("rows", payload)
+
+    def test_rows_format_unchanged(self):
+        out = src_module._execute_sql_tool(self._conn(self._single()), "SELECT ...")
+        self.assertEqual(out, json.dumps(self.ROWS, cls=src_module.CustomJSONEncoder))
+
+    def test_encodings_agree_with_and_without_orjson(self):
+        obj = m.format_result(["id", "price", "at", "day"], ["LONGLONG"] * 4, self.ROWS, "columnar")
+        fast = m.dumps_compact(obj)
+        with mock.patch("oracle.mysql_mcp_server.utils.orjson", None):
+            fallback = m.dumps_compact(obj)
+        self.assertEqual(json.loads(fast), json.loads(fallback))
+
+    def test_columnar_rejects_multiple_result_sets(self):
+        field = m.connector.FieldType
+        sets = [(("a",), (field.LONG,), [(1,)]), (("b",), (field.LONG,), [(2,)])]
+        out = src_module._execute_sql_tool(self._conn(sets), "SELECT 1; SELECT 2", output_format="columnar")
+        self.assertIn("single result set", json.loads(out)["error"])
+
+    def test_unknown_format_rejected(self):
+        out = src_module.execute_sql_tool_by_connection_id("cid", "SELECT 1", output_format="csv")
+        self.assertIn("Unsupported output_format", json.loads(out)["error"])
+
+    def test_limited_columnar_keeps_page_metadata(self):
+        cursor = _StreamingCursor([(i, f"n{i}") for i in range(5)])
+        cursor.description = [("id", m.connector.FieldType.LONG), ("name", m.connector.FieldType.VAR_STRING)]
+        conn = mock.MagicMock()
+        conn.cursor.return_value = cursor
+        with mock.patch.object(src_module, "_get_db_connection", return_value=conn):
+            out = src_module.execute_sql_tool_by_connection_id(
+                "cid", "SELECT id, name FROM t", max_rows=2, output_format="column_major"
+            )
+        payload = json.loads(out)
+        self.assertEqual(payload["columns"], ["id", "name"])
+        self.assertEqual(payload["data"], [[0, 1], ["n0", "n1"]])
+        self.assertTrue(payload["truncated"])
+        self.assertEqual(payload["row_count"], 2)
+
+
+class TestResultCache(unittest.TestCase):
+    def test_read_only_classification(self):
+        for sql in (
+            "SELECT COUNT(*) FROM t",
+            " show tables;",
+            "DESCRIBE t",
+            "SELECT created_at FROM t -- now()",
+            "SELECT 'a#b', `x--y` FROM t /* c */",
+            "SELECT 'it''s @home' FROM t",
+        ):
+            self.assertTrue(m.is_read_only_sql(sql), sql)
+        for sql in (
+            "UPDATE t SET a = 1",
+            "SELECT NOW()",
+            "select rand() from t",
+            "SELECT CURRENT_TIMESTAMP",
+            "SELECT sys.ML_GENERATE('q', NULL)",
+            "SELECT @x",
+            "SELECT * FROM t FOR UPDATE",
+            "SELECT a INTO OUTFILE '/tmp/a' FROM t",
+            "SELECT 1; DELETE FROM t",
+            # Comment markers inside literals must not hide the statements after them
+            "SELECT 1 FROM t WHERE x='#'; DELETE FROM t",
+            "SELECT 1 FROM t WHERE x=\"--\"; DELETE FROM t",
+            "SELECT 1--1; DELETE FROM t",
+            # Scripts that cannot be split cleanly are never cached
+            "SELECT 'unterminated",
+            "SELECT '\\'; DELETE FROM t; -- '",
+            "SELECT 1 /*!; DELETE FROM t */",
+            "SELECT 1 /* unterminated",
+        ):
+            self.assertFalse(m.is_read_only_sql(sql), sql)
+
+    def test_quoted_comment_marker_not_cached(self):
+        with mock.patch.object(src_module, "_result_cache", m.ResultCache(max_bytes=1000, ttl=60)), \
+                mock.patch.object(src_module, "_execute_sql_tool", return_value="[[1]]") as exec_mock:
+            for _ in range(2):
+                src_module.execute_sql_tool_by_connection_id("cid", "SELECT 1 FROM t WHERE x='#'; DELETE FROM t")
+        self.assertEqual(exec_mock.call_count, 2)
+
+    def test_lru_eviction_by_bytes(self):
+        cache = m.ResultCache(max_bytes=10, ttl=60)
+        cache.put(("c", "a"), "aaaa")
+        cache.put(("c", "b"), "bbbb")
+        self.assertEqual(cache.get(("c", "a")), "aaaa")  # a is now the most recently used
+        cache.put(("c", "d"), "dddd")
+        self.assertIsNone(cache.get(("c", "b")))
+        self.assertEqual(cache.get(("c", "d")), "dddd")
+        cache.put(("c", "big"), "x" * 11)  # larger than the whole cache: not stored
+        self.assertIsNone(cache.get(("c", "big")))
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["bytes"], stats["evictions"]), (2, 8, 1))
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+
+    def test_ttl_and_invalidate(self):
+        cache = m.ResultCache(max_bytes=100, ttl=60)
+        cache.put(("c1", "q"), "[1]")
+        cache.put(("c2", "q"), "[2]")
+        cache.invalidate("c1")
+        self.assertIsNone(cache.get(("c1", "q")))
+        self.assertEqual(cache.get(("c2", "q")), "[2]")
+        with mock.patch.object(m.time, "monotonic", return_value=time.monotonic() + 61):
+            self.assertIsNone(cache.get(("c2", "q")))
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+    def test_tool_reuses_read_only_results(self):
+        executed = []
+
+        def fake_exec(connection_id, sql, params=None, output_format="rows"):
+            executed.append(sql)
+            return json.dumps([[len(executed)]])
+
+        with mock.patch.object(src_module, "_result_cache", m.ResultCache(max_bytes=1000, ttl=60)), \
+                mock.patch.object(src_module, "_execute_sql_tool", side_effect=fake_exec):
+            first = src_module.execute_sql_tool_by_connection_id("cid", "SELECT COUNT(*) FROM t")
+            self.assertEqual(src_module.execute_sql_tool_by_connection_id("cid", "SELECT COUNT(*) FROM t"), first)
+            self.assertEqual(len(executed), 1)
+
+            # Different params, a cache bypass and non-deterministic SQL all run the query
+            src_module.execute_sql_tool_by_connection_id("cid", "SELECT COUNT(*) FROM t", params=[1])
+            src_module.execute_sql_tool_by_connection_id("cid", "SELECT COUNT(*) FROM t", use_cache=False)
+            src_module.execute_sql_tool_by_connection_id("cid", "SELECT NOW()")
+            src_module.execute_sql_tool_by_connection_id("cid", "SELECT NOW()")
+            self.assertEqual(len(executed), 5)
+
+            # A write clears the connection's results
+            src_module.execute_sql_tool_by_connection_id("cid", "DELETE FROM t")
+            self.assertNotEqual(src_module.execute_sql_tool_by_connection_id("cid", "SELECT COUNT(*) FROM t"), first)
+            self.assertEqual(len(executed), 7)
+
+            stats = json.loads(src_module.result_cache_stats(clear=True))
+            self.assertEqual(stats["hits"], 1)
+            self.assertEqual(json.loads(src_module.result_cache_stats())["entries"], 0)
+
+    def test_errors_not_cached(self):
+        err = json.dumps({"error": "boom", "sql_script": "SELECT 1", "params": None})
+        with mock.patch.object(src_module, "_result_cache", m.ResultCache(max_bytes=1000, ttl=60)), \
+                mock.patch.object(src_module, "_execute_sql_tool", return_value=err) as exec_mock:
+            src_module.execute_sql_tool_by_connection_id("cid", "SELECT 1")
+            src_module.execute_sql_tool_by_connection_id("cid", "SELECT 1")
+        self.assertEqual(exec_mock.call_count, 2)
+
+    def test_disabled_by_default(self):
+        with mock.patch.object(src_module, "_result_cache", None):
+            self.assertIn("disabled", json.loads(src_module.result_cache_stats())["error"])
+
+
 class TestMlGenerate(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -766,6 +1372,237 @@ class TestRagifyColumn(unittest.TestCase):
             )
 
 
+class TestRagifyColumnChunked(unittest.TestCase):
+    IDS = list(range(1, 11))
+
+    def _run(self, checkpoints=(), has_embedding_column=True, fail_chunk_start=None, key_columns=(("id",),), **kwargs):
+        executed, connections = [], []
+        lock = threading.Lock()
+        ids = self.IDS
+
+        def fake_exec(_conn, sql, params=None):
+            executed.append((sql, params))
+            if "KEY_COLUMN_USAGE" in sql:
+                return json.dumps([list(c) for c in key_columns])
+            if "information_schema.COLUMNS" in sql:
+                return json.dumps([[1 if has_embedding_column else 0]])
+            if "VECTOR_DIM" in sql:
+                return json.dumps([[384]])
+            if sql.startswith("SELECT chunk_start"):
+                return json.dumps([list(c) for c in checkpoints])
+            if sql.startswith("SELECT MIN"):
+                return json.dumps([[ids[0]]])
+            if "OFFSET" in sql:
+                rest = [i for i in ids if i >= params[0]]
+                return json.dumps([[rest[kwargs["batch_size"]]]] if len(rest) > kwargs["batch_size"] else None)
+            return json.dumps(None)
+
+        class FakeCursor:
+            def __init__(self, log):
+                self.log = log
+                self.rowcount = 0
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql, params):
+                if sql.startswith("UPDATE") and params[0] == fail_chunk_start:
+                    raise RuntimeError("lost connection")
+                self.log.append((sql, params))
+                if sql.startswith("UPDATE"):
+                    end = params[1] if len(params) > 1 else None
+                    self.rowcount = len([i for i in ids if i >= params[0] and (end is None or i < end)])
+
+        class FakeConn:
+            def __init__(self):
+                self.log = []
+                self.commits = 0
+
+            def cursor(self):
+                return FakeCursor(self.log)
+
+            def commit(self):
+                self.commits += 1
+
+        @contextlib.contextmanager
+        def cm(_cid):
+            conn = FakeConn()
+            with lock:
+                connections.append(conn)
+            yield conn
+
+        with mock.patch.object(src_module, "_get_database_connection_cm", new=cm), \
+             mock.patch.object(src_module, "_execute_sql_tool", side_effect=fake_exec):
+            out = src_module.ragify_column("any", "docs", "body", "embedding", **kwargs)
+        return json.loads(out), executed, connections
+
+    def test_embeds_key_ranges_and_checkpoints_each(self):
+        report, executed, connections = self._run(batch_size=4)
+        self.assertEqual(report["chunks_total"], 3)
+        self.assertEqual(report["chunks_done"], 3)
+        self.assertEqual(report["rows_embedded"], 10)
+        self.assertEqual(report["primary_key"], "id")
+        self.assertIsNotNone(report["rows_per_sec"])
+        self.assertFalse(any("ML_EMBED_TABLE" in sql for sql, _ in executed))
+
+        chunk_logs = [c.log for c in connections[1:]]
+        self.assertEqual(len(chunk_logs), 3)
+        updates = sorted(log[0][1] for log in chunk_logs)
+        self.assertEqual(updates, [[1, 5], [5, 9], [9]])
+        for conn in connections[1:]:
+            update, checkpoint = conn.log
+            self.assertIn("sys.ML_EMBED_ROW(`body`, NULL)", update[0])
+            self.assertIn("mcp_ragify_checkpoint", checkpoint[0])
+            self.assertEqual(conn.commits, 1)
+        last = next(c for c in connections[1:] if c.log[0][1] == [9])
+        self.assertEqual(last.log[1][1], ["docs", "body", "embedding", "9", "", 2])
+
+    def test_resume_skips_checkpointed_ranges(self):
+        report, _, connections = self._run(checkpoints=[("1", "5"), ("5", "9")], batch_size=4)
+        self.assertEqual(report["chunks_skipped"], 2)
+        self.assertEqual(report["chunks_done"], 1)
+        self.assertEqual(report["rows_embedded"], 2)
+        self.assertEqual(len(connections), 2)
+
+    def test_failed_chunk_reported_without_checkpoint(self):
+        report, _, connections = self._run(fail_chunk_start=5, batch_size=4, parallelism=3)
+        self.assertEqual(report["chunks_done"], 2)
+        self.assertEqual(report["chunks_failed"], 1)
+        self.assertEqual(report["errors"][0]["chunk_start"], 5)
+        self.assertIn("lost connection", report["errors"][0]["error"])
+        self.assertFalse(any(log and log[0][1][0] == 5 for log in (c.log for c in connections[1:])))
+
+    def test_parallelism_limited_to_pool_size(self):
+        cfg = {"server_infos": {}, "pool": {"pool_size": 2, "pool_timeout": 10, "reset_session": True}}
+        with mock.patch.object(src_module, "config", cfg):
+            report, _, _ = self._run(batch_size=4, parallelism=8)
+        self.assertEqual(report["parallelism"], 2)
+        self.assertEqual(report["chunks_done"], 3)
+
+    def test_clears_cached_results(self):
+        cache = m.ResultCache(max_bytes=1000, ttl=60)
+        cache.put(("any", "SELECT embedding FROM docs"), "[[null]]")
+        with mock.patch.object(src_module, "_result_cache", cache):
+            self._run(batch_size=4)
+        self.assertIsNone(cache.get(("any", "SELECT embedding FROM docs")))
+
+    def test_missing_embedding_column_added(self):
+        _, executed, _ = self._run(has_embedding_column=False, batch_size=4)
+        self.assertIn(("ALTER TABLE `docs` ADD COLUMN `embedding` VECTOR(384)", None), executed)
+
+    def test_requires_single_column_primary_key(self):
+        report, _, _ = self._run(key_columns=[("a",), ("b",)], batch_size=4)
+        self.assertIn("single-column primary key", report["error"])
+
+    def test_invalid_arguments_rejected(self):
+        for kwargs in ({"batch_size": 0}, {"batch_size": 10, "parallelism": 99}):
+            out = src_module.ragify_column("any", "docs", "body", "embedding", **kwargs)
+            self.assertIn("Error with chunked ragify_column", json.loads(out)["error"])
+        out = src_module.ragify_column("any", "docs; DROP", "body", "embedding", batch_size=10)
+        self.assertIn("Unsupported name format", json.loads(out)["error"])
+
+
+class TestBulkLoad(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.connect_args = []
+        self.conn = mock.MagicMock()
+        self.cursor = self.conn.cursor.return_value.__enter__.return_value
+        self.cursor.rowcount = 3
+        self.cursor.warning_count = 0
+
+        @contextlib.contextmanager
+        def cm(_cid, **connect_args):
+            self.connect_args.append(connect_args)
+            yield self.conn
+
+        patcher = mock.patch.object(src_module, "_get_database_connection_cm", new=cm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _csv(self, text, name="data.csv"):
+        path = os.path.join(self.dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_insert_batches_commit_each(self):
+        path = self._csv('id,name\n1,a\n2,"b, c"\n3,\\N\n4,d\n5,e\n')
+        out = json.loads(src_module.bulk_load("cid", "people", path, batch_size=2))
+        self.assertNotIn("error", out)
+        self.assertEqual((out["rows_loaded"], out["batches"]), (5, 3))
+        self.assertEqual(out["columns"], ["id", "name"])
+        self.assertIsNotNone(out["rows_per_sec"])
+        calls = self.cursor.executemany.call_args_list
+        self.assertEqual(calls[0].args[0], "INSERT INTO `people` (`id`, `name`) VALUES (%s, %s)")
+        self.assertEqual([c.args[1] for c in calls], [[("1", "a"), ("2", "b, c")], [("3", None), ("4", "d")], [("5", "e")]])
+        self.assertEqual(self.conn.commit.call_count, 3)
+        self.assertEqual(self.connect_args, [{}])
+
+    def test_failed_batch_rolled_back_and_reported(self):
+        path = self._csv("1;a\n2;b\n3;c\n")
+        self.cursor.executemany.side_effect = [None, RuntimeError("duplicate key")]
+        out = json.loads(
+            src_module.bulk_load("cid", "people", path, batch_size=2, columns=["id", "name"], delimiter=";", header=False)
+        )
+        self.assertIn("duplicate key", out["error"])
+        self.assertEqual((out["rows_loaded"], out["batches"]), (2, 1))
+        self.conn.rollback.assert_called_once()
+        self.assertEqual(self.cursor.executemany.call_args_list[0].args[1], [("1", "a"), ("2", "b")])
+
+    def test_load_clears_cached_results(self):
+        path = self._csv("id,name\n1,a\n")
+        cache = m.ResultCache(max_bytes=1000, ttl=60)
+        cache.put(("cid", "SELECT COUNT(*) FROM people"), "[[0]]")
+        with mock.patch.object(src_module, "_result_cache", cache):
+            src_module.bulk_load("cid", "people", path)
+        self.assertIsNone(cache.get(("cid", "SELECT COUNT(*) FROM people")))
+
+    def test_load_data_uses_local_infile(self):
+        path = self._csv("id,name\n1,a\n2,b\n3,c\n")
+        out = json.loads(src_module.bulk_load("cid", "people", path, method="load_data"))
+        self.assertEqual((out["rows_loaded"], out["batches"], out["warnings"]), (3, 1, 0))
+        sql, params = self.cursor.execute.call_args.args
+        self.assertTrue(sql.startswith("LOAD DATA LOCAL INFILE %s INTO TABLE `people`"))
+        self.assertIn("IGNORE 1 LINES (`id`, `name`)", sql)
+        self.assertEqual(params, [os.path.abspath(path), ","])
+        self.assertEqual(self.connect_args, [{"allow_local_infile_in_path": os.path.dirname(os.path.abspath(path))}])
+
+    def test_validation_errors(self):
+        path = self._csv("id,name\n1,a\n")
+        cases = [
+            ({"table": "bad-name"}, "Unsupported name format"),
+            ({"format": "xlsx"}, "Unsupported format"),
+            ({"format": "parquet", "method": "load_data"}, "only reads CSV"),
+            ({"batch_size": 0}, "batch_size"),
+            ({"file_path": os.path.join(self.dir, "missing.csv")}, "not found"),
+            ({"header": False}, "columns must be given"),
+            ({"columns": ["id", "na me"]}, "Unsupported name format"),
+        ]
+        for overrides, message in cases:
+            kwargs = {"table": "people", "file_path": path, **overrides}
+            out = json.loads(src_module.bulk_load("cid", **kwargs))
+            self.assertIn(message, out["error"], overrides)
+        self.cursor.executemany.assert_not_called()
+
+    def test_parquet_without_pyarrow(self):
+        path = self._csv("PAR1", name="data.parquet")
+        with mock.patch("oracle.mysql_mcp_server.utils.pq", None):
+            out = json.loads(src_module.bulk_load("cid", "people", path, format="parquet"))
+        self.assertIn("pyarrow", out["error"])
+
+
+@contextlib.contextmanager
+def _fake_connection_cm(_cid):
+    """Stands in for _get_database_connection_cm so tools run without a database."""
+    yield mock.MagicMock()
+
+
 class TestListVectorStoreFilesLocal(unittest.TestCase):
 
     def test_list_vector_store_files_local_success_mocked(self):
@@ -777,6 +1614,8 @@ class TestListVectorStoreFilesLocal(unittest.TestCase):
 
         with mock.patch.object(
             src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=_fake_connection_cm
         ), mock.patch.object(
             src_module, "_execute_sql_tool", return_value=execute_result
         ):
@@ -792,6 +1631,8 @@ class TestListVectorStoreFilesLocal(unittest.TestCase):
     def test_list_vector_store_files_local_wrong_mode_mocked(self):
         with mock.patch.object(
             src_module, "_get_mode", return_value=src_module.Mode.OCI
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=_fake_connection_cm
         ):
             out = src_module.list_vector_store_files_local("cid")
         self.assertTrue(src_module.check_error(out))
@@ -801,6 +1642,8 @@ class TestListVectorStoreFilesLocal(unittest.TestCase):
         # Cause fetch_one to raise (e.g., unexpected rowcount)
         with mock.patch.object(
             src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=_fake_connection_cm
         ), mock.patch.object(
             src_module,
             "_execute_sql_tool",
@@ -814,6 +1657,8 @@ class TestListVectorStoreFilesLocal(unittest.TestCase):
         # fetch_one returns a string that isn't JSON -> json.loads fails -> caught -> error JSON
         with mock.patch.object(
             src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=_fake_connection_cm
         ), mock.patch.object(
             src_module,
             "_execute_sql_tool",
@@ -1025,7 +1870,8 @@ class TestAskMlRagVectorStore(unittest.TestCase):
 
     def test_load_vector_store_oci_mode_not_oci(self):
         # _get_mode returns something that is not Mode.OCI
-        with mock.patch.object(src_module, "_get_mode") as mock_get_mode:
+        with mock.patch.object(src_module, "_get_mode") as mock_get_mode, \
+             mock.patch.object(src_module, "_get_database_connection_cm", new=_fake_connection_cm):
             mock_get_mode.return_value = "MYSQL_AI"
             result = src_module.load_vector_store_oci(
                 connection_id="myconn",
@@ -1039,7 +1885,8 @@ class TestAskMlRagVectorStore(unittest.TestCase):
 
     def test_load_vector_store_oci_exception(self):
         # _get_mode raises an unexpected exception
-        with mock.patch.object(src_module, "_get_mode") as mock_get_mode:
+        with mock.patch.object(src_module, "_get_mode") as mock_get_mode, \
+             mock.patch.object(src_module, "_get_database_connection_cm", new=_fake_connection_cm):
             mock_get_mode.side_effect = Exception("something bad happened")
             result = src_module.load_vector_store_oci(
                 connection_id="myconn",
@@ -1197,6 +2044,8 @@ class TestLoadVectorStoreLocalMocked(unittest.TestCase):
     def test_wrong_mode_returns_error_json(self):
         with mock.patch.object(
             src_module, "_get_mode", return_value=src_module.Mode.OCI
+        ), mock.patch.object(
+            src_module, "_get_database_connection_cm", new=_fake_connection_cm
         ):
             out = src_module.load_vector_store_local("cid", "/a/b.txt")
         self.assertTrue(m.check_error(out))
@@ -1254,6 +2103,18 @@ class TestLoadVectorStoreLocalMocked(unittest.TestCase):
         self.assertTrue(events["exited"])
 
 
+def _list_response(data, next_page=None):
+    """An OCI list Response; oci.pagination stops at the page without an opc-next-page header."""
+    return oci.Response(200, {"opc-next-page": next_page} if next_page else {}, data, None)
+
+
+def _list_compartments_mock(**kwargs):
+    """A list_compartments mock that oci.pagination can call (its retry wrapper reads __name__)."""
+    method = mock.MagicMock(**kwargs)
+    method.__name__ = "list_compartments"
+    return method
+
+
 class TestOciTools(unittest.TestCase):
 
     def test_list_all_compartments_unavailable(self):
@@ -1280,9 +2141,9 @@ class TestOciTools(unittest.TestCase):
     def test_list_all_compartments_identity_error(self):
         mock_oci_info = mock.MagicMock()
         mock_identity_client = mock.MagicMock()
-        mock_identity_client.list_compartments.side_effect = Exception(
+        mock_identity_client.list_compartments = _list_compartments_mock(side_effect=Exception(
             "OCI identity error: {'target_service': 'identity', 'status': 404, 'code': 'NotAuthorizedOrNotFound', 'message': 'Authorization failed or requested resource not found'}"
-        )
+        ))
         mock_oci_info.identity_client = mock_identity_client
         mock_oci_info.tenancy_id = "ocid1.tenancy.oc1..example"
         with mock.patch.object(src_module, "oci_info", mock_oci_info), \
@@ -1304,7 +2165,7 @@ class TestOciTools(unittest.TestCase):
         fake_compartment1.name = "A"
 
         mock_identity_client = mock.MagicMock()
-        mock_identity_client.list_compartments.return_value.data = [fake_compartment1]
+        mock_identity_client.list_compartments = _list_compartments_mock(return_value=_list_response([fake_compartment1]))
         mock_oci_info.identity_client = mock_identity_client
         mock_oci_info.tenancy_id = "ocid1.tenancy.oc1..xyz"
 
@@ -1327,7 +2188,7 @@ class TestOciTools(unittest.TestCase):
         fake_compartment.id = "ocid1.compartment.oc1..abc"
         fake_compartment.name = "A"
         mock_identity_client = mock.MagicMock()
-        mock_identity_client.list_compartments.return_value.data = [fake_compartment]
+        mock_identity_client.list_compartments = _list_compartments_mock(return_value=_list_response([fake_compartment]))
         # get_compartment should not be called; make it raise if it is
         mock_identity_client.get_compartment.side_effect = Exception("should not be called")
         mock_oci_info.identity_client = mock_identity_client
@@ -1348,7 +2209,7 @@ class TestOciTools(unittest.TestCase):
         fake_compartment.id = "ocid1.compartment.oc1..compa"
 
         mock_identity_client = mock.MagicMock()
-        mock_identity_client.list_compartments.return_value.data = [fake_compartment]
+        mock_identity_client.list_compartments = _list_compartments_mock(return_value=_list_response([fake_compartment]))
 
         mock_oci_info.identity_client = mock_identity_client
         mock_oci_info.tenancy_id = "ocid1.tenancy.oc1..xyz"
@@ -1377,7 +2238,7 @@ class TestOciTools(unittest.TestCase):
         fake_compartment.id = "ocid1.compartment.oc1..compb"
 
         mock_identity_client = mock.MagicMock()
-        mock_identity_client.list_compartments.return_value.data = [fake_compartment]
+        mock_identity_client.list_compartments = _list_compartments_mock(return_value=_list_response([fake_compartment]))
 
         mock_oci_info.identity_client = mock_identity_client
         mock_oci_info.tenancy_id = "ocid1.tenancy.oc1..xyz"
@@ -1398,6 +2259,8 @@ class TestOciTools(unittest.TestCase):
     def test_object_storage_list_buckets_missing_compartmentid(self):
         mock_oci_info = mock.MagicMock()
         err_msg = "{\"error\": \"Error listing buckets: {'target_service': 'object_storage', 'status': 400, 'code': 'MissingCompartmentId', 'message': \"The 'compartmentId' query parameter was missing\"}\"}"
+        # The compartment name does not resolve
+        mock_oci_info.identity_client.list_compartments = _list_compartments_mock(return_value=_list_response([]))
         # Simulate failure on get_namespace (or list_buckets)
         mock_oci_info.object_storage_client.get_namespace.return_value.data = "ns"
         mock_oci_info.object_storage_client.list_buckets.side_effect = Exception(
@@ -1477,9 +2340,7 @@ class TestOciTools(unittest.TestCase):
 
         mock_oci_info = mock.MagicMock()
         mock_identity_client = mock.MagicMock()
-        mock_result = mock.MagicMock()
-        mock_result.data = [fake_compartment]
-        mock_identity_client.list_compartments.return_value = mock_result
+        mock_identity_client.list_compartments = _list_compartments_mock(return_value=_list_response([fake_compartment]))
         mock_identity_client.get_compartment.return_value.data = fake_compartment
         mock_oci_info.identity_client = mock_identity_client
 
@@ -1535,6 +2396,170 @@ class TestOciTools(unittest.TestCase):
         self.assertIn("fake failure", result)
 
 
+class TestOciCache(unittest.TestCase):
+    def _oci_info(self, names=("CompA", "CompB")):
+        oci_info = mock.MagicMock()
+        oci_info.tenancy_id = "ocid1.tenancy.oc1..root"
+        compartments = []
+        for name in names:
+            compartment = mock.MagicMock()
+            compartment.name = name
+            compartment.id = f"ocid1.compartment.oc1..{name.lower()}"
+            compartments.append(compartment)
+        root = mock.MagicMock()
+        root.name = "root"
+        root.id = oci_info.tenancy_id
+        oci_info.identity_client.list_compartments = _list_compartments_mock(return_value=_list_response(compartments))
+        oci_info.identity_client.get_compartment.return_value.data = root
+        oci_info.object_storage_client.get_namespace.return_value.data = "ns"
+        return oci_info
+
+    def _patched(self, oci_info, ttl=300):
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(src_module, "oci_info", oci_info))
+        stack.enter_context(mock.patch.object(src_module, "oci_error_msg", None))
+        stack.enter_context(mock.patch.object(src_module, "oci_cache", m.OciCache(ttl=ttl)))
+        return stack
+
+    def test_namespace_fetched_once_across_tools(self):
+        oci_info = self._oci_info()
+        with self._patched(oci_info):
+            src_module.object_storage_list_buckets(compartment_id="ocid1.compartment.oc1..a")
+            src_module.object_storage_list_buckets(compartment_id="ocid1.compartment.oc1..b")
+            src_module.verify_compartment_access(
+                oci_info.identity_client.list_compartments.return_value.data
+            )
+        oci_info.object_storage_client.get_namespace.assert_called_once()
+        self.assertEqual(oci_info.object_storage_client.list_buckets.call_count, 4)
+
+    def test_compartment_tree_listed_once_for_name_lookups(self):
+        oci_info = self._oci_info()
+        with self._patched(oci_info):
+            self.assertEqual(src_module._get_compartment_by_name("compa").id, "ocid1.compartment.oc1..compa")
+            self.assertEqual(src_module._get_compartment_by_name("COMPB").id, "ocid1.compartment.oc1..compb")
+            self.assertEqual(src_module._get_compartment_by_name("Root").id, "ocid1.tenancy.oc1..root")
+            self.assertIsNone(src_module._get_compartment_by_name("missing"))
+        oci_info.identity_client.list_compartments.assert_called_once()
+        oci_info.identity_client.get_compartment.assert_called_once()
+
+    def test_compartment_tree_follows_every_page(self):
+        oci_info = self._oci_info(("CompA",))
+        first_page = oci_info.identity_client.list_compartments.return_value.data
+        second_page = self._oci_info(("CompB",)).identity_client.list_compartments.return_value.data
+        oci_info.identity_client.list_compartments.side_effect = lambda **k: (
+            _list_response(second_page) if k.get("page") == "page-2" else _list_response(first_page, "page-2")
+        )
+        with self._patched(oci_info):
+            self.assertEqual(src_module._get_compartment_by_name("compb").id, "ocid1.compartment.oc1..compb")
+            self.assertEqual(src_module._get_compartment_by_name("compa").id, "ocid1.compartment.oc1..compa")
+        calls = oci_info.identity_client.list_compartments.call_args_list
+        self.assertEqual([c.kwargs.get("page") for c in calls], [None, "page-2"])
+        self.assertTrue(all(c.kwargs["compartment_id_in_subtree"] for c in calls))
+
+    def test_entries_expire_after_ttl(self):
+        oci_info = self._oci_info()
+        with self._patched(oci_info, ttl=0):
+            src_module._get_compartment_by_name("compa")
+            src_module._get_compartment_by_name("compa")
+        self.assertEqual(oci_info.identity_client.list_compartments.call_count, 2)
+
+    def test_failures_not_cached(self):
+        oci_info = self._oci_info()
+        oci_info.object_storage_client.get_namespace.side_effect = [Exception("throttled"), mock.Mock(data="ns")]
+        cache = m.OciCache(ttl=300)
+        with self.assertRaises(Exception):
+            cache.namespace(oci_info)
+        self.assertEqual(cache.namespace(oci_info), "ns")
+        self.assertEqual(cache.namespace(oci_info), "ns")
+        self.assertEqual(oci_info.object_storage_client.get_namespace.call_count, 2)
+
+    def test_new_oci_info_starts_fresh_cache(self):
+        first, second = self._oci_info(("CompA",)), self._oci_info(("CompB",))
+        cache = m.OciCache(ttl=300)
+        self.assertIsNotNone(cache.compartment_by_name(first, "compa"))
+        self.assertIsNone(cache.compartment_by_name(second, "compa"))
+        self.assertIsNotNone(cache.compartment_by_name(second, "compb"))
+
+
+class TestListAllCompartmentsReport(unittest.TestCase):
+    def _compartment(self, name):
+        compartment = mock.MagicMock()
+        compartment.name = name
+        compartment.id = f"ocid1.compartment.oc1..{name.lower()}"
+        return compartment
+
+    def _oci_info(self, pages):
+        oci_info = mock.MagicMock()
+        oci_info.tenancy_id = "ocid1.tenancy.oc1..root"
+        responses = []
+        for i, names in enumerate(pages):
+            next_page = f"page-{i + 2}" if i + 1 < len(pages) else None
+            responses.append(_list_response([self._compartment(name) for name in names], next_page))
+        oci_info.identity_client.list_compartments = _list_compartments_mock(
+            side_effect=lambda *a, **k: responses[int(k["page"].split("-")[1]) - 1 if "page" in k else 0]
+        )
+        oci_info.object_storage_client.get_namespace.return_value.data = "ns"
+        return oci_info
+
+    def _patched(self, oci_info):
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(src_module, "oci_info", oci_info))
+        stack.enter_context(mock.patch.object(src_module, "oci_error_msg", None))
+        stack.enter_context(mock.patch.object(src_module, "oci_cache", m.OciCache(ttl=300)))
+        return stack
+
+    def test_all_pages_listed(self):
+        oci_info = self._oci_info([["A", "B"], ["C"], ["D"]])
+        with self._patched(oci_info):
+            result = src_module.list_all_compartments()
+        for name in ("A", "B", "C", "D"):
+            self.assertIn(f"ocid1.compartment.oc1..{name.lower()}", result)
+        calls = oci_info.identity_client.list_compartments.call_args_list
+        self.assertEqual([c.kwargs.get("page") for c in calls], [None, "page-2", "page-3"])
+
+    def test_access_checked_concurrently_with_timing(self):
+        names = [f"C{i}" for i in range(8)]
+        oci_info = self._oci_info([names])
+
+        def slow_list_buckets(**_kwargs):
+            time.sleep(0.2)
+
+        oci_info.object_storage_client.list_buckets.side_effect = slow_list_buckets
+        with self._patched(oci_info), mock.patch.object(src_module, "COMPARTMENT_VERIFY_MAX_WORKERS", 8):
+            start = time.perf_counter()
+            report = src_module.verify_compartment_access(
+                oci_info.identity_client.list_compartments().data
+            )
+            elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(list(report.keys()), names)
+        for entry in report.values():
+            self.assertTrue(entry["object_storage"])
+            self.assertGreaterEqual(entry["elapsed_ms"], 200)
+        oci_info.object_storage_client.get_namespace.assert_called_once()
+
+    def test_report_cached_until_refresh(self):
+        oci_info = self._oci_info([["A"]])
+        with self._patched(oci_info):
+            first = src_module.list_all_compartments()
+            second = src_module.list_all_compartments()
+            self.assertEqual(first, second)
+            self.assertEqual(oci_info.identity_client.list_compartments.call_count, 1)
+            self.assertEqual(oci_info.object_storage_client.list_buckets.call_count, 1)
+
+            src_module.list_all_compartments(refresh=True)
+            self.assertEqual(oci_info.identity_client.list_compartments.call_count, 2)
+            self.assertEqual(oci_info.object_storage_client.list_buckets.call_count, 2)
+
+    def test_listing_error_not_cached(self):
+        oci_info = self._oci_info([["A"]])
+        responses = oci_info.identity_client.list_compartments.side_effect
+        oci_info.identity_client.list_compartments.side_effect = [Exception("throttled"), responses()]
+        with self._patched(oci_info):
+            self.assertIn("Error with list_compartments", src_module.list_all_compartments())
+            self.assertIn("ocid1.compartment.oc1..a", src_module.list_all_compartments())
+
+
 class TestFillConfigDefaults(unittest.TestCase):
     def _base_server(self):
         return {
@@ -1601,6 +2626,209 @@ class TestFillConfigDefaults(unittest.TestCase):
             fill_config_defaults(cfg)
         self.assertIn("Config bastion", str(ctx.exception))
 
+    def test_pool_defaults_applied(self):
+        cfg = {"server_infos": {"c1": self._base_server()}, "pool": {"pool_size": 2}}
+        out = fill_config_defaults(cfg)
+        self.assertEqual(out["pool"], {"pool_size": 2, "pool_timeout": 10, "reset_session": True})
+
+    def test_pool_absent_leaves_config_unchanged(self):
+        cfg = {"server_infos": {"c1": self._base_server()}}
+        self.assertNotIn("pool", fill_config_defaults(cfg))
+
+    def test_pool_invalid_settings_raise(self):
+        for pool in ({"pool_size": 0}, {"pool_size": 33}, {"pool_timeout": 0}, {"max_idle": 1}):
+            cfg = {"server_infos": {"c1": self._base_server()}, "pool": pool}
+            with self.assertRaises(Exception) as ctx:
+                fill_config_defaults(cfg)
+            self.assertIn("Config pool", str(ctx.exception))
+
+    def test_bastion_managed_settings(self):
+        bastion = {
+            "bastion_host": "bhost",
+            "bastion_username": "buser",
+            "private_key_path": "/path/key",
+            "db_host": "db.remote",
+            "managed": True,
+            "keepalive_interval": 15,
+        }
+        out = fill_config_defaults({"server_infos": {"c1": self._base_server()}, "bastion": bastion})
+        self.assertTrue(out["bastion"]["managed"])
+        self.assertNotIn("connect_timeout", out["bastion"])
+        for bad in ({"managed": "yes"}, {"keepalive_interval": 0}, {"connect_timeout": True}, {"reconnect": 1}):
+            cfg = {"server_infos": {"c1": self._base_server()}, "bastion": {**bastion, **bad}}
+            with self.assertRaises(Exception) as ctx:
+                fill_config_defaults(cfg)
+            self.assertIn("Config bastion", str(ctx.exception))
+
+    def test_result_cache_defaults_applied(self):
+        cfg = {"server_infos": {"c1": self._base_server()}, "result_cache": {"ttl": 5}}
+        out = fill_config_defaults(cfg)
+        self.assertEqual(out["result_cache"], {"max_bytes": 16 * 1024 * 1024, "ttl": 5})
+
+    def test_result_cache_invalid_settings_raise(self):
+        for cache in ({"max_bytes": 0}, {"ttl": -1}, {"ttl": True}, {"entries": 10}):
+            cfg = {"server_infos": {"c1": self._base_server()}, "result_cache": cache}
+            with self.assertRaises(Exception) as ctx:
+                fill_config_defaults(cfg)
+            self.assertIn("Config result_cache", str(ctx.exception))
+
+
+class _FakeTransport:
+    """paramiko Transport stand-in whose channels are socket pairs echoing back what they receive."""
+
+    def __init__(self):
+        self.active = True
+        self.destinations = []
+
+    def is_active(self):
+        return self.active
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+    def open_channel(self, kind, destination, source, timeout=None):
+        self.destinations.append((kind, destination))
+        ours, theirs = socket.socketpair()
+
+        def echo():
+            with theirs:
+                while data := theirs.recv(1024):
+                    theirs.sendall(data)
+
+        threading.Thread(target=echo, daemon=True).start()
+        return ours
+
+
+class TestSshTunnel(unittest.TestCase):
+    BASTION = {
+        "bastion_host": "bhost",
+        "bastion_username": "buser",
+        "private_key_path": "/path/key",
+        "db_host": "db.internal",
+        "db_port": 3306,
+        "bastion_port": 22,
+        "local_bind_host": "127.0.0.1",
+        "local_bind_port": 0,
+        "managed": True,
+    }
+
+    def setUp(self):
+        self.transports = []
+        self.connect_error = None
+
+        def make_client():
+            client = mock.MagicMock()
+
+            def connect(**kwargs):
+                if self.connect_error is not None:
+                    raise self.connect_error
+                transport = _FakeTransport()
+                self.transports.append(transport)
+                client.get_transport.return_value = transport
+
+            client.connect.side_effect = connect
+            return client
+
+        self.paramiko = mock.MagicMock()
+        self.paramiko.SSHClient.side_effect = make_client
+        patcher = mock.patch("oracle.mysql_mcp_server.utils.paramiko", self.paramiko)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_requires_paramiko(self):
+        with mock.patch("oracle.mysql_mcp_server.utils.paramiko", None):
+            with self.assertRaises(Exception) as ctx:
+                m.SshTunnel(self.BASTION)
+        self.assertIn("paramiko", str(ctx.exception))
+
+    def test_forwards_connections_over_one_transport(self):
+        tunnel = m.SshTunnel(self.BASTION)
+        tunnel.start()
+        self.addCleanup(tunnel.stop)
+
+        clients = [socket.create_connection(("127.0.0.1", tunnel.local_port), timeout=5) for _ in range(3)]
+        for i, client in enumerate(clients):
+            client.sendall(f"ping {i}".encode())
+        for i, client in enumerate(clients):
+            self.assertEqual(client.recv(1024), f"ping {i}".encode())
+
+        self.assertEqual(len(self.transports), 1)
+        self.assertEqual(self.transports[0].destinations, [("direct-tcpip", ("db.internal", 3306))] * 3)
+        status = tunnel.status()
+        self.assertTrue(status["active"])
+        self.assertEqual(status["open_channels"], 3)
+        self.assertEqual(status["local_bind"], f"127.0.0.1:{tunnel.local_port}")
+
+        for client in clients:
+            client.close()
+        deadline = time.monotonic() + 5
+        while tunnel.status()["open_channels"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(tunnel.status()["open_channels"], 0)
+
+    def test_concurrent_callers_share_one_reconnect(self):
+        on_reconnect = mock.Mock()
+        tunnel = m.SshTunnel(self.BASTION, on_reconnect=on_reconnect)
+        tunnel.ensure_connected()
+        on_reconnect.assert_not_called()
+
+        self.transports[0].active = False
+        threads = [threading.Thread(target=tunnel.ensure_connected) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(self.transports), 2)
+        self.assertEqual(tunnel.status()["reconnects"], 1)
+        on_reconnect.assert_called_once()
+
+    def test_failed_reconnect_backs_off(self):
+        tunnel = m.SshTunnel(self.BASTION)
+        tunnel.ensure_connected()
+        self.transports[0].active = False
+        self.connect_error = OSError("bastion unreachable")
+        with self.assertRaises(OSError):
+            tunnel.ensure_connected()
+        attempts = self.paramiko.SSHClient.call_count
+        with self.assertRaises(Exception) as ctx:
+            tunnel.ensure_connected()
+        self.assertIn("bastion unreachable", str(ctx.exception))
+        self.assertEqual(self.paramiko.SSHClient.call_count, attempts)  # no new attempt inside the backoff
+        self.assertFalse(tunnel.status()["active"])
+
+    def test_db_connection_waits_for_tunnel(self):
+        cfg = {"server_infos": {"good": {"database": "d", "user": "u", "password": "p", "host": "h", "port": 3306}}}
+        tunnel = mock.Mock()
+        with mock.patch.object(m, "config", cfg), mock.patch.object(m, "config_error_msg", None), \
+                mock.patch.object(m, "_ssh_tunnel", tunnel), \
+                mock.patch.object(m.connector, "connect", return_value=mock.Mock()) as connect_mock:
+            m._get_db_connection("good")
+            tunnel.ensure_connected.assert_called_once()
+
+            tunnel.ensure_connected.side_effect = Exception("SSH tunnel to bhost is down")
+            with self.assertRaises(m.DatabaseConnectionError):
+                m._get_db_connection("good")
+        connect_mock.assert_called_once()
+
+    def test_reconnect_drops_idle_pooled_connections(self):
+        pool = mock.Mock()
+        with mock.patch.object(m, "_pools", {"good": pool}), \
+                mock.patch.object(m, "_probe_cache", {"good": (0.0, {"key": "good"})}) as probe_cache:
+            m._on_ssh_tunnel_reconnect()
+            self.assertEqual(probe_cache, {})
+        pool.close_all.assert_called_once()
+
+    def test_status_tool_and_hint(self):
+        with mock.patch.object(src_module, "_ssh_tunnel", None):
+            self.assertIn("does not manage an SSH tunnel", json.loads(src_module.ssh_tunnel_status())["error"])
+        tunnel = m.SshTunnel(self.BASTION)
+        self.connect_error = OSError("auth failed")
+        with self.assertRaises(OSError):
+            tunnel.ensure_connected()
+        with mock.patch.object(src_module, "_ssh_tunnel", tunnel):
+            self.assertEqual(json.loads(src_module.ssh_tunnel_status())["last_error"], "auth failed")
+            self.assertIn("down and being retried: auth failed", src_module._connection_hint())
+
 
 class TestGetSshCommand(unittest.TestCase):
     def _base_server(self):
@@ -1649,6 +2877,7 @@ class TestHeatwaveAskHelp(unittest.TestCase):
     def test_heatwave_ask_help_success_mocked(self):
         # Mode must be OCI and NL2ML returns a single-row scalar JSON string
         with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.OCI), \
+             mock.patch.object(src_module, "_get_database_connection_cm", new=_fake_connection_cm), \
              mock.patch.object(src_module, "_execute_sql_tool", return_value=json.dumps([[json.dumps({"text": "ok"})]])):
             out = src_module.heatwave_ask_help("cid", "Q")
         self.assertFalse(src_module.check_error(out))
@@ -1657,7 +2886,8 @@ class TestHeatwaveAskHelp(unittest.TestCase):
 
     def test_heatwave_ask_help_mode_not_oci_mocked(self):
         # Non-OCI connections should return an error JSON
-        with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI):
+        with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.MYSQL_AI), \
+             mock.patch.object(src_module, "_get_database_connection_cm", new=_fake_connection_cm):
             out = src_module.heatwave_ask_help("cid", "Q")
         self.assertTrue(src_module.check_error(out))
         self.assertIn("does not support NL2ML", json.loads(out)["error"])
@@ -1665,6 +2895,7 @@ class TestHeatwaveAskHelp(unittest.TestCase):
     def test_heatwave_ask_help_execute_returns_error_mocked(self):
         # If the NL2ML call returns an error JSON, it should be surfaced
         with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.OCI), \
+             mock.patch.object(src_module, "_get_database_connection_cm", new=_fake_connection_cm), \
              mock.patch.object(src_module, "_execute_sql_tool", return_value=json.dumps({"error": "forced"})):
             out = src_module.heatwave_ask_help("cid", "Q")
         self.assertTrue(src_module.check_error(out))
@@ -1673,11 +2904,31 @@ class TestHeatwaveAskHelp(unittest.TestCase):
     def test_heatwave_ask_help_unexpected_rowcount_error_mocked(self):
         # Multiple rows cause fetch_one to raise; tool should return an NL2ML error JSON
         with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.OCI), \
+             mock.patch.object(src_module, "_get_database_connection_cm", new=_fake_connection_cm), \
              mock.patch.object(src_module, "_execute_sql_tool", return_value=json.dumps([["x"], ["y"]])):
             out = src_module.heatwave_ask_help("cid", "Q")
         self.assertTrue(src_module.check_error(out))
         self.assertIn("Error with NL2ML", json.loads(out)["error"])
 
+    def test_heatwave_ask_help_resolves_mode_on_its_own_connection_mocked(self):
+        # The mode lookup and the NL2ML call share the single connection the tool opens
+        opened = []
+
+        @contextlib.contextmanager
+        def cm(_cid):
+            conn = mock.MagicMock()
+            opened.append(conn)
+            yield conn
+
+        with mock.patch.object(src_module, "_get_mode", return_value=src_module.Mode.OCI) as mode_mock, \
+             mock.patch.object(src_module, "_get_database_connection_cm", new=cm), \
+             mock.patch.object(src_module, "_execute_sql_tool", return_value=json.dumps([["{}"]])) as exec_mock:
+            out = src_module.heatwave_ask_help("cid", "Q")
+        self.assertFalse(src_module.check_error(out))
+        self.assertEqual(len(opened), 1)
+        mode_mock.assert_called_once_with("cid", opened[0])
+        self.assertIs(exec_mock.call_args[0][0], opened[0])
+
     @unittest.skipIf(SKIP_OCI, OCI_SKIP_MSG)
     def test_heatwave_ask_help_real_query(self):
         # Issues a real NL2ML query against an OCI-mode connection
@@ -1818,6 +3069,112 @@ class TestRetrieveRelevantSchemaInformation(unittest.TestCase):
         self.assertFalse(src_module.check_error(out), f"retrieve_relevant_schema_information failed: {out}")
         data = json.loads(out)
         self.assertIn("create_statements", data)
+
+
+class TestRetrieveRelevantSchemaLocal(unittest.TestCase):
+    TABLES = [["album", "album table"], ["singer", "table about singers"], ["stadium", ""]]
+    COLUMNS = [
+        ["album", "Album_ID", "int", ""],
+        ["album", "Singer_ID", "int", ""],
+        ["album", "Title", "varchar(100)", ""],
+        ["singer", "Singer_ID", "int", ""],
+        ["singer", "Name", "varchar(50)", ""],
+        ["singer", "Net_Worth_Millions", "double", "Worth in millions $"],
+        ["stadium", "Stadium_ID", "int", ""],
+        ["stadium", "Capacity", "int", "Seats"],
+    ]
+    FOREIGN_KEYS = [["album", "Singer_ID", "db2", "singer", "Singer_ID"]]
+
+    def setUp(self):
+        patcher = mock.patch.object(src_module, "_schema_catalogs", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fingerprint = ["3:1", "8:2", "1:3"]
+        self.executed = []
+
+        def fake_exec(_conn, sql, params=None):
+            self.executed.append(sql)
+            if "CRC32" in sql:
+                return json.dumps([self.fingerprint])
+            if "KEY_COLUMN_USAGE" in sql:
+                return json.dumps(self.FOREIGN_KEYS)
+            if "information_schema.COLUMNS" in sql:
+                return json.dumps(self.COLUMNS)
+            if "information_schema.TABLES" in sql:
+                return json.dumps(self.TABLES)
+            return json.dumps({"error": f"unexpected sql {sql}"})
+
+        @contextlib.contextmanager
+        def cm(_cid):
+            class FakeConn:
+                database = "db2"
+            yield FakeConn()
+
+        for name, patch in (("_get_database_connection_cm", {"new": cm}), ("_execute_sql_tool", {"side_effect": fake_exec})):
+            patcher = mock.patch.object(src_module, name, **patch)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _catalog_loads(self):
+        return len([sql for sql in self.executed if "information_schema.TABLES" in sql and "CRC32" not in sql])
+
+    def test_ranks_tables_and_adds_foreign_key_neighbours(self):
+        out = json.loads(src_module.retrieve_relevant_schema_local("cid", "Which albums have the longest title?", top_k=1))
+        self.assertEqual([t["table"] for t in out["tables"]], ["album", "singer"])
+        self.assertGreater(out["tables"][0]["score"], out["tables"][1]["score"])
+        self.assertEqual(out["schema"], "db2")
+        self.assertNotIn("stadium", out["create_statements"])
+
+    def test_create_statement_format(self):
+        out = json.loads(src_module.retrieve_relevant_schema_local("cid", "singers by net worth", top_k=1))
+        self.assertEqual(out["tables"][0]["table"], "singer")
+        self.assertIn(
+            "CREATE TABLE `db2`.`singer`(\n`Singer_ID` int,\n`Name` varchar(50),\n"
+            "`Net_Worth_Millions` double COMMENT 'Worth in millions $'\n) COMMENT 'table about singers';",
+            out["create_statements"],
+        )
+        self.assertIn("FOREIGN KEY (`Singer_ID`) REFERENCES `db2`.`singer`(`Singer_ID`)", m.SchemaCatalog(
+            "db2", self.TABLES, self.COLUMNS, self.FOREIGN_KEYS).create_statement("album"))
+
+    def test_no_match_returns_no_tables(self):
+        out = json.loads(src_module.retrieve_relevant_schema_local("cid", "weather forecast"))
+        self.assertEqual(out["tables"], [])
+        self.assertEqual(out["create_statements"], "")
+
+    def test_catalog_reused_until_ddl_changes(self):
+        src_module.retrieve_relevant_schema_local("cid", "singer")
+        src_module.retrieve_relevant_schema_local("cid", "album")
+        self.assertEqual(self._catalog_loads(), 1)
+        self.assertEqual(len([sql for sql in self.executed if "CRC32" in sql]), 1)
+
+        # Past the check interval an unchanged fingerprint keeps the catalog
+        with mock.patch.object(src_module, "SCHEMA_CATALOG_CHECK_INTERVAL", 0):
+            src_module.retrieve_relevant_schema_local("cid", "singer")
+            self.assertEqual(self._catalog_loads(), 1)
+
+            self.fingerprint = ["3:1", "9:5", "1:3"]
+            self.COLUMNS = self.COLUMNS + [["stadium", "Concert_Venue", "varchar(20)", ""]]
+            out = json.loads(src_module.retrieve_relevant_schema_local("cid", "concert venue"))
+        self.assertEqual(self._catalog_loads(), 2)
+        self.assertEqual(out["tables"][0]["table"], "stadium")
+
+    def test_refresh_forces_rebuild(self):
+        src_module.retrieve_relevant_schema_local("cid", "singer")
+        src_module.retrieve_relevant_schema_local("cid", "singer", refresh=True)
+        self.assertEqual(self._catalog_loads(), 2)
+
+    def test_errors(self):
+        self.assertIn("top_k", json.loads(src_module.retrieve_relevant_schema_local("cid", "singer", top_k=0))["error"])
+        self.fingerprint = None
+        with mock.patch.object(src_module, "_execute_sql_tool", return_value=json.dumps({"error": "denied"})):
+            out = src_module.retrieve_relevant_schema_local("cid", "singer")
+        self.assertIn("Error building schema catalog", json.loads(out)["error"])
+
+    def test_search_terms(self):
+        self.assertEqual(
+            search_terms("How many NetWorth_Millions in album_tracks?"),
+            ["net", "worth", "million", "album", "track"],
+        )
             
 
 if __name__ == "__main__":
@@ -3,13 +3,53 @@ Copyright (c) 2025, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at http://oss.oracle.com/licenses/upl.
 """
 
+import contextlib
 import copy
+import csv
+import queue
+import select
+import socket
+import threading
+import time
 
-from typing import Optional
+from collections import OrderedDict
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Optional
 from enum import Enum
 import json
+import math
 import os
+import re
 import oci
+from mysql.connector import FieldType
+
+try:
+    import orjson
+except ImportError:  # optional; compact output falls back to the json module
+    orjson = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # optional; only needed by bulk_load for Parquet files
+    pq = None
+
+try:
+    import paramiko
+except ImportError:  # optional; only needed when the bastion block sets "managed": true
+    paramiko = None
+
+MAX_POOL_SIZE = 32
+
+# Output formats for SQL results:
+#   rows:         [[v, ...], ...] (no column names)
+#   columnar:     {"columns": [...], "types": [...], "rows": [[v, ...], ...]}
+#   column_major: {"columns": [...], "types": [...], "data": [[values of column 0], ...]}
+OUTPUT_FORMATS = ("rows", "columnar", "column_major")
+
+# File formats bulk_load can read
+BULK_LOAD_FORMATS = ("csv", "parquet")
 
 class OciInfo:
 
@@ -24,6 +64,88 @@ class OciInfo:
         )
         self.tenancy_id = os.getenv("TENANCY_ID_OVERRIDE", self.oci_config["tenancy"])
 
+class OciCache:
+    """
+    TTL cache for OCI lookups that rarely change: the Object Storage namespace and the compartment tree.
+
+    Entries belong to the OciInfo they were loaded with; passing a different OciInfo starts a fresh cache.
+    Failed lookups are not cached.
+
+    Args:
+      ttl (float): Seconds an entry stays valid.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._owner = None
+        self._entries = {}
+
+    def get(self, oci_info, key: str, loader: Callable, ttl: Optional[float] = None):
+        """Return the cached value for key, calling loader() when it is missing or older than ttl (default self.ttl)."""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            if self._owner is not oci_info:
+                self._owner = oci_info
+                self._entries = {}
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+
+        value = loader()
+        with self._lock:
+            if self._owner is oci_info:
+                self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+    def namespace(self, oci_info) -> str:
+        """The tenancy's Object Storage namespace."""
+        return self.get(
+            oci_info, "namespace", lambda: oci_info.object_storage_client.get_namespace().data
+        )
+
+    def compartment_tree(self, oci_info) -> dict:
+        """
+        Active, accessible compartments in the tenancy subtree (every page) plus the root tenancy compartment.
+
+        Returns:
+          dict: {"compartments": [Compartment, ...], "by_name": {lower-cased name: Compartment}}.
+            When names repeat, by_name keeps the first compartment listed, root last.
+        """
+
+        def load() -> dict:
+            compartments = list(
+                oci.pagination.list_call_get_all_results(
+                    oci_info.identity_client.list_compartments,
+                    compartment_id=oci_info.tenancy_id,
+                    compartment_id_in_subtree=True,
+                    access_level="ACCESSIBLE",
+                    lifecycle_state="ACTIVE",
+                ).data
+            )
+            compartments.append(
+                oci_info.identity_client.get_compartment(compartment_id=oci_info.tenancy_id).data
+            )
+            by_name = {}
+            for compartment in compartments:
+                by_name.setdefault(compartment.name.lower(), compartment)
+            return {"compartments": compartments, "by_name": by_name}
+
+        return self.get(oci_info, "compartment_tree", load)
+
+    def compartment_by_name(self, oci_info, compartment_name: str):
+        """Case-insensitive compartment lookup in the cached tree; None if not found."""
+        return self.compartment_tree(oci_info)["by_name"].get(compartment_name.lower())
+
+
 def fill_config_defaults(config : dict) -> dict:
     """
     Validate and normalize the MySQL MCP server configuration.
@@ -34,6 +156,8 @@ def fill_config_defaults(config : dict) -> dict:
       - Ensures each server entry includes exactly the required keys:
         {"host", "user", "password", "database", "port"}.
       - If a "bastion" block is present, applies defaults and validates allowed/required keys.
+      - If a "pool" block is present, applies defaults and validates the pool settings.
+      - If a "result_cache" block is present, applies defaults and validates the cache settings.
 
     Args:
       config (dict): Raw configuration object loaded from JSON.
@@ -46,6 +170,8 @@ def fill_config_defaults(config : dict) -> dict:
         - If "server_infos" is missing or empty
         - If any server entry is missing required keys or contains extras
         - If the "bastion" block has invalid/missing keys
+        - If the "pool" block has unknown keys or out-of-range values
+        - If the "result_cache" block has unknown keys or out-of-range values
 
     Expected schema:
       {
@@ -67,7 +193,19 @@ def fill_config_defaults(config : dict) -> dict:
           "db_port": 3306,                   # optional; default 3306
           "bastion_port": 22,                # optional; default 22
           "local_bind_host": "127.0.0.1",    # optional; default 127.0.0.1
-          "local_bind_port": 3306            # optional; default 3306
+          "local_bind_port": 3306,           # optional; default 3306
+          "managed": false,                  # optional; run the tunnel inside the server (needs paramiko)
+          "keepalive_interval": 30,          # optional; seconds between keepalives of a managed tunnel
+          "connect_timeout": 10              # optional; seconds to wait for the bastion when (re)connecting
+        },
+        "pool": {                            # optional; reuse connections per connection_id
+          "pool_size": 5,                    # optional; default 5, between 1 and 32
+          "pool_timeout": 10,                # optional; seconds to wait for a free connection
+          "reset_session": true              # optional; reset session state between borrowers
+        },
+        "result_cache": {                    # optional; cache read-only query results
+          "max_bytes": 16777216,             # optional; default 16 MiB of cached JSON results
+          "ttl": 30                          # optional; default 30 seconds a result is reused
         }
       }
 
@@ -112,8 +250,66 @@ def fill_config_defaults(config : dict) -> dict:
             'local_bind_host', 'local_bind_port'
         ])
 
-        if bastion_keys != set(bastion_info.keys()):
-            raise Exception(f"Config bastion must specify all keys in {bastion_required_keys} and only keys in {bastion_keys}")
+        # Settings of the in-process tunnel; without them the tunnel is left to the user (see get_ssh_command)
+        bastion_managed_keys = set(['managed', 'keepalive_interval', 'connect_timeout'])
+
+        if not bastion_keys <= set(bastion_info.keys()) <= bastion_keys | bastion_managed_keys:
+            raise Exception(
+                f"Config bastion must specify all keys in {bastion_required_keys} and only keys in "
+                f"{bastion_keys | bastion_managed_keys}"
+            )
+
+        if not isinstance(bastion_info.get('managed', False), bool):
+            raise Exception("Config bastion managed must be true or false")
+
+        for key in ('keepalive_interval', 'connect_timeout'):
+            value = bastion_info.get(key, 1)
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+                raise Exception(f"Config bastion {key} must be a positive number of seconds")
+
+    pool_info = config.get("pool")
+    if pool_info is not None:
+        pool_defaults = {
+            'pool_size': 5,
+            'pool_timeout': 10,
+            'reset_session': True,
+        }
+        for key, value in pool_defaults.items():
+            pool_info.setdefault(key, value)
+
+        if set(pool_defaults.keys()) != set(pool_info.keys()):
+            raise Exception(f"Config pool may only specify keys in {set(pool_defaults.keys())}")
+
+        pool_size = pool_info['pool_size']
+        if not isinstance(pool_size, int) or isinstance(pool_size, bool) or not 1 <= pool_size <= MAX_POOL_SIZE:
+            raise Exception(f"Config pool_size must be an integer between 1 and {MAX_POOL_SIZE}")
+
+        pool_timeout = pool_info['pool_timeout']
+        if not isinstance(pool_timeout, (int, float)) or isinstance(pool_timeout, bool) or pool_timeout <= 0:
+            raise Exception("Config pool_timeout must be a positive number of seconds")
+
+        if not isinstance(pool_info['reset_session'], bool):
+            raise Exception("Config reset_session must be true or false")
+
+    cache_info = config.get("result_cache")
+    if cache_info is not None:
+        cache_defaults = {
+            'max_bytes': 16 * 1024 * 1024,
+            'ttl': 30,
+        }
+        for key, value in cache_defaults.items():
+            cache_info.setdefault(key, value)
+
+        if set(cache_defaults.keys()) != set(cache_info.keys()):
+            raise Exception(f"Config result_cache may only specify keys in {set(cache_defaults.keys())}")
+
+        max_bytes = cache_info['max_bytes']
+        if not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes <= 0:
+            raise Exception("Config result_cache max_bytes must be a positive integer")
+
+        ttl = cache_info['ttl']
+        if not isinstance(ttl, (int, float)) or isinstance(ttl, bool) or ttl <= 0:
+            raise Exception("Config result_cache ttl must be a positive number of seconds")
 
     return config
 
@@ -236,3 +432,690 @@ class Mode(Enum):
 
 class DatabaseConnectionError(Exception):
     """Raised when a MySQL connection cannot be established."""
+
+
+class ConnectionPool:
+    """
+    Bounded pool of MySQL connections for a single connection_id.
+
+    Connections are opened lazily up to pool_size. On checkout an idle connection is
+    health-checked (is_connected pings the server) and replaced if it went stale; on
+    return its session state is reset so the next borrower starts clean.
+
+    Args:
+      connect (Callable): Opens a new connection, e.g. lambda: connector.connect(**info).
+      pool_size (int): Maximum number of connections open at once.
+      pool_timeout (float): Seconds to wait for a free connection before giving up.
+      reset_session (bool): Reset session state (variables, temp tables, autocommit) on return.
+    """
+
+    def __init__(self, connect: Callable, pool_size: int, pool_timeout: float, reset_session: bool = True):
+        self._connect = connect
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+        self.reset_session = reset_session
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._idle = queue.LifoQueue()
+
+    def acquire(self) -> "PooledConnection":
+        """
+        Borrow a healthy connection, opening one if no idle connection is available.
+
+        Raises:
+          DatabaseConnectionError: If no connection frees up within pool_timeout.
+          Exception: Whatever the connect callable raises when opening a new connection.
+        """
+        if not self._slots.acquire(timeout=self.pool_timeout):
+            raise DatabaseConnectionError(
+                f"Connection pool exhausted: all {self.pool_size} connections are busy after waiting {self.pool_timeout}s"
+            )
+        try:
+            while True:
+                try:
+                    cnx = self._idle.get_nowait()
+                except queue.Empty:
+                    cnx = self._connect()
+                    break
+                if _is_healthy(cnx):
+                    break
+                _close_quietly(cnx)
+        except BaseException:
+            self._slots.release()
+            raise
+        return PooledConnection(self, cnx)
+
+    def release(self, cnx) -> None:
+        """Return a borrowed connection, dropping it if its session cannot be reset."""
+        try:
+            if self.reset_session:
+                cnx.reset_session()
+                # The reset restores the server default; restore the connector default too
+                cnx.autocommit = False
+            self._idle.put(cnx)
+        except Exception:
+            _close_quietly(cnx)
+        finally:
+            self._slots.release()
+
+    def discard(self, cnx) -> None:
+        """Close a borrowed connection instead of returning it, e.g. when it has unread results."""
+        try:
+            _close_quietly(cnx)
+        finally:
+            self._slots.release()
+
+    def close_all(self) -> None:
+        """Close every idle connection. Borrowed connections are returned as usual."""
+        while True:
+            try:
+                _close_quietly(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+class PooledConnection:
+    """
+    Connection borrowed from a ConnectionPool.
+
+    Attribute reads and writes go to the underlying connection, so it can be used
+    anywhere a MySQLConnection is expected; close() returns it to the pool instead
+    of closing it.
+    """
+
+    def __init__(self, pool: ConnectionPool, cnx):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_cnx", cnx)
+
+    def __getattr__(self, name):
+        return getattr(self._cnx, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._cnx, name, value)
+
+    def close(self) -> None:
+        cnx = self._cnx
+        if cnx is not None:
+            object.__setattr__(self, "_cnx", None)
+            self._pool.release(cnx)
+
+    def discard(self) -> None:
+        cnx = self._cnx
+        if cnx is not None:
+            object.__setattr__(self, "_cnx", None)
+            self._pool.discard(cnx)
+
+
+def _is_healthy(cnx) -> bool:
+    try:
+        return cnx.is_connected()
+    except Exception:
+        return False
+
+
+def _close_quietly(cnx) -> None:
+    try:
+        cnx.close()
+    except Exception:
+        pass
+
+
+class CustomJSONEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, Decimal):
+            return str(o)
+        if isinstance(o, (date, datetime)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _json_default(o):
+    if isinstance(o, Decimal):
+        return str(o)
+    if isinstance(o, (date, datetime)):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps_compact(obj) -> str:
+    """
+    Encode obj as compact JSON, using orjson when it is installed.
+
+    Decimal values become strings and dates/datetimes ISO 8601 strings, as with CustomJSONEncoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default).decode("utf-8")
+    return json.dumps(obj, default=_json_default, separators=(",", ":"))
+
+
+def column_types(description) -> list:
+    """MySQL type names (e.g. "LONGLONG", "VAR_STRING", "NEWDECIMAL") for a cursor.description."""
+    return [FieldType.get_info(column[1]) for column in description]
+
+
+def format_result(columns: list, types: list, rows: list, output_format: str) -> dict:
+    """
+    Shape a result set for the "columnar" or "column_major" output format.
+
+    Args:
+      columns (list): Column names.
+      types (list): MySQL type names, one per column.
+      rows (list): Row tuples.
+      output_format (str): "columnar" or "column_major".
+
+    Returns:
+      dict: {"columns", "types", "rows"} or {"columns", "types", "data"} with one array per column.
+    """
+    if output_format == "columnar":
+        return {"columns": columns, "types": types, "rows": rows}
+    if output_format == "column_major":
+        data = [list(values) for values in zip(*rows)] if rows else [[] for _ in columns]
+        return {"columns": columns, "types": types, "data": data}
+    raise ValueError(f"Unsupported output_format '{output_format}'. Valid formats are: {', '.join(OUTPUT_FORMATS)}.")
+
+
+# Words that say how to answer rather than what the question is about
+_SCHEMA_STOPWORDS = frozenset(
+    """
+    a an and any are as at be been by can did do does each every find for from get give had has have
+    how i in into is it its list many me more most much my of on or our per show than that the their
+    them then there these this those to top total was we were what when where which who whom whose
+    why with all number count average avg sum least
+    """.split()
+)
+
+
+def _stem(word: str) -> str:
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("ses", "xes", "ches", "shes")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def search_terms(text: str) -> list:
+    """
+    Split free text or identifiers into lower-cased, singular search terms.
+
+    snake_case and camelCase identifiers are split into words ("NetWorth_Millions" -> net, worth, million)
+    and stopwords are dropped.
+    """
+    words = re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+", text or "")
+    return [_stem(w.lower()) for w in words if len(w) > 1 and w.lower() not in _SCHEMA_STOPWORDS]
+
+
+class SchemaCatalog:
+    """
+    Tables, columns, comments and foreign keys of one schema, with a keyword index for ranking tables
+    against a question locally (no HeatWave ML or embeddings).
+
+    Args:
+      schema (str): Schema name.
+      tables (list): (table_name, table_comment) rows from information_schema.TABLES.
+      columns (list): (table_name, column_name, column_type, column_comment) rows from information_schema.COLUMNS,
+        in ordinal order.
+      foreign_keys (list): (table_name, column_name, referenced_schema, referenced_table, referenced_column) rows
+        from information_schema.KEY_COLUMN_USAGE.
+      fingerprint: Value identifying the schema's DDL state when the catalog was read.
+    """
+
+    # Where a term appears matters: a table named after it beats a column, which beats a comment
+    TABLE_NAME_WEIGHT = 3.0
+    COLUMN_NAME_WEIGHT = 2.0
+    COMMENT_WEIGHT = 1.0
+
+    def __init__(self, schema: str, tables: list, columns: list, foreign_keys: list, fingerprint=None):
+        self.schema = schema
+        self.fingerprint = fingerprint
+        self.tables = {name: {"comment": comment or "", "columns": [], "foreign_keys": []} for name, comment in tables}
+        for table, column, column_type, comment in columns:
+            if table in self.tables:
+                self.tables[table]["columns"].append((column, column_type, comment or ""))
+        for table, column, ref_schema, ref_table, ref_column in foreign_keys:
+            if table in self.tables:
+                self.tables[table]["foreign_keys"].append((column, ref_schema, ref_table, ref_column))
+
+        # term -> {table: weight}, keeping the strongest place each term occurs in a table
+        self._postings = {}
+        for table, info in self.tables.items():
+            weighted = [(table, self.TABLE_NAME_WEIGHT), (info["comment"], self.COMMENT_WEIGHT)]
+            for column, _, comment in info["columns"]:
+                weighted += [(column, self.COLUMN_NAME_WEIGHT), (comment, self.COMMENT_WEIGHT)]
+            for text, weight in weighted:
+                for term in search_terms(text):
+                    postings = self._postings.setdefault(term, {})
+                    postings[table] = max(postings.get(table, 0.0), weight)
+
+    def rank(self, question: str, top_k: int = 5) -> list:
+        """
+        Score tables against the question and return the best top_k as [(table, score)], highest first.
+
+        Terms are weighted by where they occur and by rarity across tables (idf); a term that is a prefix of an
+        indexed term (or the reverse, 4+ characters) counts half. Tables referenced by a foreign key of a chosen
+        table are added with half that table's score, so joins can be written.
+        """
+        n_tables = max(len(self.tables), 1)
+        scores = {}
+        for term in set(search_terms(question)):
+            matches = [(term, 1.0)] if term in self._postings else []
+            if len(term) >= 4:
+                matches += [
+                    (indexed, 0.5)
+                    for indexed in self._postings
+                    if indexed != term and len(indexed) >= 4 and (indexed.startswith(term) or term.startswith(indexed))
+                ]
+            for indexed, factor in matches:
+                postings = self._postings[indexed]
+                idf = math.log(1 + n_tables / len(postings))
+                for table, weight in postings.items():
+                    scores[table] = scores.get(table, 0.0) + weight * idf * factor
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+        chosen = dict(ranked)
+        for table, score in ranked:
+            for _, ref_schema, ref_table, _ in self.tables[table]["foreign_keys"]:
+                if ref_schema == self.schema and ref_table in self.tables and ref_table not in chosen:
+                    chosen[ref_table] = score / 2
+        return [(table, round(score, 3)) for table, score in sorted(chosen.items(), key=lambda item: (-item[1], item[0]))]
+
+    def create_statement(self, table: str) -> str:
+        """CREATE TABLE text for a table, in the layout ML_RETRIEVE_SCHEMA_METADATA uses."""
+        info = self.tables[table]
+        lines = []
+        for column, column_type, comment in info["columns"]:
+            line = f"`{column}` {column_type}"
+            if comment:
+                line += " COMMENT '" + comment.replace("'", "''") + "'"
+            lines.append(line)
+        for column, ref_schema, ref_table, ref_column in info["foreign_keys"]:
+            lines.append(f"FOREIGN KEY (`{column}`) REFERENCES `{ref_schema}`.`{ref_table}`(`{ref_column}`)")
+        statement = f"CREATE TABLE `{self.schema}`.`{table}`(\n" + ",\n".join(lines) + "\n)"
+        if info["comment"]:
+            statement += " COMMENT '" + info["comment"].replace("'", "''") + "'"
+        return statement + ";"
+
+
+# Statements whose result only depends on the data they read
+_READ_ONLY_STATEMENT = re.compile(r"^\s*(SELECT|SHOW|DESCRIBE|DESC)\b", re.IGNORECASE)
+# Anything that makes a read-only statement's result vary between runs, or gives it side effects
+_UNCACHEABLE_SQL = re.compile(
+    r"\b(NOW|SYSDATE|CURDATE|CURTIME|CURRENT_DATE|CURRENT_TIME|CURRENT_TIMESTAMP|LOCALTIME|LOCALTIMESTAMP"
+    r"|UTC_DATE|UTC_TIME|UTC_TIMESTAMP|UNIX_TIMESTAMP|RAND|RANDOM_BYTES|UUID|UUID_SHORT|LAST_INSERT_ID"
+    r"|FOUND_ROWS|ROW_COUNT|CONNECTION_ID|SLEEP|GET_LOCK|RELEASE_LOCK|IS_FREE_LOCK|IS_USED_LOCK|BENCHMARK"
+    r"|ML_\w+)\s*\("
+    r"|\b(CURRENT_DATE|CURRENT_TIME|CURRENT_TIMESTAMP|LOCALTIME|LOCALTIMESTAMP|CURRENT_USER)\b"
+    r"|\bFOR\s+(UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b|\bINTO\b|@",
+    re.IGNORECASE,
+)
+
+
+def _strip_sql_literals_and_comments(sql_script: str) -> Optional[str]:
+    """
+    The code of a script with every string literal replaced by '' and every comment by a space.
+
+    Quoted strings and `identifiers` are skipped before looking for comments, so a '#' or '--' inside them
+    is kept as data. Returns None when the script cannot be split cleanly: an unterminated literal or
+    comment, a backslash inside a literal (its meaning depends on NO_BACKSLASH_ESCAPES) or a /*! ... */
+    comment, whose content MySQL executes.
+    """
+    out = []
+    i, n = 0, len(sql_script)
+    while i < n:
+        ch = sql_script[i]
+        if ch in "'\"`":
+            end = i + 1
+            while True:
+                end = sql_script.find(ch, end)
+                if end < 0:
+                    return None
+                if end + 1 < n and sql_script[end + 1] == ch:  # doubled quote inside the literal
+                    end += 2
+                    continue
+                break
+            literal = sql_script[i : end + 1]
+            if "\\" in literal:
+                return None
+            out.append(literal if ch == "`" else "''")
+            i = end + 1
+        elif sql_script.startswith("/*", i):
+            end = sql_script.find("*/", i + 2)
+            if end < 0 or sql_script.startswith("/*!", i):
+                return None
+            out.append(" ")
+            i = end + 2
+        elif ch == "#" or (sql_script.startswith("--", i) and (i + 2 == n or sql_script[i + 2] in " \t\r\n")):
+            end = sql_script.find("\n", i)
+            out.append(" ")
+            i = n if end < 0 else end
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+
+def is_read_only_sql(sql_script: str) -> bool:
+    """
+    True if a script is a single SELECT/SHOW/DESCRIBE whose result can be reused.
+
+    Statements calling non-deterministic or session-dependent functions (NOW(), RAND(), UUID(), ML_*(), ...),
+    reading or setting @variables, locking rows or writing INTO a file or variable are not read-only here,
+    and neither is a script with a ';' outside a literal or one that cannot be split cleanly into code,
+    literals and comments.
+    """
+    sql = _strip_sql_literals_and_comments(sql_script or "")
+    if sql is None:
+        return False
+    sql = sql.strip().rstrip(";").strip()
+    if ";" in sql or not _READ_ONLY_STATEMENT.match(sql):
+        return False
+    return _UNCACHEABLE_SQL.search(sql) is None
+
+
+class ResultCache:
+    """
+    LRU cache of encoded query results, bounded by their total size in bytes, with a TTL per entry.
+
+    Keys are tuples whose first item is the connection_id, so invalidate(connection_id) can drop every
+    result read through one connection.
+
+    Args:
+      max_bytes (int): Largest total size of cached results; least recently used entries are evicted first.
+        A single result larger than this is not cached.
+      ttl (float): Seconds a result is reused.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires at, result, size)
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, result: str) -> None:
+        size = len(result.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, result, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, connection_id: str) -> None:
+        """Drop every result read through connection_id, e.g. after it ran a write."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == connection_id]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else None,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+            }
+
+    def _remove(self, key: tuple) -> None:
+        self._bytes -= self._entries.pop(key)[2]
+
+
+@contextlib.contextmanager
+def open_bulk_file(file_path: str, file_format: str, batch_size: int, delimiter: str = ",", header: bool = True):
+    """
+    Open a CSV or Parquet file for streaming in batches of rows.
+
+    CSV values are read as strings, except \\N which is read as NULL (as LOAD DATA does). Parquet files need pyarrow.
+
+    Args:
+      file_path (str): Path of the file on the MCP server host.
+      file_format (str): One of BULK_LOAD_FORMATS.
+      batch_size (int): Rows per batch.
+      delimiter (str): CSV field delimiter.
+      header (bool): Whether the first CSV line holds column names. Parquet files always name their columns.
+
+    Yields:
+      tuple: (column names or None for a CSV without header, iterator of lists of row tuples)
+    """
+    if file_format == "csv":
+        with open(file_path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            columns = next(reader, None) if header else None
+
+            def batches():
+                batch = []
+                for row in reader:
+                    batch.append(tuple(None if value == "\\N" else value for value in row))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+
+            yield columns, batches()
+    elif file_format == "parquet":
+        if pq is None:
+            raise Exception("Reading Parquet files requires pyarrow (pip install pyarrow)")
+        with open(file_path, "rb") as f:
+            parquet_file = pq.ParquetFile(f)
+            batches = (
+                list(zip(*(column.to_pylist() for column in record_batch.columns)))
+                for record_batch in parquet_file.iter_batches(batch_size=batch_size)
+            )
+            yield list(parquet_file.schema_arrow.names), batches
+    else:
+        raise ValueError(f"Unsupported format '{file_format}'. Valid formats are: {', '.join(BULK_LOAD_FORMATS)}.")
+
+
+class SshTunnel:
+    """
+    In-process SSH port forward from local_bind_host:local_bind_port to db_host:db_port through the bastion.
+
+    One SSH transport carries every MySQL connection accepted on the local port, each as its own channel.
+    A monitor thread reconnects the transport when it drops. Callers of ensure_connected share a single
+    reconnect attempt, and after a failure further attempts back off exponentially (up to MAX_RECONNECT_DELAY)
+    instead of every new connection retrying the bastion.
+
+    Args:
+      bastion (dict): The "bastion" config block after fill_config_defaults.
+      on_reconnect (Callable, optional): Called after the transport was re-established (not on the first connect),
+        e.g. to drop pooled connections that went through the old transport.
+    """
+
+    MAX_RECONNECT_DELAY = 60
+    BUFFER_SIZE = 32768
+
+    def __init__(self, bastion: dict, on_reconnect: Optional[Callable] = None):
+        if paramiko is None:
+            raise Exception("A managed SSH tunnel requires paramiko (pip install paramiko)")
+        self.bastion = bastion
+        self.keepalive_interval = bastion.get("keepalive_interval", 30)
+        self.connect_timeout = bastion.get("connect_timeout", 10)
+        self.local_port = bastion["local_bind_port"]  # the bound port once started, if configured as 0
+        self._on_reconnect = on_reconnect
+        self._connect_lock = threading.Lock()
+        self._client = None
+        self._transport = None
+        self._listener = None
+        self._stopped = threading.Event()
+        self._connected_once = False
+        self._retry_at = 0.0
+        self._retry_delay = 1.0
+        self._last_error = None
+        self._reconnects = 0
+        self._channels = 0
+        self._channels_lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Listen on the local port and connect to the bastion.
+
+        A bastion that is unreachable at start-up is retried in the background; failing to bind the local
+        port raises.
+        """
+        self._listener = socket.create_server((self.bastion["local_bind_host"], self.bastion["local_bind_port"]))
+        self._listener.settimeout(1.0)
+        self.local_port = self._listener.getsockname()[1]
+        try:
+            self.ensure_connected()
+        except Exception:
+            pass  # recorded in last_error; the monitor keeps retrying
+        threading.Thread(target=self._accept_loop, name="ssh-tunnel-accept", daemon=True).start()
+        threading.Thread(target=self._monitor_loop, name="ssh-tunnel-monitor", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._listener is not None:
+            _close_quietly(self._listener)
+        if self._client is not None:
+            _close_quietly(self._client)
+
+    def is_active(self) -> bool:
+        transport = self._transport
+        return transport is not None and transport.is_active()
+
+    def ensure_connected(self):
+        """
+        Return the live SSH transport, reconnecting if it dropped.
+
+        Raises:
+          Exception: If the bastion cannot be reached, or a recent attempt failed and the backoff has not passed.
+        """
+        if self.is_active():
+            return self._transport
+        reconnected = False
+        with self._connect_lock:
+            # Another caller may have reconnected while this one waited for the lock
+            if not self.is_active():
+                if time.monotonic() < self._retry_at:
+                    raise Exception(f"SSH tunnel to {self.bastion['bastion_host']} is down: {self._last_error}")
+                try:
+                    self._connect()
+                except Exception as e:
+                    self._last_error = str(e)
+                    self._retry_at = time.monotonic() + self._retry_delay
+                    self._retry_delay = min(self._retry_delay * 2, self.MAX_RECONNECT_DELAY)
+                    raise
+                self._retry_delay = 1.0
+                reconnected = self._connected_once
+                self._connected_once = True
+                if reconnected:
+                    self._reconnects += 1
+            transport = self._transport
+        if reconnected and self._on_reconnect is not None:
+            self._on_reconnect()
+        return transport
+
+    def status(self) -> dict:
+        bastion = self.bastion
+        return {
+            "active": self.is_active(),
+            "bastion": f"{bastion['bastion_username']}@{bastion['bastion_host']}:{bastion['bastion_port']}",
+            "local_bind": f"{bastion['local_bind_host']}:{self.local_port}",
+            "remote": f"{bastion['db_host']}:{bastion['db_port']}",
+            "open_channels": self._channels,
+            "reconnects": self._reconnects,
+            "last_error": self._last_error,
+        }
+
+    def _connect(self) -> None:
+        bastion = self.bastion
+        client = paramiko.SSHClient()
+        # Like the ssh command, only connect to a bastion whose host key is already known
+        client.load_system_host_keys()
+        client.set_missing_host_key_policy(paramiko.RejectPolicy())
+        client.connect(
+            hostname=bastion["bastion_host"],
+            port=bastion["bastion_port"],
+            username=bastion["bastion_username"],
+            key_filename=bastion["private_key_path"],
+            timeout=self.connect_timeout,
+            banner_timeout=self.connect_timeout,
+            auth_timeout=self.connect_timeout,
+            look_for_keys=False,
+        )
+        transport = client.get_transport()
+        transport.set_keepalive(self.keepalive_interval)
+        old_client, self._client, self._transport = self._client, client, transport
+        if old_client is not None:
+            _close_quietly(old_client)
+
+    def _monitor_loop(self) -> None:
+        while not self._stopped.wait(1.0):
+            if not self.is_active():
+                try:
+                    self.ensure_connected()
+                except Exception:
+                    pass  # retried once the backoff passes
+
+    def _accept_loop(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                sock, address = self._listener.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return  # listener closed by stop()
+            threading.Thread(target=self._forward, args=(sock, address), name="ssh-tunnel-forward", daemon=True).start()
+
+    def _forward(self, sock, address) -> None:
+        try:
+            channel = self.ensure_connected().open_channel(
+                "direct-tcpip",
+                (self.bastion["db_host"], self.bastion["db_port"]),
+                address,
+                timeout=self.connect_timeout,
+            )
+        except Exception as e:
+            self._last_error = str(e)
+            _close_quietly(sock)
+            return
+
+        with self._channels_lock:
+            self._channels += 1
+        try:
+            while not self._stopped.is_set():
+                readable, _, _ = select.select([sock, channel], [], [], 1.0)
+                for source, sink in ((sock, channel), (channel, sock)):
+                    if source in readable:
+                        data = source.recv(self.BUFFER_SIZE)
+                        if not data:
+                            return
+                        sink.sendall(data)
+        except OSError:
+            pass  # either side went away; MySQL sees a closed connection
+        finally:
+            with self._channels_lock:
+                self._channels -= 1
+            _close_quietly(channel)
+            _close_quietly(sock)
@@ -0,0 +1,336 @@
+"""
+Copyright (c) 2025, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at http://oss.oracle.com/licenses/upl.
+
+Benchmarks for the fuzzy price-list search (search_items)
+- Speed: builds a synthetic catalog shaped like cetools items (default 20,000 items), times the
+  indexed search_items against the previous linear scan (linear_search_items) and checks both
+  return the same hits for every query
+- Quality: runs labelled queries (LABELLED_QUERIES) against a catalog fixture and reports
+  precision@k, recall@k and per-query latency, so changes to normalization, SEED aliases or
+  indexing can be compared on both result quality and speed. The bundled fixture is
+  hand-assembled, not a recorded price list: its scores only catch regressions relative to
+  earlier runs and say nothing about search quality on the real catalog (use --catalog with a
+  --write-snapshot file for that)
+Usage:
+  python bench_oci_pricing_search.py [--items N] [--iterations N]
+  python bench_oci_pricing_search.py --quality [--catalog PATH] [--k N] [--iterations N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import importlib.util
+import json
+import os
+import random
+import re
+import statistics
+import time
+from typing import Any
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Synthetic catalog in the --write-snapshot format ({"fetchedAt", "catalogs": {"USD": [items]}}).
+# Hand-assembled from real-looking names and part numbers; not a recorded cetools response.
+DEFAULT_CATALOG = os.path.join(HERE, "fixtures", "catalog-synthetic-USD.json")
+
+
+def load_server():
+    """Load oci-pricing-mcp-server.py as a module (the file name is not importable)."""
+    path = os.path.join(HERE, "oci-pricing-mcp-server.py")
+    spec = importlib.util.spec_from_file_location("oci_pricing_mcp_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+SERVICES = [
+    ("Compute", "Compute - Standard - E4 - OCPU", "OCPU Per Hour"),
+    ("Compute", "Compute - Standard - E5 - Memory", "Gigabyte Per Hour"),
+    ("Compute", "Compute - GPU - A10", "GPU Per Hour"),
+    ("Compute", "Compute - Bare Metal Standard - X9", "OCPU Per Hour"),
+    ("Compute", "Compute - Virtual Machine Standard - A1", "OCPU Per Hour"),
+    ("Storage", "Object Storage - Storage", "Gigabyte Storage Capacity Per Month"),
+    ("Storage", "Object Storage - Requests", "10,000 Requests Per Month"),
+    ("Storage", "Archive Storage", "Gigabyte Storage Capacity Per Month"),
+    ("Storage", "Block Volume - Storage", "Gigabyte Storage Capacity Per Month"),
+    ("Storage", "File Storage", "Gigabyte Storage Capacity Per Month"),
+    ("Database", "Oracle Autonomous Database - ECPU", "ECPU Per Hour"),
+    ("Database", "Oracle Autonomous Database Storage", "Gigabyte Storage Capacity Per Month"),
+    ("Database", "Oracle Autonomous Transaction Processing - ECPU", "ECPU Per Hour"),
+    ("Database", "Oracle Base Database Service - Enterprise", "OCPU Per Hour"),
+    ("Database", "MySQL Database - ECPU", "ECPU Per Hour"),
+    ("Networking", "Load Balancer Base", "Load Balancer Hour"),
+    ("Networking", "Flexible Load Balancer - Bandwidth", "Mbps Per Hour"),
+    ("Networking", "Outbound Data Transfer - Originating in North America", "Gigabyte Per Month"),
+    ("Networking", "FastConnect 10 Gbps", "Port Hour"),
+    ("Networking", "DNS - Zone Management", "1,000,000 Queries"),
+    ("Analytics", "Oracle Analytics Cloud - Professional - OCPU", "OCPU Per Hour"),
+    ("Container", "Kubernetes Engine - Enhanced Cluster", "Cluster Per Hour"),
+    ("AI", "Generative AI - Large Cohere", "10,000 Characters"),
+    ("AI", "Generative AI - Dedicated AI Cluster", "Unit Per Hour"),
+    ("VMware", "Oracle Cloud VMware Solution - Standard", "OCPU Per Hour"),
+]
+
+EDITIONS = ["", " - BYOL", " - Dedicated", " - Reserved", " - Preemptible", " - Free Tier"]
+REGIONS = ["", " - Gov", " - Sovereign", " - EU", " - APAC", " - Dedicated Region"]
+
+QUERIES = [
+    "ADB",
+    "autonomous database",
+    "object storage",
+    "oss",
+    "load balancer",
+    "oke",
+    "genai",
+    "block volume",
+    "compute e4",
+    "bare metal",
+    "mysql",
+    "fastconnect",
+    "archive storage",
+    "dns zone",
+    "analytics cloud",
+    "vmware solution",
+    "gpu a10",
+    "egress",
+    "B88298",
+    "compute standrad e5",
+]
+
+
+def synthetic_catalog(n: int = 20000, seed: int = 7) -> list[dict[str, Any]]:
+    """Deterministic catalog of `n` cetools-shaped items (partNumber/displayName/metricName/...)."""
+    rnd = random.Random(seed)
+    items: list[dict[str, Any]] = []
+    for i in range(n):
+        category, name, metric = SERVICES[i % len(SERVICES)]
+        name += rnd.choice(EDITIONS) + rnd.choice(REGIONS)
+        if i >= len(SERVICES) * len(EDITIONS):
+            name += f" - Variant {i // len(SERVICES)}"
+        items.append(
+            {
+                "partNumber": f"B{88000 + i}",
+                "displayName": name,
+                "metricName": metric,
+                "serviceCategory": category,
+                "currencyCodeLocalizations": [
+                    {
+                        "currencyCode": "USD",
+                        "prices": [{"model": "PAY_AS_YOU_GO", "value": round(rnd.uniform(0.001, 5), 4)}],
+                    }
+                ],
+            }
+        )
+    return items
+
+
+def linear_search_items(
+    server,
+    items: list[dict[str, Any]],
+    query: str,
+    limit: int = 12,
+    prefer_currency: str | None = None,
+) -> list[dict[str, Any]]:
+    """Reference implementation: the per-call linear scan search_items used before CatalogIndex."""
+    norm, nospace, acronym = server.norm, server.nospace, server.acronym
+    qn = norm(query)
+    q_is_adb_intent = qn in {"adb", "autonomous db", "autonomousdb"}
+    variants = {qn, nospace(qn), acronym(qn)}
+    for short, full in server.SEED.items():
+        sn, fn = norm(short), norm(full)
+        if qn == sn or qn == fn or fn in qn:
+            variants.update({sn, nospace(sn), fn, nospace(fn)})
+    variants = {v for v in variants if len(v) >= 3}
+
+    res: list[dict[str, Any]] = []
+    for it in items:
+        fields = [
+            str(it.get(k, ""))
+            for k in ("displayName", "serviceCategory", "metricName", "partNumber")
+        ]
+        tn = norm(" ".join(fields))
+        tns = nospace(tn)
+        if q_is_adb_intent:
+            if not (re.search(r"\bautonomous\b", tn) and re.search(r"\bdatabase\b", tn)):
+                continue
+        short = [v for v in variants if 3 <= len(v) <= 4]
+        long = [v for v in variants if len(v) >= 5]
+        hit = (
+            any(re.search(rf"\b{re.escape(v)}\b", tn) for v in short)
+            or any(v in tns for v in long)
+            or any(difflib.SequenceMatcher(a=v, b=tns).ratio() >= 0.90 for v in long)
+        )
+        if hit:
+            sm = server.simplify(it, prefer_currency)
+            if sm not in res:
+                res.append(sm)
+                if len(res) >= limit:
+                    break
+    return res
+
+
+def _ms(values: list[float]) -> dict[str, float]:
+    values = sorted(values)
+    return {
+        "p50": round(statistics.median(values) * 1000, 3),
+        "max": round(values[-1] * 1000, 3),
+    }
+
+
+def bench_search(n_items: int = 20000, iterations: int = 3, limit: int = 12) -> dict[str, Any]:
+    """Time index build, indexed search and linear search on a synthetic catalog."""
+    server = load_server()
+    items = synthetic_catalog(n_items)
+
+    start = time.perf_counter()
+    server.catalog_index(items)
+    build_s = time.perf_counter() - start
+
+    per_query: dict[str, Any] = {}
+    indexed_all: list[float] = []
+    linear_all: list[float] = []
+    mismatches: list[str] = []
+    for q in QUERIES:
+        indexed, linear = [], []
+        for _ in range(iterations):
+            t = time.perf_counter()
+            got = server.search_items(items, q, limit, "USD")
+            indexed.append(time.perf_counter() - t)
+            t = time.perf_counter()
+            want = linear_search_items(server, items, q, limit, "USD")
+            linear.append(time.perf_counter() - t)
+        if got != want:
+            mismatches.append(q)
+        indexed_all += indexed
+        linear_all += linear
+        per_query[q] = {"hits": len(got), "indexed_ms": _ms(indexed), "linear_ms": _ms(linear)}
+
+    return {
+        "items": n_items,
+        "iterations": iterations,
+        "index_build_ms": round(build_s * 1000, 1),
+        "indexed_ms": _ms(indexed_all),
+        "linear_ms": _ms(linear_all),
+        "speedup_p50": round(statistics.median(linear_all) / statistics.median(indexed_all), 1),
+        "mismatches": mismatches,
+        "queries": per_query,
+    }
+
+
+# Relevant partNumbers per query in fixtures/catalog-synthetic-USD.json (what a user means, not
+# what search_items currently returns). Keep in sync when the fixture is edited.
+LABELLED_QUERIES: dict[str, set[str]] = {
+    "adb": {"B95701", "B95703", "B95754", "B95706", "B99060", "B95702"},
+    "autonomous database": {"B95701", "B95703", "B95754", "B95706", "B99060", "B95702"},
+    "object storage": {"B91628", "B91627", "B93000", "B93001"},
+    "oss": {"B91628", "B91627", "B93000", "B93001"},
+    "E5 OCPU": {"B97384"},
+    "E4 memory": {"B93114"},
+    "a1 ocpu": {"B93297"},
+    "block volume": {"B91961", "B91962"},
+    "archive storage": {"B91633"},
+    "file storage": {"B89057"},
+    "load balancer": {"B93030", "B93031", "B96121"},
+    "lb": {"B93030", "B93031", "B96121"},
+    "oke": {"B96545"},
+    "genai": {"B99322", "B99323", "B99324"},
+    "gpu": {"B95909", "B98415"},
+    "fastconnect": {"B88326", "B88327"},
+    "outbound data transfer": {"B88325", "B93455"},
+    "egress": {"B88325", "B93455"},
+    "mysql": {"B92427", "B92426"},
+    "heatwave": {"B92426"},
+    "analytics cloud": {"B89630", "B89631", "B92683"},
+    "dns zone": {"B88525"},
+    "exadata": {"B90777"},
+    "vmware": {"B94175"},
+    "functions": {"B90617", "B90618"},
+    "waf": {"B94579"},
+    "bare metal": {"B93119"},
+    "B93113": {"B93113"},
+}
+
+
+def load_catalog(path: str = DEFAULT_CATALOG, currency: str = "USD") -> list[dict[str, Any]]:
+    """Items from a --write-snapshot file (or a plain JSON list of items)."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data
+    return data["catalogs"][currency]
+
+
+def precision_recall_at_k(returned: list[str], relevant: set[str], k: int) -> tuple[float, float]:
+    """
+    precision@k: relevant share of the top-k results actually returned (1.0 when nothing is
+    returned and nothing is relevant); recall@k: share of min(k, |relevant|) found in the top k.
+    """
+    top = returned[:k]
+    hits = sum(1 for pn in top if pn in relevant)
+    precision = hits / len(top) if top else float(not relevant)
+    recall = hits / min(k, len(relevant)) if relevant else 1.0
+    return precision, recall
+
+
+def bench_quality(
+    catalog_path: str = DEFAULT_CATALOG, k: int = 5, iterations: int = 5
+) -> dict[str, Any]:
+    """precision@k, recall@k and latency per labelled query (search_items, limit=k)."""
+    server = load_server()
+    items = load_catalog(catalog_path)
+    server.catalog_index(items)  # build once, outside the timings
+
+    per_query: dict[str, Any] = {}
+    precisions: list[float] = []
+    recalls: list[float] = []
+    latencies: list[float] = []
+    for q, relevant in LABELLED_QUERIES.items():
+        times = []
+        for _ in range(iterations):
+            t = time.perf_counter()
+            got = server.search_items(items, q, k, "USD")
+            times.append(time.perf_counter() - t)
+        returned = [it["partNumber"] for it in got]
+        p, r = precision_recall_at_k(returned, relevant, k)
+        precisions.append(p)
+        recalls.append(r)
+        latencies += times
+        per_query[q] = {
+            "precision": round(p, 3),
+            "recall": round(r, 3),
+            "latency_ms": _ms(times),
+            "returned": returned,
+            "missed": sorted(relevant - set(returned)),
+        }
+
+    return {
+        "catalog": os.path.relpath(catalog_path, HERE),
+        "items": len(items),
+        "k": k,
+        "iterations": iterations,
+        f"mean_precision@{k}": round(statistics.mean(precisions), 3),
+        f"mean_recall@{k}": round(statistics.mean(recalls), 3),
+        "latency_ms": _ms(latencies),
+        "queries": per_query,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark OCI pricing fuzzy search")
+    ap.add_argument("--items", type=int, default=20000, help="synthetic catalog size")
+    ap.add_argument("--iterations", type=int, default=3, help="runs per query")
+    ap.add_argument("--limit", type=int, default=12, help="search_items limit")
+    ap.add_argument("--quality", action="store_true", help="run the labelled-query quality benchmark")
+    ap.add_argument("--catalog", default=DEFAULT_CATALOG, help="catalog fixture for --quality")
+    ap.add_argument("--k", type=int, default=5, help="cutoff for precision@k / recall@k")
+    args = ap.parse_args()
+    if args.quality:
+        print(json.dumps(bench_quality(args.catalog, args.k, args.iterations), indent=2))
+        return
+    print(json.dumps(bench_search(args.items, args.iterations, args.limit), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,25 @@ OCI Pricing MCP Server
 - Fetch SKU pricing from Oracle's public Price List API (cetools)
 - Falls back to fuzzy name search when direct SKU lookup misses
 - Returns structured JSON for clients to render/phrase
+- Caches the price list per currency (memory + disk, TTL, background refresh, offline snapshot)
 - Note: cetools is a public subset; empty `items` is normal behavior
 """
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import bisect
 import difflib
+import json
 import os
 import re
+import time
 import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from functools import lru_cache
 from typing import Any, TypedDict
 
@@ -35,8 +44,14 @@ try:
 except Exception:
     _HAS_PYCOUNTRY = False
 
+# Optional dep for HTTP/2 (httpx[http2])
+try:
+    import h2  # type: ignore  # noqa: F401
+    _HAS_H2 = True
+except Exception:
+    _HAS_H2 = False
+
 API = "https://apexapps.oracle.com/pls/apex/cetools/api/v1/products/"
-mcp = FastMCP("oci-pricing-mcp")
 
 # -------------------- environment-driven defaults --------------------
 # These allow MCP client config to override defaults via "env".
@@ -45,15 +60,28 @@ mcp = FastMCP("oci-pricing-mcp")
 #       "OCI_PRICING_DEFAULT_CCY": "JPY",
 #       "OCI_PRICING_HTTP_TIMEOUT": "30",
 #       "OCI_PRICING_MAX_PAGES": "6",
-#       "OCI_PRICING_ALT_CCY": "USD"
+#       "OCI_PRICING_ALT_CCY": "USD",
+#       "OCI_PRICING_CONCURRENCY": "8",
+#       "OCI_PRICING_CACHE_TTL": "86400",
+#       "OCI_PRICING_SNAPSHOT": "/path/to/snapshot.json"
 #   }
 DEFAULT_CCY = os.getenv("OCI_PRICING_DEFAULT_CCY", "USD").strip().upper()
 DEFAULT_MAX_PAGES = int(os.getenv("OCI_PRICING_MAX_PAGES", "6"))
 DEFAULT_TIMEOUT = float(os.getenv("OCI_PRICING_HTTP_TIMEOUT", "25"))
 _RETRIES = int(os.getenv("OCI_PRICING_RETRIES", "2"))  # total tries = 1 (initial) + _RETRIES
 _BACKOFF_BASE = float(os.getenv("OCI_PRICING_BACKOFF", "0.5"))  # seconds
+# Max concurrent upstream requests (hit enrichment, batch SKU lookups, page prefetch)
+DEFAULT_CONCURRENCY = int(os.getenv("OCI_PRICING_CONCURRENCY", "8"))
 # Optional alternate currency for reference when requested currency is zero/missing
 ALT_CCY = (os.getenv("OCI_PRICING_ALT_CCY", "").strip().upper() or None)
+# Price-list catalog cache: TTL in seconds (0 disables), on-disk directory ("" disables), offline snapshot
+CACHE_TTL = float(os.getenv("OCI_PRICING_CACHE_TTL", "86400"))
+CACHE_DIR = os.path.expanduser(os.getenv("OCI_PRICING_CACHE_DIR", "~/.cache/oci-pricing-mcp"))
+SNAPSHOT_PATH = (os.getenv("OCI_PRICING_SNAPSHOT", "").strip() or None)
+# Shared HTTP client: HTTP/2 when h2 is installed (set "0" to force HTTP/1.1), pool size, idle keep-alive seconds
+HTTP2 = os.getenv("OCI_PRICING_HTTP2", "1").strip().lower() not in {"0", "false", "no"} and _HAS_H2
+MAX_CONNECTIONS = int(os.getenv("OCI_PRICING_MAX_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.getenv("OCI_PRICING_KEEPALIVE", "60"))
 
 # Minimal alias seed; we avoid maintaining a huge dictionary.
 SEED: dict[str, str] = {
@@ -171,6 +199,49 @@ def _pick_price(
     return None, None, None
 
 
+def _price_tiers(x: dict[str, Any], prefer_currency: str | None = None) -> list[dict[str, Any]]:
+    """
+    All price points for the (model, currency) that _pick_price selects, sorted by rangeMin.
+    Tiered SKUs (e.g., a free first range, then a paid range) list one point per range:
+      [{"value", "rangeMin", "rangeMax"}]  (range bounds are None when the API omits them)
+    """
+    model, _, ccy = _pick_price(x, prefer_currency)
+    if model is None:
+        return []
+    for b in _iter_price_blocks(x):
+        if (b or {}).get("currencyCode") != ccy:
+            continue
+        points = [
+            {"value": pv.get("value"), "rangeMin": pv.get("rangeMin"), "rangeMax": pv.get("rangeMax")}
+            for pv in b.get("prices") or []
+            if pv.get("model") == model and pv.get("value") is not None
+        ]
+        if points:
+            return sorted(points, key=lambda t: float(t["rangeMin"] or 0))
+    return []
+
+
+def _prices_by_currency(x: dict[str, Any], currencies: list[str]) -> dict[str, dict[str, Any]]:
+    """
+    {currency: {"model", "value", "note"?}} for each requested currency the item itself carries
+    (in `prices` or `currencyCodeLocalizations`). Unlike _pick_price there is no fallback to
+    another currency; currencies without a price block are left out.
+    """
+    out: dict[str, dict[str, Any]] = {}
+    for c in currencies:
+        model, value, ccy = _pick_price(x, c)
+        if ccy != c:
+            continue
+        entry: dict[str, Any] = {"model": model, "value": value}
+        try:
+            if float(value) == 0.0:  # type: ignore[arg-type]
+                entry["note"] = "zero-price-or-free-tier-only"
+        except Exception:
+            entry["note"] = "no-unit-price-in-public-subset-or-currency"
+        out[c] = entry
+    return out
+
+
 def simplify(x: dict[str, Any], prefer_currency: str | None = None) -> dict[str, Any]:
     """
     Shape an API item for clients:
@@ -205,6 +276,83 @@ def simplify(x: dict[str, Any], prefer_currency: str | None = None) -> dict[str,
     return out
 
 
+# -------------------- shared HTTP client --------------------
+# One keep-alive pool for all tool calls, so repeated calls skip DNS/TCP/TLS setup.
+# Opened by the server lifespan and closed on shutdown; get_client() also creates it lazily
+# (e.g., impl functions called directly under asyncio.run, where each run has its own loop).
+
+_CLIENT: httpx.AsyncClient | None = None
+_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+HTTP_STATS: dict[str, int] = {"requests": 0, "connections": 0, "tls_handshakes": 0, "http2_requests": 0}
+
+
+async def _trace(event: str, info: dict[str, Any]) -> None:
+    """httpcore trace hook: count new connections vs. requests sent."""
+    if event == "connection.connect_tcp.started":
+        HTTP_STATS["connections"] += 1
+    elif event == "connection.start_tls.started":
+        HTTP_STATS["tls_handshakes"] += 1
+    elif event == "http11.send_request_headers.started":
+        HTTP_STATS["requests"] += 1
+    elif event == "http2.send_request_headers.started":
+        HTTP_STATS["requests"] += 1
+        HTTP_STATS["http2_requests"] += 1
+
+
+async def _attach_trace(request: httpx.Request) -> None:
+    request.extensions["trace"] = _trace
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the running event loop (created on first use)."""
+    global _CLIENT, _CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop:
+        # A client from another (finished) loop cannot be reused; its connections died with it
+        _CLIENT = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            http2=HTTP2,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            event_hooks={"request": [_attach_trace]},
+        )
+        _CLIENT_LOOP = loop
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared client (server shutdown)."""
+    global _CLIENT, _CLIENT_LOOP
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT, _CLIENT_LOOP = None, None
+
+
+def http_stats() -> dict[str, Any]:
+    """Connection-reuse metrics for the shared client since process start."""
+    requests, connections = HTTP_STATS["requests"], HTTP_STATS["connections"]
+    reused = max(requests - connections, 0)
+    return {
+        **HTTP_STATS,
+        "reused": reused,
+        "reuseRatio": round(reused / requests, 3) if requests else None,
+        "http2Enabled": HTTP2,
+        "maxConnections": MAX_CONNECTIONS,
+    }
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    get_client()
+    try:
+        yield {}
+    finally:
+        await close_client()
+
+
 # ---- fetch with light retry & exponential backoff ----
 # Retry only on transient cases: 5xx or network errors.
 
@@ -237,30 +385,376 @@ async def fetch(
             attempt += 1
 
 
+def _next_link(data: dict[str, Any]) -> str | None:
+    """href of APEX `links.rel == "next"`, made absolute; None on the last page."""
+    nxt = next(
+        (
+            lk.get("href")
+            for lk in data.get("links", [])
+            if lk.get("rel") == "next" and lk.get("href")
+        ),
+        None,
+    )
+    if not nxt:
+        return None
+    return nxt if nxt.startswith("http") else f"https://apexapps.oracle.com{nxt}"
+
+
+async def _prefetch_offsets(
+    client: httpx.AsyncClient, first: dict[str, Any], nxt: str, n: int
+) -> list[dict[str, Any]] | None:
+    """
+    Fetch the `n` pages after `first` concurrently by offset (APEX/ORDS offset+limit paging).
+    The page size comes from the first response; the URL template is its `next` link.
+    Returns None when the listing does not paginate by offset or the server ignored the offsets.
+    """
+    limit = first.get("limit") or len(first.get("items") or [])
+    url = httpx.URL(nxt)
+    try:
+        start = int(url.params["offset"])
+    except (KeyError, ValueError):
+        return None
+    if not limit:
+        return None
+    offsets = [start + k * limit for k in range(n)]
+    pages = await _bounded_gather(
+        [lambda o=o: fetch(client, str(url.copy_set_param("offset", str(o)))) for o in offsets],
+        DEFAULT_CONCURRENCY,
+    )
+
+    # Each page must report the offset we asked for (or at least not repeat the first page)
+    head = (first.get("items") or [None])[0]
+    for o, page in zip(offsets, pages):
+        if "offset" in page:
+            if page["offset"] != o:
+                return None
+        elif page.get("items") and page["items"][0] == head:
+            return None
+    return pages
+
+
+async def iter_pages(
+    client: httpx.AsyncClient, currency: str = DEFAULT_CCY, max_pages: int = DEFAULT_MAX_PAGES
+):
+    """
+    Yield {"items", "more"} per page, up to `max_pages`.
+    After the first page, the remaining pages are prefetched concurrently by offset; if the API
+    does not honour offsets, follow APEX `links.rel == "next"` one page at a time instead.
+    """
+    data = await fetch(client, API, {"currencyCode": currency})
+    nxt = _next_link(data)
+    yield {"items": data.get("items") or [], "more": bool(nxt)}
+    if not nxt or max_pages <= 1:
+        return
+
+    pages = await _prefetch_offsets(client, data, nxt, max_pages - 1)
+    if pages is not None:
+        for page in pages:
+            more = bool(_next_link(page))
+            yield {"items": page.get("items") or [], "more": more}
+            if not more:
+                return
+        return
+
+    # Fallback: sequential link-following
+    for _ in range(max_pages - 1):
+        data = await fetch(client, nxt, None)
+        nxt = _next_link(data)
+        yield {"items": data.get("items") or [], "more": bool(nxt)}
+        if not nxt:
+            break
+
+
 async def iter_all(
     client: httpx.AsyncClient, currency: str = DEFAULT_CCY, max_pages: int = DEFAULT_MAX_PAGES
 ):
-    """Follow APEX `links.rel == "next"` up to `max_pages` to avoid over-fetching/latency."""
-    url, params = API, {"currencyCode": currency}
-    for _ in range(max_pages):
-        data = await fetch(client, url, params)
-        for it in data.get("items") or []:
+    """All items of the first `max_pages` pages (bounded to avoid over-fetching/latency)."""
+    async for page in iter_pages(client, currency, max_pages):
+        for it in page["items"]:
             yield it
-        nxt = next(
-            (
-                lk.get("href")
-                for lk in data.get("links", [])
-                if lk.get("rel") == "next" and lk.get("href")
-            ),
-            None,
+
+
+# -------------------- price-list catalog cache --------------------
+# The price list changes rarely, so the listing used by name search is cached per currency:
+#   - memory first, then the on-disk copy (CACHE_DIR), then the offline snapshot (SNAPSHOT_PATH)
+#   - a fresh entry (younger than CACHE_TTL) is returned as-is
+#   - a stale entry is returned immediately while a background task refreshes it
+#   - without any entry the listing is fetched inline
+
+
+class CatalogEntry(TypedDict):
+    currency: str
+    fetchedAt: float
+    pages: int
+    complete: bool
+    items: list[dict[str, Any]]
+
+
+_CATALOG: dict[str, CatalogEntry] = {}
+_CATALOG_LOCKS: dict[str, asyncio.Lock] = {}
+_REFRESH_TASKS: dict[str, asyncio.Task] = {}
+_SNAPSHOT_LOADED = False
+
+
+def _cache_file(currency: str) -> str | None:
+    return os.path.join(CACHE_DIR, f"catalog-{currency}.json") if CACHE_DIR else None
+
+
+def _is_fresh(entry: CatalogEntry) -> bool:
+    return CACHE_TTL > 0 and (time.time() - entry["fetchedAt"]) < CACHE_TTL
+
+
+def _covers(entry: CatalogEntry, max_pages: int) -> bool:
+    """True if the entry holds at least the pages requested (or the whole listing)."""
+    return entry["complete"] or entry["pages"] >= max_pages
+
+
+def _read_json(path: str) -> Any:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _load_snapshot() -> None:
+    """
+    Seed the in-memory cache from the offline snapshot (once).
+    Snapshot shape: {"fetchedAt": <epoch>, "catalogs": {"<CCY>": [items...]}}
+    """
+    global _SNAPSHOT_LOADED
+    if _SNAPSHOT_LOADED:
+        return
+    _SNAPSHOT_LOADED = True
+    data = _read_json(SNAPSHOT_PATH) if SNAPSHOT_PATH else None
+    if not isinstance(data, dict):
+        return
+    fetched_at = float(data.get("fetchedAt") or 0)
+    for ccy, items in (data.get("catalogs") or {}).items():
+        cur = str(ccy).upper()
+        if isinstance(items, list) and cur not in _CATALOG:
+            _CATALOG[cur] = {
+                "currency": cur,
+                "fetchedAt": fetched_at,
+                "pages": 0,
+                "complete": True,
+                "items": items,
+            }
+
+
+def _load_disk(currency: str) -> CatalogEntry | None:
+    path = _cache_file(currency)
+    data = _read_json(path) if path else None
+    if isinstance(data, dict) and isinstance(data.get("items"), list):
+        return data  # type: ignore[return-value]
+    return None
+
+
+def _save_disk(entry: CatalogEntry) -> None:
+    path = _cache_file(entry["currency"])
+    if not path:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+    except Exception:
+        # Disk cache is best-effort; memory cache still works
+        pass
+
+
+def _cached_entry(currency: str) -> CatalogEntry | None:
+    """Best cached entry for `currency` (memory, snapshot or disk; possibly stale). No network."""
+    _load_snapshot()
+    entry = _CATALOG.get(currency)
+    if entry is None or not _is_fresh(entry):
+        disk = _load_disk(currency)
+        if disk is not None and (entry is None or disk["fetchedAt"] > entry["fetchedAt"]):
+            entry = _CATALOG[currency] = disk
+    return entry
+
+
+def cached_catalog(currency: str) -> list[dict[str, Any]] | None:
+    """Fresh cached items for `currency`, or None (never fetches)."""
+    if CACHE_TTL <= 0:
+        return None
+    entry = _cached_entry(currency)
+    return entry["items"] if entry is not None and _is_fresh(entry) else None
+
+
+async def _fetch_catalog(
+    client: httpx.AsyncClient, currency: str, max_pages: int
+) -> CatalogEntry:
+    """Fetch the listing from cetools and store it in memory and on disk."""
+    items: list[dict[str, Any]] = []
+    pages = 0
+    complete = False
+    async for page in iter_pages(client, currency, max_pages):
+        pages += 1
+        items.extend(page["items"])
+        complete = not page["more"]
+    entry: CatalogEntry = {
+        "currency": currency,
+        "fetchedAt": time.time(),
+        "pages": pages,
+        "complete": complete,
+        "items": items,
+    }
+    _CATALOG[currency] = entry
+    _save_disk(entry)
+    return entry
+
+
+async def _refresh_in_background(currency: str, max_pages: int) -> None:
+    try:
+        await _fetch_catalog(get_client(), currency, max_pages)
+    except Exception:
+        # Keep serving the stale entry (e.g., offline with a snapshot)
+        pass
+    finally:
+        _REFRESH_TASKS.pop(currency, None)
+
+
+def _schedule_refresh(currency: str, max_pages: int) -> None:
+    if currency not in _REFRESH_TASKS:
+        _REFRESH_TASKS[currency] = asyncio.create_task(
+            _refresh_in_background(currency, max_pages)
         )
-        if not nxt:
-            break
-        url, params = (nxt if nxt.startswith("http") else f"https://apexapps.oracle.com{nxt}"), None
+
+
+async def get_catalog(
+    client: httpx.AsyncClient, currency: str = DEFAULT_CCY, max_pages: int = DEFAULT_MAX_PAGES
+) -> list[dict[str, Any]]:
+    """Return the price-list items for `currency`, served from cache when possible."""
+    if CACHE_TTL <= 0:
+        return [it async for it in iter_all(client, currency, max_pages)]
+
+    entry = _cached_entry(currency)
+    if entry is not None and _covers(entry, max_pages):
+        if not _is_fresh(entry):
+            _schedule_refresh(currency, max_pages)
+        return entry["items"]
+
+    # Nothing usable cached: fetch inline (one fetch per currency at a time)
+    lock = _CATALOG_LOCKS.setdefault(currency, asyncio.Lock())
+    async with lock:
+        entry = _CATALOG.get(currency)
+        if entry is not None and _is_fresh(entry) and _covers(entry, max_pages):
+            return entry["items"]
+        return (await _fetch_catalog(client, currency, max_pages))["items"]
+
+
+async def write_snapshot(path: str, currencies: list[str], max_pages: int) -> None:
+    """Fetch the listing for each currency and write an offline snapshot file."""
+    catalogs: dict[str, list[dict[str, Any]]] = {}
+    try:
+        for ccy in currencies:
+            catalogs[ccy] = [it async for it in iter_all(get_client(), ccy, max_pages)]
+    finally:
+        await close_client()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"fetchedAt": time.time(), "catalogs": catalogs}, f)
 
 
 # -------------------- fuzzy search --------------------
 
+_SEARCH_FIELDS = ("displayName", "serviceCategory", "metricName", "partNumber")
+_SIMILARITY = 0.90
+
+
+def _trigrams(s: str) -> set[str]:
+    return {s[i : i + 3] for i in range(len(s) - 2)}
+
+
+class CatalogIndex:
+    """
+    Catalog normalized once for fuzzy search:
+      - tn/tns: normalized and space-insensitive text per item
+      - token postings: word -> item positions (word-boundary matches)
+      - trigram postings over tns: space-insensitive substring candidates
+      - items sorted by len(tns): only items of similar length can reach the similarity threshold
+      - by_part: partNumber (upper) -> first item position, for exact SKU lookups
+    Candidate generation is set arithmetic; regex/substring/SequenceMatcher checks run on candidates only.
+    """
+
+    def __init__(self, items: list[dict[str, Any]]):
+        self.items = items
+        self.tn: list[str] = []
+        self.tns: list[str] = []
+        self.tokens: dict[str, set[int]] = {}
+        self.grams: dict[str, set[int]] = {}
+        self.by_part: dict[str, int] = {}
+        for i, it in enumerate(items):
+            pn = str(it.get("partNumber") or "").strip().upper()
+            if pn:
+                self.by_part.setdefault(pn, i)
+            tn = norm(" ".join(str(it.get(k, "")) for k in _SEARCH_FIELDS))
+            tns = nospace(tn)
+            self.tn.append(tn)
+            self.tns.append(tns)
+            for tok in set(tn.split()):
+                self.tokens.setdefault(tok, set()).add(i)
+            for g in _trigrams(tns):
+                self.grams.setdefault(g, set()).add(i)
+        self._by_len = sorted(range(len(items)), key=lambda i: len(self.tns[i]))
+        self._lens = [len(self.tns[i]) for i in self._by_len]
+
+    def _all_postings(self, postings: dict[str, set[int]], keys) -> set[int]:
+        """Items present in the postings of every key (empty if any key is unknown)."""
+        sets = [postings.get(k) for k in keys]
+        if not sets or any(not p for p in sets):
+            return set()
+        sets.sort(key=len)
+        return set.intersection(*sets)
+
+    def word_matches(self, v: str) -> set[int]:
+        """Items where `v` occurs on word boundaries (same as re.search(rf"\b{v}\b", tn))."""
+        cand = self._all_postings(self.tokens, v.split())
+        pat = re.compile(rf"\b{re.escape(v)}\b")
+        return {i for i in cand if pat.search(self.tn[i])}
+
+    def substring_matches(self, v: str) -> set[int]:
+        """Items whose space-insensitive text contains `v`."""
+        cand = self._all_postings(self.grams, _trigrams(v))
+        return {i for i in cand if v in self.tns[i]}
+
+    def similar_matches(self, v: str) -> set[int]:
+        """Items whose space-insensitive text has SequenceMatcher ratio >= 0.90 with `v`."""
+        # ratio = 2*M/(la+lb) with M <= min(la, lb) bounds lb to a window around la
+        la = len(v)
+        lo = bisect.bisect_left(self._lens, int(la * _SIMILARITY / (2 - _SIMILARITY)))
+        hi = bisect.bisect_right(self._lens, -(-la * (2 - _SIMILARITY) // _SIMILARITY))
+        out = set()
+        for i in self._by_len[lo:hi]:
+            sm = difflib.SequenceMatcher(a=v, b=self.tns[i])
+            if (
+                sm.real_quick_ratio() >= _SIMILARITY
+                and sm.quick_ratio() >= _SIMILARITY
+                and sm.ratio() >= _SIMILARITY
+            ):
+                out.add(i)
+        return out
+
+
+_INDEX_CACHE: OrderedDict[int, tuple[list[dict[str, Any]], CatalogIndex]] = OrderedDict()
+_INDEX_CACHE_SIZE = 8
+
+
+def catalog_index(items: list[dict[str, Any]]) -> CatalogIndex:
+    """Return the index for this catalog list, building it once (cached by list identity)."""
+    key = id(items)
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None and cached[0] is items and len(cached[1].tn) == len(items):
+        _INDEX_CACHE.move_to_end(key)
+        return cached[1]
+    idx = CatalogIndex(items)
+    _INDEX_CACHE[key] = (items, idx)
+    while len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+        _INDEX_CACHE.popitem(last=False)
+    return idx
+
 
 def search_items(
     items: list[dict[str, Any]],
@@ -275,6 +769,7 @@ def search_items(
     - Expand aliases only when query == alias or query == full name or query contains full name.
     - If query intends 'Autonomous Database', require both 'autonomous' and 'database'.
     - On return, pass each hit through simplify(..., prefer_currency) so items[*].currencyCode is always populated.
+    - Matching runs against a CatalogIndex built once per catalog (see catalog_index).
     """
     qn = norm(query)
 
@@ -293,35 +788,26 @@ def search_items(
     # Drop too-short tokens
     variants = {v for v in variants if len(v) >= 3}
 
+    idx = catalog_index(items)
+    matched: set[int] = set()
+    for v in variants:
+        if len(v) <= 4:
+            matched |= idx.word_matches(v)
+        else:
+            matched |= idx.substring_matches(v)
+            matched |= idx.similar_matches(v)
+
+    # ADB intent: require both keywords
+    if q_is_adb_intent:
+        matched &= idx.word_matches("autonomous") & idx.word_matches("database")
+
     res: list[SimplifiedItem] = []
-    for it in items:
-        fields = [
-            str(it.get(k, ""))
-            for k in ("displayName", "serviceCategory", "metricName", "partNumber")
-        ]
-        text = " ".join(fields)
-        tn = norm(text)
-        tns = nospace(tn)
-
-        # ADB intent: require both keywords
-        if q_is_adb_intent:
-            if not (re.search(r"\bautonomous\b", tn) and re.search(r"\bdatabase\b", tn)):
-                continue
-
-        short = [v for v in variants if 3 <= len(v) <= 4]
-        long = [v for v in variants if len(v) >= 5]
-
-        hit = (
-            any(re.search(rf"\b{re.escape(v)}\b", tn) for v in short)
-            or any(v in tns for v in long)
-            or any(difflib.SequenceMatcher(a=v, b=tns).ratio() >= 0.90 for v in long)
-        )
-        if hit:
-            sm = simplify(it, prefer_currency)
-            if sm not in res:
-                res.append(sm)
-                if len(res) >= limit:
-                    break
+    for i in sorted(matched):
+        sm = simplify(items[i], prefer_currency)
+        if sm not in res:
+            res.append(sm)
+            if len(res) >= limit:
+                break
     return res
 
 
@@ -437,22 +923,349 @@ async def _enrich_with_alt_currency_if_zero(
         return item
 
 
+# -------------------- per-hit enrichment --------------------
+
+
+async def _enrich_hit(
+    client: httpx.AsyncClient, sm: dict[str, Any], currency: str
+) -> dict[str, Any]:
+    """Re-fetch a search hit by SKU for the most precise price, plus the alt-currency reference."""
+    pn = sm.get("partNumber")
+    got = sm
+    if pn:
+        detail = await fetch(client, API, {"partNumber": pn, "currencyCode": currency})
+        det_items = detail.get("items") or []
+        if det_items:
+            got = simplify(det_items[0], currency)
+            if not got.get("currencyCode"):
+                got["currencyCode"] = currency
+
+        # Add alternate-currency reference when zero/missing
+        got = await _enrich_with_alt_currency_if_zero(client, got, pn, currency)
+    return got
+
+
+async def _enrich_hits(
+    client: httpx.AsyncClient,
+    hits: list[SimplifiedItem],
+    currency: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """
+    Enrich all hits concurrently (at most `concurrency` in flight), preserving input order.
+    Wall-clock time follows the slowest hit instead of the sum of all round trips.
+    """
+    return await _bounded_gather(
+        [lambda sm=sm: _enrich_hit(client, sm, currency) for sm in hits], concurrency
+    )
+
+
+async def _bounded_gather(calls: list[Callable[[], Awaitable[Any]]], concurrency: int) -> list[Any]:
+    """Await `calls` with at most `concurrency` in flight; results keep the input order."""
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with sem:
+            return await call()
+
+    return list(await asyncio.gather(*(one(c) for c in calls)))
+
+
+# -------------------- batch SKU lookup --------------------
+
+SKU_BATCH_MAX = 100
+SKU_COLUMNS = (
+    "partNumber",
+    "displayName",
+    "metricName",
+    "serviceCategory",
+    "currencyCode",
+    "model",
+    "value",
+    "note",
+    "altCurrencyCode",
+    "altValue",
+    "source",
+)
+
+
+def _dedupe_part_numbers(part_numbers: list[str]) -> list[str]:
+    """Strip, uppercase and drop empty/duplicate part numbers, keeping first-seen order."""
+    out: list[str] = []
+    seen: set[str] = set()
+    for raw in part_numbers or []:
+        pn = str(raw or "").strip().upper()
+        if pn and pn not in seen:
+            seen.add(pn)
+            out.append(pn)
+    return out
+
+
+async def _lookup_sku(
+    client: httpx.AsyncClient, pn: str, currency: str, with_tiers: bool = False
+) -> dict[str, Any] | None:
+    """Fetch one SKU in `currency` (plus alt-currency reference); None when not found."""
+    data = await fetch(client, API, {"partNumber": pn, "currencyCode": currency})
+    items = data.get("items") or []
+    if not items:
+        return None
+    out = simplify(items[0], currency)
+    if not out.get("currencyCode"):
+        out["currencyCode"] = currency
+    if with_tiers:
+        out["tiers"] = _price_tiers(items[0], currency)
+    return await _enrich_with_alt_currency_if_zero(client, out, pn, currency)
+
+
+async def resolve_skus(
+    client: httpx.AsyncClient,
+    part_numbers: list[str],
+    currency: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    with_tiers: bool = False,
+) -> dict[str, dict[str, Any] | Exception | None]:
+    """
+    Resolve distinct part numbers to simplified items:
+      - from the fresh cached catalog when it has the SKU (source "catalog", no request)
+      - otherwise via concurrent SKU requests (source "api"), at most `concurrency` in flight
+    Maps each part number to its item, None (not found) or the exception raised for it.
+    with_tiers adds "tiers" (see _price_tiers) to each item.
+    """
+    out: dict[str, dict[str, Any] | Exception | None] = {}
+    items = cached_catalog(currency)
+    by_part = catalog_index(items).by_part if items else {}
+    pending: list[str] = []
+    for pn in part_numbers:
+        if pn in by_part:
+            raw = items[by_part[pn]]  # type: ignore[index]
+            got = simplify(raw, currency)
+            if with_tiers:
+                got["tiers"] = _price_tiers(raw, currency)
+            got["source"] = "catalog"
+            out[pn] = got
+        else:
+            pending.append(pn)
+
+    async def one(pn: str) -> dict[str, Any] | Exception | None:
+        try:
+            got = await _lookup_sku(client, pn, currency, with_tiers)
+        except httpx.HTTPError as e:
+            return e
+        if got is not None:
+            got["source"] = "api"
+        return got
+
+    results = await _bounded_gather([lambda pn=pn: one(pn) for pn in pending], concurrency)
+    out.update(zip(pending, results))
+    return out
+
+
+# -------------------- multi-currency prices --------------------
+
+MAX_CURRENCIES = 10
+
+
+def _norm_currency_list(currencies: list[str]) -> tuple[list[str], str | None]:
+    """Validate/uppercase a currency list (order kept, duplicates dropped); (codes, error_note)."""
+    out: list[str] = []
+    for c in currencies or []:
+        cur, err = _norm_currency_strict(str(c))
+        if err:
+            return [], err
+        if cur not in out:
+            out.append(cur)
+    if not out:
+        return [], "empty-currencies"
+    if len(out) > MAX_CURRENCIES:
+        return [], "too-many-currencies"
+    return out, None
+
+
+async def _currency_matrix(
+    client: httpx.AsyncClient,
+    pn: str,
+    item: dict[str, Any],
+    currencies: list[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, dict[str, Any]]:
+    """
+    Prices of one SKU in every requested currency.
+    Currencies already localized on `item` (all of them when it was fetched without
+    currencyCode) cost no request; the rest are fetched concurrently, one per currency.
+    """
+    matrix = _prices_by_currency(item, currencies)
+    missing = [c for c in currencies if c not in matrix]
+
+    async def one(c: str) -> dict[str, Any] | None:
+        try:
+            data = await fetch(client, API, {"partNumber": pn, "currencyCode": c})
+        except httpx.HTTPError:
+            return None
+        items = data.get("items") or []
+        return _prices_by_currency(items[0], [c]).get(c) if items else None
+
+    results = await _bounded_gather([lambda c=c: one(c) for c in missing], concurrency)
+    for c, got in zip(missing, results):
+        matrix[c] = got or {
+            "model": None,
+            "value": None,
+            "note": "no-unit-price-in-public-subset-or-currency",
+        }
+    return {c: matrix[c] for c in currencies}
+
+
+# -------------------- cost estimate --------------------
+# Exact decimal arithmetic so the same BOM and prices always give the same totals.
+
+HOURS_PER_MONTH = 744  # 31 days x 24 h, upper bound for a month of hourly usage
+BOM_MAX_LINES = 200
+_MONEY = Decimal("0.0001")
+
+
+def _dec(v: Any) -> Decimal | None:
+    try:
+        d = Decimal(str(v))
+    except (InvalidOperation, ValueError, TypeError):
+        return None
+    return d if d.is_finite() else None
+
+
+def _money(d: Decimal) -> float:
+    return float(d.quantize(_MONEY, rounding=ROUND_HALF_UP))
+
+
+def _parse_bom(bom: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+    """
+    Validate BOM lines into [{"partNumber", "quantity", "hours"}] (Decimals).
+    quantity defaults to 1 (>= 0); hours_per_month defaults to HOURS_PER_MONTH (0..HOURS_PER_MONTH).
+    Returns (lines, None) or ([], error-response).
+    """
+    if not isinstance(bom, list) or not bom:
+        return [], {"kind": "error", "note": "empty-bom"}
+    if len(bom) > BOM_MAX_LINES:
+        return [], {"kind": "error", "note": "too-many-bom-lines", "max": BOM_MAX_LINES}
+    lines: list[dict[str, Any]] = []
+    for i, raw in enumerate(bom):
+        raw = raw if isinstance(raw, dict) else {}
+        pn = str(raw.get("partNumber") or "").strip().upper()
+        qty = _dec(raw.get("quantity", 1))
+        hours = _dec(raw.get("hours_per_month", HOURS_PER_MONTH))
+        if not pn:
+            return [], {"kind": "error", "note": "invalid-bom-line", "line": i, "error": "missing partNumber"}
+        if qty is None or qty < 0:
+            return [], {"kind": "error", "note": "invalid-bom-line", "line": i, "error": "quantity must be >= 0"}
+        if hours is None or not (0 <= hours <= HOURS_PER_MONTH):
+            return [], {
+                "kind": "error",
+                "note": "invalid-bom-line",
+                "line": i,
+                "error": f"hours_per_month must be 0..{HOURS_PER_MONTH}",
+            }
+        lines.append({"partNumber": pn, "quantity": qty, "hours": hours})
+    return lines, None
+
+
+def _is_hourly(metric: str | None) -> bool:
+    """Hourly metrics ("OCPU Per Hour", "Load Balancer Hour") are billed per hour of use."""
+    return "hour" in (metric or "").lower()
+
+
+def _tiered_cost(units: Decimal, tiers: list[dict[str, Any]]) -> Decimal:
+    """Cost of `units` across ranged price points; without ranges the first value is a flat rate."""
+    if not any(t["rangeMin"] is not None or t["rangeMax"] is not None for t in tiers):
+        return units * (_dec(tiers[0]["value"]) or Decimal(0))
+    cost = Decimal(0)
+    for t in tiers:
+        lo = _dec(t["rangeMin"]) or Decimal(0)
+        hi = _dec(t["rangeMax"])
+        if units <= lo:
+            continue
+        upper = units if hi is None else min(units, hi)
+        cost += (upper - lo) * (_dec(t["value"]) or Decimal(0))
+    return cost
+
+
+def estimate_lines(
+    lines: list[dict[str, Any]],
+    resolved: dict[str, dict[str, Any] | Exception | None],
+    currency: str,
+) -> dict[str, Any]:
+    """
+    Price parsed BOM lines against resolved SKUs (resolve_skus(..., with_tiers=True)).
+      - hourly metrics: quantity priced per hour (tiers apply to quantity), x hours_per_month
+      - other metrics: quantity priced once per month (hours_per_month ignored)
+    Lines without a usable price in `currency` go to "unpriced" and are left out of the total.
+    """
+    priced: list[dict[str, Any]] = []
+    unpriced: list[dict[str, Any]] = []
+    total = Decimal(0)
+    for i, ln in enumerate(lines):
+        pn = ln["partNumber"]
+        got = resolved.get(pn)
+        reason = None
+        if isinstance(got, Exception):
+            reason = f"http-error: {got}"
+        elif got is None:
+            reason = "not-found"
+        elif not got.get("tiers"):
+            reason = "no-unit-price-in-public-subset-or-currency"
+        elif got.get("currencyCode") != currency:
+            reason = f"priced-in-{got.get('currencyCode')}-only"
+        if reason is not None:
+            unpriced.append({"line": i, "partNumber": pn, "reason": reason})
+            continue
+
+        hourly = _is_hourly(got.get("metricName"))
+        cost = _tiered_cost(ln["quantity"], got["tiers"])
+        if hourly:
+            cost *= ln["hours"]
+        line_cost = _money(cost)
+        total += Decimal(str(line_cost))
+        out = {
+            "line": i,
+            "partNumber": pn,
+            "displayName": got.get("displayName"),
+            "metricName": got.get("metricName"),
+            "billing": "hourly" if hourly else "monthly",
+            "quantity": float(ln["quantity"]),
+            "hoursPerMonth": float(ln["hours"]) if hourly else None,
+            "model": got.get("model"),
+            "unitPrice": got.get("value"),
+            "tiered": len(got["tiers"]) > 1,
+            "monthlyCost": line_cost,
+        }
+        if got.get("note"):
+            out["note"] = got["note"]
+        priced.append(out)
+
+    return {
+        "lines": priced,
+        "unpriced": unpriced,
+        "monthlyTotal": _money(total),
+        "complete": not unpriced,
+    }
+
+
 # -------------------- PURE IMPLEMENTATIONS (test here primarily) --------------------
 
 
 async def pricing_get_sku_impl(
-    part_number: str, currency: str | None = None, max_pages: int | None = None
+    part_number: str,
+    currency: str | None = None,
+    max_pages: int | None = None,
+    currencies: list[str] | None = None,
 ) -> dict[str, Any]:
     """
     Fetch a SKU's price. If the SKU misses, fall back to fuzzy name search.
 
     Environment overrides (when args are omitted):
-      - currency: OCI_PRICING_DEFAULT_CCY (default: 'USD')
+      - currency: OCI_PRICING_DEFAULT_CCY (default: 'USD'); with `currencies`, the first of them
       - max_pages: OCI_PRICING_MAX_PAGES (default: 6)
 
     Returns (dict):
       - On SKU hit:
           {"kind":"sku", partNumber, displayName, metricName, serviceCategory, currencyCode, model, value}
+          plus "prices": {CCY: {"model","value","note"?}} when `currencies` is given
       - On name fallback:
           {"kind":"search","note":"matched-by-name","query","currency","returned","items":[...]}
       - On not found:
@@ -461,8 +1274,15 @@ async def pricing_get_sku_impl(
           {"kind":"error","note":"http-error","error","input","currency"}
     """
     pn = (part_number or "").strip()
+    ccys: list[str] = []
+    if currencies is not None:
+        ccys, ccys_err = _norm_currency_list(currencies)
+        if ccys_err:
+            return {"kind": "error", "note": ccys_err, "input": currencies}
     # ISO 4217 validation with auto-uppercasing
-    cur, cur_err = _norm_currency_strict(currency, default=DEFAULT_CCY)
+    cur, cur_err = _norm_currency_strict(
+        currency, default=ccys[0] if ccys else DEFAULT_CCY
+    )
     if cur_err:
         return {"kind": "error", "note": cur_err, "input": currency}
     pages = _clamp(
@@ -476,32 +1296,40 @@ async def pricing_get_sku_impl(
         return {"kind": "error", "note": "empty-part-number", "items": []}
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            # 1) Direct SKU
-            data = await fetch(client, API, {"partNumber": pn, "currencyCode": cur})
-            items = data.get("items") or []
-            if items:
-                out = simplify(items[0], cur)
-                if not out.get("currencyCode"):
-                    out["currencyCode"] = cur
-                out["kind"] = "sku"
-                # Add alternate-currency reference when zero/missing
-                out = await _enrich_with_alt_currency_if_zero(client, out, pn, cur)
+        client = get_client()
+        # 1) Direct SKU. With several currencies, leave out currencyCode: the API then
+        #    localizes the SKU in every currency it prices, instead of just `cur`.
+        params = {"partNumber": pn}
+        if len(ccys) <= 1:
+            params["currencyCode"] = cur
+        data = await fetch(client, API, params)
+        items = data.get("items") or []
+        if items:
+            out = simplify(items[0], cur)
+            if not out.get("currencyCode"):
+                out["currencyCode"] = cur
+            out["kind"] = "sku"
+            if ccys:
+                # Requested currencies from that one response (replaces the ALT_CCY reference)
+                out["prices"] = await _currency_matrix(client, pn, items[0], ccys)
                 return out
-
-            # 2) Fuzzy name search (bounded pages)
-            all_items = [it async for it in iter_all(client, cur, pages)]
-            hits = search_items(all_items, pn, limit=12, prefer_currency=cur)
-            # (Optional) we could enrich each hit too, but keep this lightweight for fallback path
-            return {
-                "kind": "search",
-                "note": "matched-by-name" if hits else "not-found",
-                "query": pn,
-                "currency": cur,
-                "returned": len(hits),
-                "items": hits,
-                "info": "cetools is a public subset; empty items can be expected.",
-            }
+            # Add alternate-currency reference when zero/missing
+            out = await _enrich_with_alt_currency_if_zero(client, out, pn, cur)
+            return out
+
+        # 2) Fuzzy name search (bounded pages, cached catalog)
+        all_items = await get_catalog(client, cur, pages)
+        hits = search_items(all_items, pn, limit=12, prefer_currency=cur)
+        # (Optional) we could enrich each hit too, but keep this lightweight for fallback path
+        return {
+            "kind": "search",
+            "note": "matched-by-name" if hits else "not-found",
+            "query": pn,
+            "currency": cur,
+            "returned": len(hits),
+            "items": hits,
+            "info": "cetools is a public subset; empty items can be expected.",
+        }
     except httpx.HTTPError as e:
         return {
             "kind": "error",
@@ -544,56 +1372,126 @@ async def pricing_search_name_impl(
     )
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            items = [it async for it in iter_all(client, cur, pages)]
-            hits = search_items(items, q, lim, prefer_currency=cur)
-
-            # Enrich each hit via SKU endpoint to pick the most precise price in requested currency
-            enriched: list[dict[str, Any]] = []
-            for sm in hits:
-                pn = sm.get("partNumber")
-                got = sm
-                if pn:
-                    detail = await fetch(client, API, {"partNumber": pn, "currencyCode": cur})
-                    det_items = detail.get("items") or []
-                    if det_items:
-                        got = simplify(det_items[0], cur)
-                        if not got.get("currencyCode"):
-                            got["currencyCode"] = cur
-
-                    # Add alternate-currency reference when zero/missing
-                    got = await _enrich_with_alt_currency_if_zero(client, got, pn, cur)
-
-                if require_priced:
-                    # Keep only items with positive value in the requested currency
-                    try:
-                        if got.get("model") is not None and got.get("value") is not None:
-                            if float(got["value"]) > 0.0:
-                                enriched.append(got)
-                    except Exception:
-                        # Non-numeric value -> drop when require_priced
-                        pass
-                else:
-                    enriched.append(got)
-
-            return {
-                "kind": "search",
-                "query": q,
-                "currency": cur,
-                "returned": len(enriched),
-                "items": enriched,
-                "note": "fuzzy search; per-item price enriched via SKU endpoint",
-            }
+        client = get_client()
+        items = await get_catalog(client, cur, pages)
+        hits = search_items(items, q, lim, prefer_currency=cur)
+
+        # Enrich each hit via SKU endpoint to pick the most precise price in requested currency
+        enriched: list[dict[str, Any]] = []
+        for got in await _enrich_hits(client, hits, cur):
+            if require_priced:
+                # Keep only items with positive value in the requested currency
+                try:
+                    if got.get("model") is not None and got.get("value") is not None:
+                        if float(got["value"]) > 0.0:
+                            enriched.append(got)
+                except Exception:
+                    # Non-numeric value -> drop when require_priced
+                    pass
+            else:
+                enriched.append(got)
+
+        return {
+            "kind": "search",
+            "query": q,
+            "currency": cur,
+            "returned": len(enriched),
+            "items": enriched,
+            "note": "fuzzy search; per-item price enriched via SKU endpoint",
+        }
     except httpx.HTTPError as e:
         return {"kind": "error", "note": "http-error", "error": str(e), "items": []}
 
 
+async def pricing_get_skus_impl(
+    part_numbers: list[str],
+    currency: str | None = None,
+) -> dict[str, Any]:
+    """
+    Batch SKU lookup; one table-shaped response for many part numbers.
+
+    Returns (normal):
+      {"kind":"skus","currency","columns":[...],"rows":[[...], ...],"returned",
+       "missing":[partNumber...],"errors":[{"partNumber","error"}],"duplicatesRemoved"}
+      Rows follow input order (after de-duplication); "source" is "catalog" or "api".
+    """
+    pns = _dedupe_part_numbers(part_numbers)
+    if not pns:
+        return {"kind": "error", "note": "empty-part-numbers", "items": []}
+    if len(pns) > SKU_BATCH_MAX:
+        return {
+            "kind": "error",
+            "note": "too-many-part-numbers",
+            "max": SKU_BATCH_MAX,
+            "received": len(pns),
+        }
+
+    cur, cur_err = _norm_currency_strict(currency, default=DEFAULT_CCY)
+    if cur_err:
+        return {"kind": "error", "note": cur_err, "input": currency}
+
+    resolved = await resolve_skus(get_client(), pns, cur)
+
+    rows: list[list[Any]] = []
+    missing: list[str] = []
+    errors: list[dict[str, str]] = []
+    for pn in pns:
+        got = resolved.get(pn)
+        if isinstance(got, Exception):
+            errors.append({"partNumber": pn, "error": str(got)})
+        elif got is None:
+            missing.append(pn)
+        else:
+            rows.append([got.get(c) for c in SKU_COLUMNS])
+
+    return {
+        "kind": "skus",
+        "currency": cur,
+        "columns": list(SKU_COLUMNS),
+        "rows": rows,
+        "returned": len(rows),
+        "missing": missing,
+        "errors": errors,
+        "duplicatesRemoved": len([p for p in part_numbers or [] if str(p or "").strip()]) - len(pns),
+    }
+
+
+async def pricing_estimate_impl(
+    bom: list[dict[str, Any]],
+    currency: str | None = None,
+) -> dict[str, Any]:
+    """
+    Monthly cost estimate for a bill of materials.
+
+    Returns (normal):
+      {"kind":"estimate","currency","lines":[...],"unpriced":[...],"monthlyTotal","complete"}
+    """
+    lines, err = _parse_bom(bom)
+    if err:
+        return err
+    pns = _dedupe_part_numbers([ln["partNumber"] for ln in lines])
+    if len(pns) > SKU_BATCH_MAX:
+        return {"kind": "error", "note": "too-many-part-numbers", "max": SKU_BATCH_MAX}
+
+    cur, cur_err = _norm_currency_strict(currency, default=DEFAULT_CCY)
+    if cur_err:
+        return {"kind": "error", "note": cur_err, "input": currency}
+
+    resolved = await resolve_skus(get_client(), pns, cur, with_tiers=True)
+    return {"kind": "estimate", "currency": cur, **estimate_lines(lines, resolved, cur)}
+
+
 # -------------------- MCP tool wrappers (thin) --------------------
 
+mcp = FastMCP("oci-pricing-mcp", lifespan=_lifespan)
+
 
 @mcp.tool()
 async def pricing_get_sku(
-    part_number: str, currency: str | None = None, max_pages: int | None = None
+    part_number: str,
+    currency: str | None = None,
+    max_pages: int | None = None,
+    currencies: list[str] | None = None,
 ) -> dict[str, Any]:
     """
     Look up list price for a specific OCI SKU (partNumber).
@@ -608,9 +1506,12 @@ async def pricing_get_sku(
         If omitted (None), defaults to OCI_PRICING_DEFAULT_CCY ("USD" if unset).
         Invalid formats/codes (e.g., "USDT", "", "12$") return {"kind":"error","note":"invalid-currency-format"}.
       - max_pages (int, optional): Bounds pagination used only when falling back to name search. Integer 1–10. Defaults to OCI_PRICING_MAX_PAGES (6).
+      - currencies (list[str], optional): Up to 10 ISO 4217 codes, e.g. ["USD", "EUR", "JPY"], to price the SKU in all of them
+        at once. The top-level price uses `currency` (default: the first of `currencies`).
 
     Returns:
       - On success with SKU: {"kind":"sku", partNumber, displayName, metricName, serviceCategory, currencyCode, model, value, note?, altCurrencyCode?, altModel?, altValue?}
+        With `currencies`: also "prices": {"USD": {"model","value","note"?}, ...} in the requested order (no alt* fields).
       - On fallback to name search (SKU not found): {"kind":"search", "note":"matched-by-name"|"not-found", "query", "currency", "returned", "items":[...]}
       - On HTTP or input error: {"kind":"error", "note":"http-error"|"...", "error"?, "input"?, "currency"?}
 
@@ -620,7 +1521,7 @@ async def pricing_get_sku(
       - Examples — OK: "USD", "JPY", "usd", "jpy" / NG: "USDT", "12$", ""
     """
     return await pricing_get_sku_impl(
-        part_number=part_number, currency=currency, max_pages=max_pages
+        part_number=part_number, currency=currency, max_pages=max_pages, currencies=currencies
     )
 
 
@@ -665,6 +1566,79 @@ async def pricing_search_name(
     )
 
 
+@mcp.tool()
+async def pricing_get_skus(
+    part_numbers: list[str], currency: str | None = None
+) -> dict[str, Any]:
+    """
+    Look up list prices for many OCI SKUs in one call (e.g., building a cost estimate).
+
+    When to use:
+      - Prefer this over repeated pricing_get_sku calls when you need 2+ known SKUs.
+
+    Parameters:
+      - part_numbers (list[str], required): Oracle SKUs, e.g. ["B93113", "B88298"]. Case-insensitive; duplicates are
+        removed (first occurrence kept). At most 100 distinct SKUs.
+      - currency (str, optional): ISO 4217 code, auto-uppercased and validated. Defaults to OCI_PRICING_DEFAULT_CCY.
+
+    Returns:
+      - {"kind":"skus", "currency", "columns":[...], "rows":[[...]], "returned", "missing":[...], "errors":[...], "duplicatesRemoved"}
+        Each row lines up with "columns" (partNumber, displayName, metricName, serviceCategory, currencyCode, model, value,
+        note, altCurrencyCode, altValue, source). Rows keep input order.
+      - On input error: {"kind":"error", "note":"empty-part-numbers"|"too-many-part-numbers"|"invalid-currency-format", ...}
+
+    Notes:
+      - SKUs found in the cached price list are answered locally (source "catalog"); the rest are fetched concurrently
+        from the SKU endpoint (source "api").
+      - SKUs the public subset does not list appear in "missing"; per-SKU HTTP failures appear in "errors".
+    """
+    return await pricing_get_skus_impl(part_numbers=part_numbers, currency=currency)
+
+
+@mcp.tool()
+async def pricing_estimate(
+    bom: list[dict[str, Any]], currency: str | None = None
+) -> dict[str, Any]:
+    """
+    Compute monthly list-price costs for a bill of materials (quantities x hours x unit prices).
+
+    When to use:
+      - Use this instead of doing price arithmetic yourself once the SKUs are known.
+
+    Parameters:
+      - bom (list, required): lines like {"partNumber": "B93113", "quantity": 4, "hours_per_month": 744}.
+          * quantity (optional, default 1): units of the SKU's metric (e.g., OCPUs, GB, Mbps).
+          * hours_per_month (optional, default 744): hours used per month; only applies to hourly metrics.
+        Up to 200 lines / 100 distinct SKUs.
+      - currency (str, optional): ISO 4217 code, auto-uppercased and validated. Defaults to OCI_PRICING_DEFAULT_CCY.
+
+    Returns:
+      - {"kind":"estimate", "currency", "lines":[{line, partNumber, displayName, metricName, billing, quantity,
+        hoursPerMonth, model, unitPrice, tiered, monthlyCost, note?}], "unpriced":[{line, partNumber, reason}],
+        "monthlyTotal", "complete"}
+      - On input error: {"kind":"error", "note":"empty-bom"|"invalid-bom-line"|"invalid-currency-format"|..., ...}
+
+    Notes:
+      - Hourly metrics cost quantity x unit price x hours_per_month; other metrics cost quantity x unit price.
+      - Tiered SKUs (e.g., free first range) are priced per range; free-tier-only SKUs cost 0.
+      - Lines the public subset cannot price in the requested currency are listed in "unpriced" and excluded
+        from monthlyTotal ("complete": false). List prices only; discounts are not applied.
+    """
+    return await pricing_estimate_impl(bom=bom, currency=currency)
+
+
+@mcp.tool()
+def pricing_http_stats() -> dict[str, Any]:
+    """
+    Connection-reuse metrics for the shared upstream HTTP client.
+
+    Returns:
+      - {"requests", "connections", "tls_handshakes", "http2_requests", "reused", "reuseRatio", "http2Enabled", "maxConnections"}
+        where reused = requests sent over an already-open connection.
+    """
+    return http_stats()
+
+
 @mcp.tool()
 def ping() -> str:
     """Health check. Returns 'ok' if the server is responsive."""
@@ -672,7 +1646,37 @@ def ping() -> str:
 
 
 def main() -> None:
-    """Start the MCP server"""
+    """Start the MCP server, or write an offline price-list snapshot with --write-snapshot."""
+    parser = argparse.ArgumentParser(description="OCI Pricing MCP Server")
+    parser.add_argument(
+        "--write-snapshot",
+        metavar="PATH",
+        help="fetch the price list and write an offline snapshot (for OCI_PRICING_SNAPSHOT), then exit",
+    )
+    parser.add_argument(
+        "--currencies",
+        default=DEFAULT_CCY,
+        help="comma-separated ISO 4217 codes to include in the snapshot (default: OCI_PRICING_DEFAULT_CCY)",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=10,
+        help="pages to fetch per currency for the snapshot (1-10, default: 10)",
+    )
+    args = parser.parse_args()
+
+    if args.write_snapshot:
+        currencies = []
+        for c in args.currencies.split(","):
+            cur, err = _norm_currency_strict(c)
+            if err:
+                parser.error(f"{err}: {c!r}")
+            currencies.append(cur)
+        pages = _clamp(args.max_pages, lo=1, hi=10, default=10)
+        asyncio.run(write_snapshot(args.write_snapshot, currencies, pages))
+        return
+
     mcp.run()
 
 
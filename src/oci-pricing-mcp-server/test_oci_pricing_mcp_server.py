@@ -8,13 +8,35 @@ import importlib.util
 import json
 import os
 import sys
+import tempfile
+import threading
+import time
 import unittest
 import warnings
 from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from types import MethodType
 from typing import Any
 
 
+def _load_server(module_name: str):
+    """
+    Load the server file (PRICING_SERVER_FILENAME) as a fresh module named `module_name`.
+    Offline test classes each get their own instance, since they patch module globals
+    (fetch, API, ALT_CCY, cache settings) that other classes must not see.
+    """
+    # Silence noisy warnings from dependencies if any.
+    warnings.filterwarnings("ignore", category=DeprecationWarning)
+    server_filename = os.getenv("PRICING_SERVER_FILENAME", "oci-pricing-mcp-server.py")
+    server_path = os.path.join(os.path.dirname(__file__), server_filename)
+    if not os.path.exists(server_path):
+        raise FileNotFoundError(f"Server file not found at {server_path}")
+    spec = importlib.util.spec_from_file_location(module_name, server_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 class TestOciPricingMcpServer(unittest.TestCase):
     """
     Functional tests for oci-pricing-mcp-server.py.
@@ -28,17 +50,7 @@ class TestOciPricingMcpServer(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        # Silence noisy warnings from dependencies if any.
-        warnings.filterwarnings("ignore", category=DeprecationWarning)
-
-        server_filename = os.getenv("PRICING_SERVER_FILENAME", "oci-pricing-mcp-server.py")
-        server_path = os.path.join(os.path.dirname(__file__), server_filename)
-        if not os.path.exists(server_path):
-            raise FileNotFoundError(f"Server file not found at {server_path}")
-
-        spec = importlib.util.spec_from_file_location("oci_pricing_mcp_server", server_path)
-        cls.server_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(cls.server_module)
+        cls.server_module = _load_server("oci_pricing_mcp_server")
         cls.module = cls.server_module
 
         # Probe values (override via environment variables when needed)
@@ -646,6 +658,600 @@ class TestOciPricingMcpServer(unittest.TestCase):
         print(f"{'=' * 70}\n")
 
 
+class TestCatalogCache(unittest.TestCase):
+    """
+    Offline tests for the price-list catalog cache (memory/disk/snapshot, TTL, background refresh).
+
+    Strategy:
+      - Replace module.fetch with a fake so no network is needed; count upstream calls.
+      - Point the disk cache and snapshot at a temporary directory.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_server("oci_pricing_mcp_server_cache")
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.calls = 0
+        self._orig_fetch = self.module.fetch
+        self.module.fetch = self._fake_fetch
+        self.module.CACHE_TTL = 3600.0
+        self.module.CACHE_DIR = self.tmp.name
+        self.module.SNAPSHOT_PATH = None
+        self.module._SNAPSHOT_LOADED = False
+        self.module._CATALOG.clear()
+        self.module._CATALOG_LOCKS.clear()
+        self.module._REFRESH_TASKS.clear()
+        self.upstream = [{"partNumber": "B1", "displayName": "Fresh Item"}]
+
+    def tearDown(self):
+        self.module.fetch = self._orig_fetch
+        self.tmp.cleanup()
+
+    async def _fake_fetch(self, client, url, params=None):
+        self.calls += 1
+        if self.upstream is None:
+            raise self.module.httpx.ConnectError("offline")
+        return {"items": list(self.upstream), "links": []}
+
+    def _get_catalog(self, currency="USD", max_pages=2):
+        async def run():
+            async with self.module.httpx.AsyncClient() as client:
+                items = await self.module.get_catalog(client, currency, max_pages)
+            # let a scheduled background refresh finish
+            for task in list(self.module._REFRESH_TASKS.values()):
+                await task
+            return items
+
+        return asyncio.run(run())
+
+    def test_fresh_entry_served_from_memory(self):
+        first = self._get_catalog()
+        second = self._get_catalog()
+        self.assertEqual(first, self.upstream)
+        self.assertEqual(second, self.upstream)
+        self.assertEqual(self.calls, 1)
+
+    def test_disk_cache_survives_memory_loss(self):
+        self._get_catalog()
+        self.module._CATALOG.clear()
+        self.assertEqual(self._get_catalog(), self.upstream)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "catalog-USD.json")))
+
+    def test_stale_entry_returned_then_refreshed_in_background(self):
+        stale = [{"partNumber": "B0", "displayName": "Stale Item"}]
+        self.module._CATALOG["USD"] = {
+            "currency": "USD",
+            "fetchedAt": 0.0,
+            "pages": 2,
+            "complete": True,
+            "items": stale,
+        }
+        self.assertEqual(self._get_catalog(), stale)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.module._CATALOG["USD"]["items"], self.upstream)
+
+    def test_offline_snapshot_is_served_when_upstream_fails(self):
+        snapshot = os.path.join(self.tmp.name, "snapshot.json")
+        snap_items = [{"partNumber": "B9", "displayName": "Snapshot Item"}]
+        with open(snapshot, "w", encoding="utf-8") as f:
+            json.dump({"fetchedAt": 0, "catalogs": {"JPY": snap_items}}, f)
+        self.module.SNAPSHOT_PATH = snapshot
+        self.upstream = None  # network down
+
+        self.assertEqual(self._get_catalog("JPY", max_pages=10), snap_items)
+        self.assertEqual(self.module._CATALOG["JPY"]["items"], snap_items)
+
+    def test_ttl_zero_disables_cache(self):
+        self.module.CACHE_TTL = 0
+        self._get_catalog()
+        self._get_catalog()
+        self.assertEqual(self.calls, 2)
+
+
+class TestConcurrentEnrichment(unittest.TestCase):
+    """
+    Offline tests for concurrent per-hit SKU enrichment using httpx.MockTransport.
+
+    Each mocked SKU request sleeps a fixed delay, so serial enrichment would take
+    (hits x delay) while concurrent enrichment takes about one delay.
+    """
+
+    DELAY = 0.2
+    HITS = 10
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_server("oci_pricing_mcp_server_enrich")
+        cls.module.ALT_CCY = None
+
+    def setUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _handler(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.DELAY)
+        finally:
+            self.in_flight -= 1
+        pn = request.url.params.get("partNumber")
+        ccy = request.url.params.get("currencyCode")
+        item = {
+            "partNumber": pn,
+            "displayName": f"Item {pn}",
+            "prices": [{"currencyCode": ccy, "prices": [{"model": "PAY_AS_YOU_GO", "value": 1.5}]}],
+        }
+        return self.module.httpx.Response(200, json={"items": [item]})
+
+    def _enrich(self, concurrency):
+        hits = [{"partNumber": f"B{i:05d}", "displayName": "stale"} for i in range(self.HITS)]
+
+        async def run():
+            transport = self.module.httpx.MockTransport(self._handler)
+            async with self.module.httpx.AsyncClient(transport=transport) as client:
+                return await self.module._enrich_hits(client, hits, "USD", concurrency=concurrency)
+
+        start = time.perf_counter()
+        out = asyncio.run(run())
+        return out, time.perf_counter() - start
+
+    def test_wall_clock_follows_slowest_request_and_order_is_preserved(self):
+        out, elapsed = self._enrich(concurrency=self.HITS)
+        self.assertEqual([it["partNumber"] for it in out], [f"B{i:05d}" for i in range(self.HITS)])
+        self.assertTrue(all(it["displayName"].startswith("Item ") for it in out))
+        self.assertTrue(all(it["currencyCode"] == "USD" and it["value"] == 1.5 for it in out))
+        # serial would be HITS * DELAY (2.0s); concurrent is ~DELAY
+        self.assertLess(elapsed, self.DELAY * 3)
+
+    def test_concurrency_is_bounded_by_semaphore(self):
+        out, elapsed = self._enrich(concurrency=2)
+        self.assertEqual(len(out), self.HITS)
+        self.assertLessEqual(self.max_in_flight, 2)
+        self.assertGreaterEqual(elapsed, self.DELAY * (self.HITS / 2) * 0.9)
+
+
+class TestIndexedSearch(unittest.TestCase):
+    """
+    Offline search tests: indexed search_items must return exactly what the previous
+    linear scan returned (bench_oci_pricing_search.linear_search_items), and the
+    labelled-query quality benchmark must stay above a floor.
+
+    The quality floor runs against the synthetic fixtures/catalog-synthetic-USD.json (hand-assembled,
+    not a recorded price list), so it is a regression guard, not a measure of real search quality.
+    """
+
+    ITEMS = 3000
+
+    @classmethod
+    def setUpClass(cls):
+        warnings.filterwarnings("ignore", category=DeprecationWarning)
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        import bench_oci_pricing_search as bench
+
+        cls.bench = bench
+        cls.module = bench.load_server()
+        cls.items = bench.synthetic_catalog(cls.ITEMS)
+
+    def test_matches_linear_scan(self):
+        for q in self.bench.QUERIES + ["a", "zzzzzz", "Autonomous DB", "storage"]:
+            for limit in (1, 12, 500):
+                with self.subTest(query=q, limit=limit):
+                    got = self.module.search_items(self.items, q, limit, "USD")
+                    want = self.bench.linear_search_items(self.module, self.items, q, limit, "USD")
+                    self.assertEqual(got, want)
+
+    def test_index_is_built_once_per_catalog(self):
+        idx = self.module.catalog_index(self.items)
+        self.assertIs(self.module.catalog_index(self.items), idx)
+        other = list(self.items)
+        self.assertIsNot(self.module.catalog_index(other), idx)
+
+    def test_labelled_queries_reference_fixture_items(self):
+        parts = {it["partNumber"] for it in self.bench.load_catalog()}
+        for q, relevant in self.bench.LABELLED_QUERIES.items():
+            with self.subTest(query=q):
+                self.assertTrue(relevant)
+                self.assertLessEqual(relevant, parts)
+
+    def test_quality_benchmark_floor(self):
+        report = self.bench.bench_quality(k=5, iterations=1)
+        self.assertEqual(len(report["queries"]), len(self.bench.LABELLED_QUERIES))
+        # Regression floor on the synthetic fixture for normalization/alias/index changes
+        # (see bench_oci_pricing_search.py --quality); not a measured quality target
+        self.assertGreaterEqual(report["mean_precision@5"], 0.85)
+        self.assertGreaterEqual(report["mean_recall@5"], 0.85)
+
+
+class TestSharedHttpClient(unittest.TestCase):
+    """
+    Offline tests for the shared keep-alive client against a local HTTP/1.1 server:
+    repeated tool calls reuse one connection, and the server lifespan closes the client.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_server("oci_pricing_mcp_server_client")
+        cls.module.ALT_CCY = None
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                item = {
+                    "partNumber": "B93113",
+                    "displayName": "Compute - Standard - E4 - OCPU",
+                    "prices": [{"currencyCode": "USD", "prices": [{"model": "PAY_AS_YOU_GO", "value": 0.025}]}],
+                }
+                body = json.dumps({"items": [item]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        cls.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=cls.httpd.serve_forever, daemon=True).start()
+        cls.module.API = f"http://127.0.0.1:{cls.httpd.server_address[1]}/products/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+        cls.httpd.server_close()
+
+    def setUp(self):
+        for k in self.module.HTTP_STATS:
+            self.module.HTTP_STATS[k] = 0
+
+    def test_repeated_calls_reuse_one_connection(self):
+        async def run():
+            try:
+                for _ in range(5):
+                    out = await self.module.pricing_get_sku_impl("B93113", "USD")
+                    self.assertEqual(out["kind"], "sku")
+            finally:
+                await self.module.close_client()
+
+        asyncio.run(run())
+        stats = self.module.http_stats()
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["connections"], 1)
+        self.assertEqual(stats["reused"], 4)
+
+    def test_lifespan_opens_and_closes_client(self):
+        from fastmcp import Client
+
+        async def run():
+            async with Client(self.module.mcp) as client:
+                self.assertIsNotNone(self.module._CLIENT)
+                await client.call_tool("pricing_get_sku", {"part_number": "B93113", "currency": "USD"})
+                await client.call_tool("pricing_get_sku", {"part_number": "B93113", "currency": "USD"})
+            self.assertIsNone(self.module._CLIENT)
+
+        asyncio.run(run())
+        self.assertEqual(self.module.http_stats()["connections"], 1)
+
+
+class TestBatchSkus(unittest.TestCase):
+    """
+    Offline tests for pricing_get_skus_impl: de-duplication, cached-catalog hits,
+    missing SKUs and per-SKU errors, all in one table-shaped response.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_server("oci_pricing_mcp_server_batch")
+        cls.module.ALT_CCY = None
+
+    def setUp(self):
+        self.requested = []
+        self._orig_fetch = self.module.fetch
+        self.module.fetch = self._fake_fetch
+        self.module.CACHE_TTL = 3600.0
+        self.module.CACHE_DIR = ""
+        self.module.SNAPSHOT_PATH = None
+        self.module._SNAPSHOT_LOADED = True
+        self.module._CATALOG.clear()
+
+    def tearDown(self):
+        self.module.fetch = self._orig_fetch
+
+    @staticmethod
+    def _item(pn, value):
+        return {
+            "partNumber": pn,
+            "displayName": f"Item {pn}",
+            "prices": [{"currencyCode": "USD", "prices": [{"model": "PAY_AS_YOU_GO", "value": value}]}],
+        }
+
+    async def _fake_fetch(self, client, url, params=None):
+        pn = params["partNumber"]
+        self.requested.append(pn)
+        if pn == "B00500":
+            raise self.module.httpx.ConnectError("boom")
+        if pn == "B00404":
+            return {"items": []}
+        return {"items": [self._item(pn, 2.0)]}
+
+    def _run(self, part_numbers, currency="USD"):
+        return asyncio.run(self.module.pricing_get_skus_impl(part_numbers, currency))
+
+    def test_dedupes_and_keeps_input_order(self):
+        out = self._run(["b00002", "B00001", " B00002 ", "", "B00003"])
+        self.assertEqual(out["kind"], "skus")
+        col = out["columns"].index("partNumber")
+        self.assertEqual([r[col] for r in out["rows"]], ["B00002", "B00001", "B00003"])
+        self.assertEqual(sorted(self.requested), ["B00001", "B00002", "B00003"])
+        self.assertEqual(out["duplicatesRemoved"], 1)
+
+    def test_cached_catalog_answers_without_requests(self):
+        self.module._CATALOG["USD"] = {
+            "currency": "USD",
+            "fetchedAt": time.time(),
+            "pages": 1,
+            "complete": True,
+            "items": [self._item("B00001", 1.0)],
+        }
+        out = self._run(["B00001", "B00002"])
+        rows = {r[0]: dict(zip(out["columns"], r)) for r in out["rows"]}
+        self.assertEqual(rows["B00001"]["source"], "catalog")
+        self.assertEqual(rows["B00001"]["value"], 1.0)
+        self.assertEqual(rows["B00002"]["source"], "api")
+        self.assertEqual(self.requested, ["B00002"])
+
+    def test_missing_and_errors_are_reported_per_sku(self):
+        out = self._run(["B00001", "B00404", "B00500"])
+        self.assertEqual(out["returned"], 1)
+        self.assertEqual(out["missing"], ["B00404"])
+        self.assertEqual([e["partNumber"] for e in out["errors"]], ["B00500"])
+
+    def test_input_errors(self):
+        self.assertEqual(self._run([])["note"], "empty-part-numbers")
+        self.assertEqual(self._run(["B1"], "USDT")["note"], "invalid-currency-format")
+        many = [f"B{i:05d}" for i in range(self.module.SKU_BATCH_MAX + 1)]
+        self.assertEqual(self._run(many)["note"], "too-many-part-numbers")
+
+
+class TestEstimate(unittest.TestCase):
+    """
+    Offline tests for pricing_estimate_impl: hourly vs monthly metrics, tiered/free
+    price points, unpriced lines and deterministic totals.
+    """
+
+    CATALOG = {
+        "B00001": {
+            "partNumber": "B00001",
+            "displayName": "Compute - Standard - E4 - OCPU",
+            "metricName": "OCPU Per Hour",
+            "prices": [{"currencyCode": "USD", "prices": [{"model": "PAY_AS_YOU_GO", "value": 0.025}]}],
+        },
+        "B00002": {
+            "partNumber": "B00002",
+            "displayName": "Outbound Data Transfer",
+            "metricName": "Gigabyte Outbound Data Transfer Per Month",
+            "prices": [
+                {
+                    "currencyCode": "USD",
+                    "prices": [
+                        {"model": "PAY_AS_YOU_GO", "value": 0, "rangeMin": 0, "rangeMax": 10240},
+                        {"model": "PAY_AS_YOU_GO", "value": 0.0085, "rangeMin": 10240, "rangeMax": None},
+                    ],
+                }
+            ],
+        },
+        "B00003": {
+            "partNumber": "B00003",
+            "displayName": "Free Thing",
+            "metricName": "Each",
+            "prices": [{"currencyCode": "USD", "prices": [{"model": "PAY_AS_YOU_GO", "value": 0}]}],
+        },
+        "B00004": {
+            "partNumber": "B00004",
+            "displayName": "Euro Only",
+            "metricName": "Each",
+            "prices": [{"currencyCode": "EUR", "prices": [{"model": "PAY_AS_YOU_GO", "value": 3}]}],
+        },
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_server("oci_pricing_mcp_server_estimate")
+        cls.module.ALT_CCY = None
+        cls.module.CACHE_TTL = 0
+
+    def setUp(self):
+        self._orig_fetch = self.module.fetch
+        self.module.fetch = self._fake_fetch
+
+    def tearDown(self):
+        self.module.fetch = self._orig_fetch
+
+    async def _fake_fetch(self, client, url, params=None):
+        item = self.CATALOG.get(params["partNumber"])
+        return {"items": [item] if item else []}
+
+    def _run(self, bom, currency="USD"):
+        return asyncio.run(self.module.pricing_estimate_impl(bom, currency))
+
+    def test_hourly_and_tiered_lines(self):
+        out = self._run(
+            [
+                {"partNumber": "B00001", "quantity": 4, "hours_per_month": 744},
+                {"partNumber": "b00002", "quantity": 12240},
+                {"partNumber": "B00003", "quantity": 5},
+            ]
+        )
+        self.assertEqual(out["kind"], "estimate")
+        costs = [ln["monthlyCost"] for ln in out["lines"]]
+        # 4 OCPU x 0.025 x 744 h; (12240 - 10240) GB x 0.0085; free
+        self.assertEqual(costs, [74.4, 17.0, 0.0])
+        self.assertEqual(out["monthlyTotal"], 91.4)
+        self.assertEqual([ln["billing"] for ln in out["lines"]], ["hourly", "monthly", "monthly"])
+        self.assertTrue(out["lines"][1]["tiered"])
+        self.assertTrue(out["complete"])
+
+    def test_partial_hours_and_deterministic_totals(self):
+        bom = [{"partNumber": "B00001", "quantity": 3, "hours_per_month": 100.5}] * 3
+        first, second = self._run(bom), self._run(bom)
+        self.assertEqual(first, second)
+        self.assertEqual(first["monthlyTotal"], 22.6125)
+
+    def test_unpriced_lines_are_excluded_from_total(self):
+        out = self._run([{"partNumber": "B00001"}, {"partNumber": "B09999"}, {"partNumber": "B00004"}])
+        self.assertEqual(out["monthlyTotal"], 18.6)
+        self.assertFalse(out["complete"])
+        self.assertEqual(
+            [(u["partNumber"], u["reason"]) for u in out["unpriced"]],
+            [("B09999", "not-found"), ("B00004", "priced-in-EUR-only")],
+        )
+
+    def test_invalid_bom(self):
+        self.assertEqual(self._run([])["note"], "empty-bom")
+        bad = self._run([{"partNumber": "B00001", "quantity": -1}])
+        self.assertEqual((bad["note"], bad["line"]), ("invalid-bom-line", 0))
+        bad = self._run([{"partNumber": "B00001"}, {"partNumber": "B00001", "hours_per_month": 800}])
+        self.assertEqual((bad["note"], bad["line"]), ("invalid-bom-line", 1))
+
+
+class TestCurrencyMatrix(unittest.TestCase):
+    """
+    Offline tests for pricing_get_sku_impl(currencies=[...]): several currencies are read from
+    one request without currencyCode; only currencies it lacks are fetched per currency.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_server("oci_pricing_mcp_server_matrix")
+        cls.module.ALT_CCY = None
+
+    def setUp(self):
+        self.requested = []
+        self._orig_fetch = self.module.fetch
+        self.module.fetch = self._fake_fetch
+
+    def tearDown(self):
+        self.module.fetch = self._orig_fetch
+
+    async def _fake_fetch(self, client, url, params=None):
+        ccy = params.get("currencyCode")
+        self.requested.append(ccy)
+        blocks = {
+            "USD": {"currencyCode": "USD", "prices": [{"model": "PAY_AS_YOU_GO", "value": 1.0}]},
+            "EUR": {"currencyCode": "EUR", "prices": [{"model": "PAY_AS_YOU_GO", "value": 0.9}]},
+            "JPY": {"currencyCode": "JPY", "prices": [{"model": "PAY_AS_YOU_GO", "value": 150}]},
+        }
+        # Like cetools: currencyCode localizes that currency only; without it, every priced currency
+        local = list(blocks.values()) if ccy is None else [blocks[ccy]] if ccy in blocks else []
+        return {"items": [{"partNumber": params["partNumber"], "currencyCodeLocalizations": local}]}
+
+    def _run(self, **kw):
+        return asyncio.run(self.module.pricing_get_sku_impl("B00001", **kw))
+
+    def test_localized_currencies_need_one_request(self):
+        out = self._run(currencies=["usd", "EUR", "JPY", "USD"])
+        self.assertEqual(out["kind"], "sku")
+        self.assertEqual(out["currencyCode"], "USD")
+        self.assertEqual(list(out["prices"]), ["USD", "EUR", "JPY"])
+        self.assertEqual(out["prices"]["EUR"]["value"], 0.9)
+        self.assertEqual(out["prices"]["JPY"]["value"], 150)
+        self.assertEqual(self.requested, [None])
+
+    def test_missing_currencies_are_fetched(self):
+        out = self._run(currency="EUR", currencies=["USD", "JPY", "CHF"])
+        self.assertEqual(out["currencyCode"], "EUR")
+        self.assertEqual(out["value"], 0.9)
+        self.assertEqual(out["prices"]["JPY"]["value"], 150)
+        self.assertIsNone(out["prices"]["CHF"]["value"])
+        self.assertEqual(self.requested, [None, "CHF"])
+
+    def test_single_currency_sends_currency_code(self):
+        out = self._run(currencies=["JPY"])
+        self.assertEqual(out["prices"], {"JPY": {"model": "PAY_AS_YOU_GO", "value": 150}})
+        self.assertEqual(self.requested, ["JPY"])
+
+    def test_invalid_currency_list(self):
+        self.assertEqual(self._run(currencies=["USD", "USDT"])["note"], "invalid-currency-format")
+        self.assertEqual(self._run(currencies=[])["note"], "empty-currencies")
+
+
+class TestPagePrefetch(unittest.TestCase):
+    """
+    Offline tests for iter_pages with httpx.MockTransport: an ORDS-style offset/limit
+    listing is prefetched concurrently; a listing paged by other means falls back to
+    link-following. Both must yield the same items in order.
+    """
+
+    DELAY = 0.2
+    TOTAL = 23
+    LIMIT = 5
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_server("oci_pricing_mcp_server_pages")
+        cls.module.API = "https://cetools.test/products/"
+
+    def setUp(self):
+        self.requests = 0
+
+    async def _offset_handler(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.DELAY)
+        offset = int(request.url.params.get("offset", 0))
+        items = [{"partNumber": f"B{i:05d}"} for i in range(offset, min(offset + self.LIMIT, self.TOTAL))]
+        body = {"items": items, "offset": offset, "limit": self.LIMIT, "links": []}
+        if offset + self.LIMIT < self.TOTAL:
+            body["links"].append({"rel": "next", "href": f"{self.module.API}?currencyCode=USD&offset={offset + self.LIMIT}"})
+        return self.module.httpx.Response(200, json=body)
+
+    async def _page_handler(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.DELAY)
+        page = int(request.url.params.get("page", 0))
+        start = page * self.LIMIT
+        items = [{"partNumber": f"B{i:05d}"} for i in range(start, min(start + self.LIMIT, self.TOTAL))]
+        body = {"items": items, "links": []}
+        if start + self.LIMIT < self.TOTAL:
+            body["links"].append({"rel": "next", "href": f"{self.module.API}?currencyCode=USD&page={page + 1}"})
+        return self.module.httpx.Response(200, json=body)
+
+    def _pages(self, handler, max_pages):
+        async def run():
+            transport = self.module.httpx.MockTransport(handler)
+            async with self.module.httpx.AsyncClient(transport=transport) as client:
+                return [p async for p in self.module.iter_pages(client, "USD", max_pages)]
+
+        start = time.perf_counter()
+        pages = asyncio.run(run())
+        return pages, time.perf_counter() - start
+
+    def _part_numbers(self, pages):
+        return [it["partNumber"] for p in pages for it in p["items"]]
+
+    def test_offset_listing_is_prefetched_concurrently(self):
+        pages, elapsed = self._pages(self._offset_handler, 10)
+        self.assertEqual(self._part_numbers(pages), [f"B{i:05d}" for i in range(self.TOTAL)])
+        self.assertEqual([p["more"] for p in pages], [True, True, True, True, False])
+        # first page, then one concurrent round trip (instead of 5 serial ones)
+        self.assertLess(elapsed, 3.5 * self.DELAY)
+
+    def test_max_pages_is_respected(self):
+        pages, _ = self._pages(self._offset_handler, 2)
+        self.assertEqual(len(pages), 2)
+        self.assertTrue(pages[-1]["more"])
+        self.assertEqual(self.requests, 2)
+
+    def test_falls_back_to_link_following(self):
+        pages, _ = self._pages(self._page_handler, 10)
+        self.assertEqual(self._part_numbers(pages), [f"B{i:05d}" for i in range(self.TOTAL)])
+        self.assertEqual(self.requests, 5)
+
+
 if __name__ == "__main__":
     print("Starting oci-pricing-mcp-server functional tests")
     print(
@@ -0,0 +1,115 @@
+#
+# Since: October 2026
+# Name: load-test.py
+# Description: Load test for the Oracle Database Documentation MCP Server in HTTP mode
+#
+# Copyright 2025 Oracle Corporation and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import time
+
+from fastmcp import Client
+
+TOOL_NAME = "search_oracle_database_documentation"
+
+QUERIES = [
+    "create table syntax",
+    "alter system parameter",
+    "database user concept",
+    "external table definition",
+    "json relational duality view",
+    "partitioning best practices",
+    "vector search index",
+    "pl/sql exception handling",
+]
+
+
+async def run_client(client: Client, queries, deadline: float, max_results: int) -> int:
+    """Issues queries over an open MCP session until the deadline and returns the count."""
+    count = 0
+    while time.perf_counter() < deadline:
+        await client.call_tool(
+            TOOL_NAME,
+            {"search_query": next(queries), "max_results": max_results},
+        )
+        count += 1
+    return count
+
+
+async def run_level(url: str, clients: int, duration: float, max_results: int) -> float:
+    """Runs the given number of concurrent clients and returns the queries/sec."""
+    queries = itertools.cycle(QUERIES)
+    async with contextlib.AsyncExitStack() as stack:
+        # Open all sessions up front so session setup is not part of the measurement
+        sessions = [
+            await stack.enter_async_context(Client(url)) for _ in range(clients)
+        ]
+        start = time.perf_counter()
+        counts = await asyncio.gather(
+            *[
+                run_client(session, queries, start + duration, max_results)
+                for session in sessions
+            ]
+        )
+        elapsed = time.perf_counter() - start
+    return sum(counts) / elapsed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Load test for the Oracle Database Documentation MCP Server (http mode)."
+    )
+    parser.add_argument(
+        "-url",
+        type=str,
+        default="http://127.0.0.1:8000/mcp",
+        help="the URL of the running MCP server (default http://127.0.0.1:8000/mcp)",
+    )
+    parser.add_argument(
+        "-clients",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32],
+        help="the concurrency levels to test (default 1 8 32)",
+    )
+    parser.add_argument(
+        "-duration",
+        type=float,
+        default=10.0,
+        help="the number of seconds (default 10) to run each concurrency level for",
+    )
+    parser.add_argument(
+        "-max-results",
+        type=int,
+        default=4,
+        help="the max_results (default 4) passed with each search",
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Main entrypoint for the load test."""
+    args = parse_args()
+    print(f"{'clients':>8} {'queries/sec':>12}")
+    for clients in args.clients:
+        qps = asyncio.run(run_level(args.url, clients, args.duration, args.max_results))
+        print(f"{clients:>8} {qps:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
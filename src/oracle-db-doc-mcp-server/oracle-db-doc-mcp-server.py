@@ -19,35 +19,146 @@
 # limitations under the License.
 
 import argparse
+import asyncio
+import contextlib
 import hashlib
+import json
 import logging
+import queue
 import re
+import sqlite3
+import statistics
 import tempfile
+import time
 import zipfile
+from collections import defaultdict
 from pathlib import Path, PurePath
 
 import markdownify as md
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag
 from fastmcp import FastMCP
-from pocketsearch import PocketSearch, PocketWriter
+from pocketsearch import DefaultSchema, PocketSearch, PocketWriter, Schema, Text
 from pydantic import Field
 from typing import Annotated
 
+# Optional faster HTML parser for the ADVANCED preprocessor
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # Working home directory
 HOME_DIR = Path.home().joinpath(PurePath(".oracle/oracle-db-doc-mcp-server"))
 
 # Index
 INDEX = None
+INDEX_POOL_SIZE = 8
+INDEX_MMAP_SIZE = 256 * 1024 * 1024
 INDEX_FILE = HOME_DIR.joinpath(PurePath("index.db"))
-INDEX_VERSION = "1.0.0"
+INDEX_VERSION = "1.1.0"
 INDEX_VERSION_FILE = HOME_DIR.joinpath(PurePath("index.version"))
 CONTENT_CHECKSUM_FILE = HOME_DIR.joinpath(PurePath("content.checksum"))
+PREPROCESS_FILE = HOME_DIR.joinpath(PurePath("index.preprocess"))
 
 # Resources folder
 RESOURCES_DIR = HOME_DIR.joinpath(PurePath("resources"))
 
 PREPROCESS = "BASIC"
 
+# Accumulated time in seconds spent per indexing stage
+STAGE_TIMINGS = defaultdict(float)
+
+# Query set used by the 'bench' subcommand
+BENCH_QUERIES = [
+    "create table syntax",
+    "alter system set parameter",
+    "database user concept",
+    "external table definition",
+    "json relational duality view",
+    "partitioning best practices",
+    "vector search index",
+    "pl/sql exception handling",
+    "data use case domains",
+    "automatic storage management disk group",
+    "flashback query",
+    "materialized view refresh",
+    "optimizer hints",
+    "grant privileges to role",
+    "redo log file size",
+    "sql plan management baselines",
+]
+
+# Number of content chunks seen and unique chunks stored by the last indexing run
+INDEX_STATS = {"chunks": 0, "unique": 0}
+
+# Elements removed by the ADVANCED preprocessor
+REMOVE_TAGS = frozenset(["script", "style", "nav", "header", "footer"])
+
+# Substrings of class/id attributes of navigation-related elements
+NAV_CLASSES = [
+    "noscript",
+    "alert",
+    "pull-left",
+    "pull-right",
+    "skip",
+    "navigation",
+    "breadcrumb",
+    "nav-",
+    "header-",
+    "footer-",
+    "menu",
+    "sidebar",
+    "toc",
+]
+NAV_CLASS_RE = re.compile("|".join(re.escape(c) for c in NAV_CLASSES))
+
+# Common Oracle doc boilerplate text patterns
+BOILERPLATE_RE = re.compile(
+    "|".join(
+        f"(?:{p})"
+        for p in [
+            r"JavaScript.*(?:disabled|enabled).*browser",
+            r"JavaScript must be enabled to correctly display this content",
+            r"Skip navigation.*",
+            r"Oracle®.*(?:Database.*)?(?:Reference|Guide|Manual|Documentation)",
+            r"Release \d+[a-z]*[\s-]*[A-Z0-9-]*",
+            r"Previous.*Next",
+            r"All Classes.*",
+            r"Overview.*Package.*Class.*Use.*Tree.*Deprecated.*Index.*Help",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Common Oracle navigation text content (case-sensitive)
+NAV_TEXT_RE = re.compile(
+    "|".join(
+        re.escape(p)
+        for p in [
+            "Skip navigation links",
+            "JavaScript is disabled on your browser",
+            "All Classes",
+            "SEARCH:",
+        ]
+    )
+)
+
+# Markdown cleanup patterns
+MD_LINK_RE = re.compile(r"\[([^\]]*)\]\([^\)]*\)")
+GUID_URL_RE = re.compile(
+    r"https?://[^\s]*[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}[^\s]*"
+)
+HEX_URL_RE = re.compile(r"https?://[^\s]*[a-f0-9]{16,}[^\s]*")
+URL_RE = re.compile(r"https?://[^\s]+")
+SPACES_RE = re.compile(r"[ \t]+")
+BLANK_LINES_RE = re.compile(r"\n *\n")
+SECTION_RE = re.compile(
+    r"(^#{1,6}\s+[^\n]*\n?)(.*?)(?=(?:^#{1,6}\s+|\Z))", re.MULTILINE | re.DOTALL
+)
+HEADING_RE = re.compile(r"^#{1,6}\s+")
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,8 +197,75 @@ mcp = FastMCP(
 )
 
 
+class DocumentSchema(Schema):
+    """Index schema storing each unique content chunk once.
+
+    The checksum identifies the chunk content across books; the locations it
+    was found at are kept in the 'chunk_sources' table.
+    """
+
+    text = Text(index=True)
+    checksum = Text()
+
+
+class IndexPool:
+    """A pool of read-only index connections.
+
+    Each connection is opened against the index file in immutable mode with
+    memory-mapped I/O, so concurrent searches can run in parallel threads
+    without serializing on a single SQLite connection.
+    """
+
+    def __init__(self, db_name: Path, size: int = INDEX_POOL_SIZE):
+        self.size = max(1, size)
+        self._pool: queue.Queue[PocketSearch] = queue.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            connection = self._open(db_name)
+            self._pool.put(
+                PocketSearch(
+                    db_name=db_name,
+                    schema=self._schema(connection),
+                    connection=connection,
+                )
+            )
+
+    @staticmethod
+    def _open(db_name: Path) -> sqlite3.Connection:
+        """Opens a read-only, immutable connection to the index file."""
+        connection = sqlite3.connect(
+            f"{db_name.resolve().as_uri()}?mode=ro&immutable=1",
+            uri=True,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute(f"PRAGMA mmap_size={INDEX_MMAP_SIZE}")
+        connection.execute("PRAGMA query_only=1")
+        return connection
+
+    @staticmethod
+    def _schema(connection: sqlite3.Connection) -> type[Schema]:
+        """Returns the schema of the index, indexes before version 1.1.0 have no checksums."""
+        columns = [row["name"] for row in connection.execute("PRAGMA table_info(documents)")]
+        return DocumentSchema if "checksum" in columns else DefaultSchema
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """Borrows an index from the pool and returns it once the block exits."""
+        index = self._pool.get()
+        try:
+            yield index
+        finally:
+            self._pool.put(index)
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        while not self._pool.empty():
+            self._pool.get_nowait().connection.close()
+
+
 @mcp.tool()
-def search_oracle_database_documentation(
+async def search_oracle_database_documentation(
     search_query: Annotated[
         str, Field(description="The search phrase to search for in the documentation.")
     ],
@@ -118,7 +296,8 @@ def search_oracle_database_documentation(
 
     """
     logger.info(f"query={search_query!r}")
-    return search_index(search_query, max_results)
+    # Run the search in a worker thread so concurrent requests use separate pooled connections
+    return await asyncio.to_thread(search_index, search_query, max_results)
 
 
 # Function to search the index
@@ -128,13 +307,14 @@ def search_index(query_str: str, limit: int = 4) -> list[str]:
     Returns a list of content.
     """
     results = []
-    hits = INDEX.search(text=query_str)
-    finds = 0
-    for hit in hits:
-        results.append(hit.text)
-        finds += 1
-        if finds >= limit:
-            break
+    with INDEX.acquire() as index:
+        hits = index.search(text=query_str)
+        finds = 0
+        for hit in hits:
+            results.append(hit.text)
+            finds += 1
+            if finds >= limit:
+                break
     return results
 
 
@@ -163,6 +343,9 @@ def maintain_content(path: str) -> None:
     # Get the old index version, if it exists
     index_version = get_file_content(INDEX_VERSION_FILE)
 
+    # Get the preprocessing level the old index was built with, if it exists
+    index_preprocess = get_file_content(PREPROCESS_FILE)
+
     # Only directories and zip files are currently supported
     if location.is_file() and not location.suffix == ".zip":
         logger.error(
@@ -176,7 +359,11 @@ def maintain_content(path: str) -> None:
     logger.debug(f"Checksum is {input_checksum} for location '{location}'")
 
     # See whether checksum matches the old index checksum and the index has not changed
-    if input_checksum == content_checksum and index_version == INDEX_VERSION:
+    if (
+        input_checksum == content_checksum
+        and index_version == INDEX_VERSION
+        and index_preprocess == PREPROCESS
+    ):
         logger.info("Index is up to date, no changes needed.")
         return
     # Data has changed, re-index
@@ -193,6 +380,12 @@ def maintain_content(path: str) -> None:
                 f"Old index version: {index_version}, New index version: {INDEX_VERSION}"
             )
 
+        if index_preprocess != PREPROCESS:
+            logger.info("Preprocessing level has changed.")
+            logger.debug(
+                f"Old preprocessing level: {index_preprocess}, New preprocessing level: {PREPROCESS}"
+            )
+
         INDEX_FILE.unlink(missing_ok=True)
         logger.info("Recreating index...")
         if location.is_dir():
@@ -222,6 +415,83 @@ def maintain_content(path: str) -> None:
             )
             write_file_content(INDEX_VERSION_FILE, INDEX_VERSION)
 
+        # Write the preprocessing level the index was built with
+        write_file_content(PREPROCESS_FILE, PREPROCESS)
+
+
+def bench_index(index_file: Path, iterations: int, max_results: int) -> dict:
+    """Benchmarks an index and returns its statistics and search latencies.
+
+    Args:
+        index_file (Path): The path to the index file.
+        iterations (int): How many times each query of the query set is run.
+        max_results (int): The maximum number of results per search.
+
+    Returns:
+        dict: The index statistics and latencies in milliseconds.
+    """
+    global INDEX
+
+    # Cold start: open the index and run the first query
+    start = time.perf_counter()
+    INDEX = IndexPool(index_file, 1)
+    search_index(BENCH_QUERIES[0], max_results)
+    cold_start = time.perf_counter() - start
+
+    with INDEX.acquire() as index:
+        chunk_sizes = [
+            row[0]
+            for row in index.execute_sql("SELECT length(text) FROM documents")
+        ]
+        try:
+            sources = index.execute_sql(
+                "SELECT count(*) FROM chunk_sources"
+            ).fetchone()[0]
+        except sqlite3.OperationalError:
+            # Indexes before version 1.1.0 store every chunk copy
+            sources = len(chunk_sizes)
+
+    latencies = []
+    for _ in range(iterations):
+        for query in BENCH_QUERIES:
+            start = time.perf_counter()
+            search_index(query, max_results)
+            latencies.append((time.perf_counter() - start) * 1000)
+    INDEX.close()
+
+    return {
+        "index": {
+            "file": str(index_file),
+            "version": get_file_content(index_file.with_name(INDEX_VERSION_FILE.name)),
+            "preprocess": get_file_content(index_file.with_name(PREPROCESS_FILE.name)),
+            "size_bytes": index_file.stat().st_size,
+            "chunks": len(chunk_sizes),
+            "chunk_sources": sources,
+            "chunk_size_chars": distribution(chunk_sizes),
+        },
+        "search": {
+            "queries": len(BENCH_QUERIES),
+            "iterations": iterations,
+            "max_results": max_results,
+            "cold_start_ms": round(cold_start * 1000, 3),
+            "latency_ms": distribution(latencies),
+        },
+    }
+
+
+def distribution(values: list[float]) -> dict:
+    """Summarizes a list of values with min, mean, percentiles and max."""
+    if not values:
+        return {}
+    percentiles = statistics.quantiles(values, n=100) if len(values) > 1 else values * 99
+    return {
+        "min": round(min(values), 3),
+        "mean": round(statistics.fmean(values), 3),
+        "p50": round(percentiles[49], 3),
+        "p95": round(percentiles[94], 3),
+        "max": round(max(values), 3),
+    }
+
 
 def update_content(location: Path) -> None:
     """Updates the stored content with the source provided.
@@ -233,45 +503,110 @@ def update_content(location: Path) -> None:
     """
     logger.debug("Updating content")
 
+    STAGE_TIMINGS.clear()
+    INDEX_STATS.update(chunks=0, unique=0)
     files_processed = 0
     for file in location.rglob("*"):
-        process_file(file)
+        process_file(file, location)
         files_processed += 1
     logger.info(f"Processed {files_processed} files from '{location}'.")
+    logger.info(
+        f"Indexed {INDEX_STATS['unique']} unique of {INDEX_STATS['chunks']} content chunks."
+    )
 
     logger.debug("Optimizing index...")
-    optimize_index()
+    with timed("optimize"):
+        optimize_index()
     logger.debug("Index optimized")
 
+    log_stage_timings()
+
+
+@contextlib.contextmanager
+def timed(stage: str):
+    """Adds the time spent in the block to the given indexing stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_TIMINGS[stage] += time.perf_counter() - start
+
+
+def log_stage_timings() -> None:
+    """Logs the time spent per indexing stage."""
+    total = sum(STAGE_TIMINGS.values())
+    logger.debug(f"Indexing stage timings (total {total:.2f}s):")
+    for stage, seconds in sorted(
+        STAGE_TIMINGS.items(), key=lambda item: item[1], reverse=True
+    ):
+        share = seconds / total * 100 if total else 0.0
+        logger.debug(f"  {stage:<20} {seconds:10.2f}s {share:6.1f}%")
 
-def process_file(file: Path) -> None:
-    """Process the file."""
+
+def process_file(file: Path, location: Path) -> None:
+    """Process the file.
+
+    Args:
+        file (Path): The path to the file.
+        location (Path): The documentation root the file is located in.
+    """
     # Only index html file
     if file.suffix == ".html" or file.suffix == ".htm":
         name = file.stem.lower()
         # Ignore ReadMes, table of contents, indexes
         if name not in ("readme", "toc", "index"):
             content_chunks = convert_to_markdown_chunks(file)
-            update_index(content_chunks)
+            with timed("index"):
+                update_index(content_chunks, file.relative_to(location).as_posix())
 
 
 def optimize_index() -> None:
     """Optimizes index."""
-    ps = PocketSearch(db_name=INDEX_FILE, writeable=True)
+    ps = PocketSearch(db_name=INDEX_FILE, schema=DocumentSchema, writeable=True)
     ps.optimize()
 
 
-def update_index(content: list[str]) -> None:
+def update_index(content: list[str], source: str) -> None:
     """Update the index with content.
 
+    Content chunks that are already in the index, e.g. boilerplate sections
+    repeated across books, are not inserted again; only the source is recorded.
+
     Args:
         content list[str]: The list of HTML content to index.
+        source (str): The location the content was found at.
     Returns:
         None
     """
-    with PocketWriter(db_name=INDEX_FILE) as writer:
+    with PocketWriter(db_name=INDEX_FILE, schema=DocumentSchema) as writer:
+        writer.execute_sql(
+            "CREATE UNIQUE INDEX IF NOT EXISTS documents_checksum ON documents(checksum)"
+        )
+        writer.execute_sql(
+            "CREATE TABLE IF NOT EXISTS chunk_sources "
+            "(checksum TEXT NOT NULL, source TEXT NOT NULL, UNIQUE(checksum, source))"
+        )
         for segment in content:
-            writer.insert(text=segment)
+            checksum = chunk_checksum(segment)
+            INDEX_STATS["chunks"] += 1
+            if (
+                writer.execute_sql(
+                    "SELECT 1 FROM documents WHERE checksum = ?", checksum
+                ).fetchone()
+                is None
+            ):
+                writer.insert(text=segment, checksum=checksum)
+                INDEX_STATS["unique"] += 1
+            writer.execute_sql(
+                "INSERT OR IGNORE INTO chunk_sources (checksum, source) VALUES (?, ?)",
+                checksum,
+                source,
+            )
+
+
+def chunk_checksum(segment: str) -> str:
+    """Calculate the SHA256 checksum of a content chunk, ignoring whitespace differences."""
+    return hashlib.sha256(" ".join(segment.split()).encode()).hexdigest()
 
 
 def shasum_directory(directory: Path) -> str:
@@ -298,62 +633,55 @@ def convert_to_markdown_chunks(file: Path) -> list[str]:
     """
     logger.debug(f"Converting {file} to Markdown format.")
 
-    with file.open("r", encoding="utf-8") as f:
+    with timed("read"), file.open("r", encoding="utf-8") as f:
         html = f.read()
 
-        if PREPROCESS == "ADVANCED":
-            # Preprocess HTML to remove boilerplate and navigation
-            html = preprocess_html(html)
+    if PREPROCESS == "ADVANCED":
+        # Preprocess HTML to remove boilerplate and navigation
+        html = preprocess_html(html)
 
-        # Convert HTML to Markdown
+    # Convert HTML to Markdown
+    with timed("markdown"):
         markdown = md.markdownify(html)
-        if PREPROCESS != "NONE":
-            # Remove URLs from markdown
+    if PREPROCESS != "NONE":
+        # Remove URLs from markdown
+        with timed("remove urls"):
             markdown = remove_markdown_urls(markdown)
 
-        # Split markdown into sections based on headings
-        pattern = r"(^#{1,6}\s+[^\n]*\n?)(.*?)(?=(?:^#{1,6}\s+|\Z))"
-
-        # Find all matches with re.MULTILINE and re.DOTALL flags
-        matches = re.finditer(pattern, markdown, re.MULTILINE | re.DOTALL)
-
-        # Create sections list
+    # Split markdown into sections based on headings
+    with timed("split"):
         sections = []
-        for match in matches:
+        for match in SECTION_RE.finditer(markdown):
             # Get heading without the leading "### "
-            heading = re.sub("^#{1,6}\\s+", "", match.group(1).strip())
+            heading = HEADING_RE.sub("", match.group(1).strip())
             # Get content without URLs within them
             content = match.group(2).strip()
             sections.append(heading + "\n\n" + content)
 
-        if len(sections) == 0:
-            return [markdown]
-        else:
-            return sections
+    if len(sections) == 0:
+        return [markdown]
+    else:
+        return sections
 
 
 def remove_markdown_urls(text):
     # Remove Markdown links [text](url) and replace with just the text
-    text = re.sub(r"\[([^\]]*)\]\([^\)]*\)", r"\1", text)
+    text = MD_LINK_RE.sub(r"\1", text)
 
     # Remove URLs with GUIDs (32-char hex with hyphens)
-    text = re.sub(
-        r"https?://[^\s]*[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}[^\s]*",
-        "",
-        text,
-    )
+    text = GUID_URL_RE.sub("", text)
 
     # Remove URLs with long hex strings (likely file hashes or identifiers)
-    text = re.sub(r"https?://[^\s]*[a-f0-9]{16,}[^\s]*", "", text)
+    text = HEX_URL_RE.sub("", text)
 
     # Remove standalone URLs that start with http/https
-    text = re.sub(r"https?://[^\s]+", "", text)
+    text = URL_RE.sub("", text)
 
     # Clean up extra spaces/tabs but preserve new lines (\s includes \n)
-    text = re.sub(r"[ \t]+", " ", text)
+    text = SPACES_RE.sub(" ", text)
 
     # Clean up extra spaces within new lines
-    text = re.sub(r"\n *\n", "\n\n", text)
+    text = BLANK_LINES_RE.sub("\n\n", text)
 
     return text.strip()
 
@@ -361,88 +689,62 @@ def remove_markdown_urls(text):
 def preprocess_html(html_content: str) -> str:
     """Preprocess HTML to remove boilerplate and navigation elements.
 
+    All removal rules are applied in a single walk over the document tree.
+
     Args:
         html_content (str): The raw HTML content.
 
     Returns:
         str: Cleaned HTML content ready for markdown conversion.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    # Remove script and style tags
-    for tag in soup.find_all(["script", "style"]):
-        tag.decompose()
-
-    # Remove navigation elements
-    for tag in soup.find_all(["nav", "header", "footer"]):
-        tag.decompose()
-
-    # Remove elements with navigation-related classes/ids
-    nav_classes = [
-        "noscript",
-        "alert",
-        "pull-left",
-        "pull-right",
-        "skip",
-        "navigation",
-        "breadcrumb",
-        "nav-",
-        "header-",
-        "footer-",
-        "menu",
-        "sidebar",
-        "toc",
-    ]
-    for nav_class in nav_classes:
-        for tag in soup.find_all(
-            attrs={
-                "class": lambda x: x
-                and any(
-                    nav_class in str(cls).lower()
-                    for cls in (x if isinstance(x, list) else [x])
-                )
-            }
-        ):
-            tag.decompose()
-        for tag in soup.find_all(
-            attrs={"id": lambda x: x and nav_class in str(x).lower()}
-        ):
-            tag.decompose()
-
-    # Remove common Oracle doc boilerplate text patterns
-    boilerplate_patterns = [
-        r"JavaScript.*(?:disabled|enabled).*browser",
-        r"JavaScript must be enabled to correctly display this content",
-        r"Skip navigation.*",
-        r"Oracle®.*(?:Database.*)?(?:Reference|Guide|Manual|Documentation)",
-        r"Release \d+[a-z]*[\s-]*[A-Z0-9-]*",
-        r"Previous.*Next",
-        r"All Classes.*",
-        r"Overview.*Package.*Class.*Use.*Tree.*Deprecated.*Index.*Help",
-    ]
-
-    for pattern in boilerplate_patterns:
-        for tag in soup.find_all(string=re.compile(pattern, re.IGNORECASE)):
-            parent = tag.parent if hasattr(tag, "parent") else None
-            if parent:
-                parent.decompose()
-
-    # Remove elements likely to be navigation by common Oracle doc structure
-    # Remove elements with common Oracle navigation text content
-    nav_text_patterns = [
-        "Skip navigation links",
-        "JavaScript is disabled on your browser",
-        "All Classes",
-        "SEARCH:",
-    ]
-
-    for pattern in nav_text_patterns:
-        for element in soup.find_all(string=lambda text: text and pattern in text):
-            parent = element.parent if hasattr(element, "parent") else None
-            if parent:
-                parent.decompose()
-
-    return str(soup)
+    with timed("preprocess parse"):
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+
+    with timed("preprocess clean"):
+        for element in find_boilerplate(soup):
+            if not element.decomposed:
+                element.decompose()
+
+    with timed("preprocess serialize"):
+        return str(soup)
+
+
+def find_boilerplate(soup: BeautifulSoup) -> list:
+    """Find all boilerplate and navigation elements of a document in one tree walk.
+
+    Args:
+        soup (BeautifulSoup): The parsed HTML document.
+
+    Returns:
+        list: The elements to remove, in document order.
+    """
+    matches = []
+    stack = list(reversed(soup.contents))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Tag):
+            if node.name in REMOVE_TAGS or is_navigation(node):
+                # The whole subtree goes, no need to look into it
+                matches.append(node)
+                continue
+            stack.extend(reversed(node.contents))
+        elif isinstance(node, NavigableString):
+            if node.parent is not None and (
+                BOILERPLATE_RE.search(node) or NAV_TEXT_RE.search(node)
+            ):
+                matches.append(node.parent)
+    return matches
+
+
+def is_navigation(tag: Tag) -> bool:
+    """Returns whether the tag has a navigation-related class or id."""
+    classes = tag.get("class")
+    if classes:
+        for cls in classes if isinstance(classes, list) else [classes]:
+            if NAV_CLASS_RE.search(str(cls).lower()):
+                return True
+    tag_id = tag.get("id")
+    return bool(tag_id) and NAV_CLASS_RE.search(str(tag_id).lower()) is not None
 
 
 def build_folder_structure() -> None:
@@ -519,6 +821,34 @@ def parse_args() -> argparse.Namespace:
         default=8000,
         help="the port (default 8000) that the MCP server is reachable at",
     )
+    parser_mcp.add_argument(
+        "-pool-size",
+        type=int,
+        default=INDEX_POOL_SIZE,
+        help=f"the number of read-only index connections (default {INDEX_POOL_SIZE}) used to serve concurrent searches",
+    )
+
+    parser_bench = subparser.add_parser(
+        "bench", help="report index statistics and search latency as JSON"
+    )
+    parser_bench.add_argument(
+        "-index",
+        type=str,
+        default=str(INDEX_FILE),
+        help=f"path to the index file to benchmark (default {INDEX_FILE})",
+    )
+    parser_bench.add_argument(
+        "-iterations",
+        type=int,
+        default=10,
+        help="number of times (default 10) each query of the query set is run",
+    )
+    parser_bench.add_argument(
+        "-max-results",
+        type=int,
+        default=4,
+        help="the maximum number of results (default 4) per search",
+    )
 
     args = parser.parse_args()
 
@@ -555,6 +885,17 @@ def main():
         PREPROCESS = args.preprocess.upper()
         maintain_content(args.path)
 
+    if args.command == "bench":
+        index_file = Path(args.index).expanduser()
+        if not index_file.exists():
+            logger.error(f"Index does not exist: {index_file}")
+            return
+        print(
+            json.dumps(
+                bench_index(index_file, args.iterations, args.max_results), indent=2
+            )
+        )
+
     if args.command == "mcp":
 
         # If no index is present (not index was built), refuse to start the server.
@@ -565,8 +906,8 @@ def main():
             return
 
         global INDEX
-        logger.debug("Opening index file.")
-        INDEX = PocketSearch(db_name=INDEX_FILE)
+        logger.debug(f"Opening index file with {args.pool_size} connections.")
+        INDEX = IndexPool(INDEX_FILE, args.pool_size)
 
         logger.info("Serving MCP server for Oracle Database documentation.")
         if args.mode == "stdio":
@@ -0,0 +1,85 @@
+#
+# Name: test_oracle_db_doc_mcp_server.py
+# Description: Offline tests for the Oracle Database Documentation MCP Server
+#
+# Copyright 2025 Oracle Corporation and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+def _load_server():
+    """Load oracle-db-doc-mcp-server.py as a module (the file name is not importable)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "oracle-db-doc-mcp-server.py")
+    spec = importlib.util.spec_from_file_location("oracle_db_doc_mcp_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMaintainContent(unittest.TestCase):
+    """
+    Offline tests for maintain_content: when the index is rebuilt and when it is kept.
+
+    Strategy:
+      - Point the index and its marker files at a temporary home directory.
+      - Replace update_content with a mock so no documentation is parsed.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.module = _load_server()
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        home = Path(tmp.name)
+        self.docs = home / "docs"
+        self.docs.mkdir()
+        (self.docs / "index.html").write_text("<html><body>Docs</body></html>")
+
+        for name, value in (
+            ("INDEX_FILE", home / "index.db"),
+            ("INDEX_VERSION_FILE", home / "index.version"),
+            ("CONTENT_CHECKSUM_FILE", home / "content.checksum"),
+            ("PREPROCESS_FILE", home / "index.preprocess"),
+            ("PREPROCESS", "BASIC"),
+        ):
+            patcher = mock.patch.object(self.module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(self.module, "update_content")
+        self.update_content = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_input_is_not_reindexed(self):
+        self.module.maintain_content(str(self.docs))
+        self.module.maintain_content(str(self.docs))
+        self.assertEqual(self.update_content.call_count, 1)
+
+    def test_changed_preprocess_level_forces_rebuild(self):
+        self.module.maintain_content(str(self.docs))
+        with mock.patch.object(self.module, "PREPROCESS", "ADVANCED"):
+            self.module.maintain_content(str(self.docs))
+        self.assertEqual(self.update_content.call_count, 2)
+        self.assertEqual(self.module.get_file_content(self.module.PREPROCESS_FILE), "ADVANCED")
+
+
+if __name__ == "__main__":
+    unittest.main()